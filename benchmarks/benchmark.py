@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks de escalabilidade do classificador de ferramentas.
+
+Para cada tamanho de catálogo sintético (ver gerar_catalogo.py) mede:
+    carregar_dataset_csv, preparar_dados_treinamento, preparar_dados_compactos,
+    codificar_matriz,
+    uma época de treinamento (motores python e numpy), prever_item (por item)
+    e avaliar_dataset (serial e vetorizado)
+e grava um JSON com os tempos. Com --comparar, compara com um JSON anterior e
+aponta regressões acima da tolerância.
+
+Uso:
+    python benchmarks/benchmark.py --tamanhos 10000 1000000 --saida bench.json
+    python benchmarks/benchmark.py --comparar bench_anterior.json
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+DIRETORIO = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(DIRETORIO, '..', 'src'))
+
+from classificador_ferramentas import PerceptronFerramentas, _TreinadorListas, carregar_dataset_csv
+from gerar_catalogo import gerar_catalogo
+from motor_vetorizado import TreinadorVetorizado, codificar_matriz
+
+
+EPOCAS_MEDIDAS = 3
+AMOSTRA_PREVER_ITEM = 10000
+
+
+def _cronometrar(funcao, *args, repeticoes: int = 1, **kwargs):
+    """
+    Executa a função sem saída no terminal.
+
+    Returns:
+        Tuple: Resultado da última execução e o menor tempo entre as repetições (s)
+    """
+    melhor = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeticoes):
+            inicio = time.perf_counter()
+            resultado = funcao(*args, **kwargs)
+            decorrido = time.perf_counter() - inicio
+            melhor = decorrido if melhor is None else min(melhor, decorrido)
+    return resultado, melhor
+
+
+def _epocas(treinador, X, y) -> None:
+    for _ in range(EPOCAS_MEDIDAS):
+        treinador.processar(X, y)
+
+
+def medir_tamanho(caminho_csv: str, n_linhas: int, limite_python: int, repeticoes: int = 1) -> list:
+    """
+    Mede todas as operações para um catálogo.
+
+    Args:
+        caminho_csv (str): Catálogo sintético
+        n_linhas (int): Linhas do catálogo
+        limite_python (int): Acima desse tamanho, pula as medições do caminho por linha
+        repeticoes (int): Repetições por medição (vale o menor tempo)
+
+    Returns:
+        list: Medições {'operacao', 'tamanho', 'segundos', 'itens_por_segundo'}
+    """
+    medicoes = []
+
+    def registrar(operacao: str, segundos: float, n_itens: int):
+        medicoes.append({'operacao': operacao, 'tamanho': n_linhas, 'segundos': segundos,
+                         'itens_por_segundo': n_itens / segundos if segundos > 0 else None})
+        print(f"  {operacao:<32} {segundos:10.4f} s  ({n_itens / max(segundos, 1e-12):,.0f} itens/s)")
+
+    dados, segundos = _cronometrar(carregar_dataset_csv, caminho_csv, repeticoes=repeticoes)
+    registrar('carregar_dataset_csv', segundos, n_linhas)
+
+    modelo = PerceptronFerramentas(semente=0)
+    _, segundos = _cronometrar(modelo.preparar_dados_treinamento, dados, repeticoes=repeticoes)
+    registrar('preparar_dados_treinamento', segundos, n_linhas)
+
+    (X_lista, y_lista), segundos = _cronometrar(modelo.preparar_dados_compactos, dados,
+                                                repeticoes=repeticoes)
+    registrar('preparar_dados_compactos', segundos, n_linhas)
+
+    (X, y), segundos = _cronometrar(codificar_matriz, modelo, dados, repeticoes=repeticoes)
+    registrar('codificar_matriz', segundos, n_linhas)
+
+    # Épocas medidas isoladamente (sem a preparação dos dados), a partir dos mesmos pesos
+    modelo._inicializar_pesos(X.shape[1])
+    if n_linhas <= limite_python:
+        treinador = _TreinadorListas(modelo.pesos, modelo.bias, modelo.taxa_aprendizado)
+        _, segundos = _cronometrar(_epocas, treinador, X_lista, y_lista)
+        registrar('treinar_epoca_python', segundos / EPOCAS_MEDIDAS, n_linhas)
+    del X_lista, y_lista
+    treinador = TreinadorVetorizado(modelo.pesos, modelo.bias, modelo.taxa_aprendizado)
+    _, segundos = _cronometrar(_epocas, treinador, X, y.astype(X.dtype))
+    registrar('treinar_epoca_numpy', segundos / EPOCAS_MEDIDAS, n_linhas)
+    modelo.pesos = treinador.pesos.tolist()
+    modelo.bias = treinador.bias
+
+    amostra = dados[:AMOSTRA_PREVER_ITEM]
+    _, segundos = _cronometrar(lambda: [modelo.prever_item(linha) for linha in amostra],
+                               repeticoes=repeticoes)
+    registrar('prever_item', segundos / len(amostra), 1)
+
+    if n_linhas <= limite_python:
+        _, segundos = _cronometrar(modelo.avaliar_dataset, dados, repeticoes=repeticoes)
+        registrar('avaliar_dataset', segundos, n_linhas)
+    _, segundos = _cronometrar(modelo.avaliar_dataset, dados, vetorizado=True, repeticoes=repeticoes)
+    registrar('avaliar_dataset_vetorizado', segundos, n_linhas)
+
+    return medicoes
+
+
+def comparar(atual: dict, anterior: dict, tolerancia: float) -> list:
+    """
+    Compara duas execuções e retorna as regressões.
+
+    Args:
+        atual (dict): Resultado atual
+        anterior (dict): Resultado de referência
+        tolerancia (float): Aumento relativo de tempo tolerado (0.2 = 20%)
+
+    Returns:
+        list: Regressões {'operacao', 'tamanho', 'anterior', 'atual', 'razao'}
+    """
+    referencia = {(m['operacao'], m['tamanho']): m['segundos'] for m in anterior['medicoes']}
+    regressoes = []
+    for medicao in atual['medicoes']:
+        chave = (medicao['operacao'], medicao['tamanho'])
+        if chave in referencia and referencia[chave] > 0:
+            razao = medicao['segundos'] / referencia[chave]
+            if razao > 1 + tolerancia:
+                regressoes.append({'operacao': chave[0], 'tamanho': chave[1],
+                                   'anterior': referencia[chave], 'atual': medicao['segundos'],
+                                   'razao': razao})
+    return regressoes
+
+
+def main():
+    """Linha de comando dos benchmarks."""
+    parser = argparse.ArgumentParser(description="Benchmarks do classificador de ferramentas")
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[10000],
+                        help="Linhas dos catálogos (ex.: 10000 1000000 10000000)")
+    parser.add_argument('--margem', type=float, default=0.05)
+    parser.add_argument('--ruido', type=float, default=0.0)
+    parser.add_argument('--limite-python', type=int, default=1000000,
+                        help="Tamanho máximo para medir os caminhos por linha (lentos)")
+    parser.add_argument('--diretorio-dados', default=os.path.join(DIRETORIO, 'dados'),
+                        help="Onde os catálogos gerados são guardados e reutilizados")
+    parser.add_argument('--saida', default=None, help="JSON de resultados")
+    parser.add_argument('--comparar', default=None, help="JSON anterior para detectar regressões")
+    parser.add_argument('--tolerancia', type=float, default=0.2)
+    parser.add_argument('--repeticoes', type=int, default=3,
+                        help="Repetições das medições rápidas (vale o menor tempo)")
+    args = parser.parse_args()
+
+    os.makedirs(args.diretorio_dados, exist_ok=True)
+    resultado = {
+        'timestamp': datetime.datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'plataforma': platform.platform(),
+        'margem': args.margem,
+        'ruido': args.ruido,
+        'medicoes': []
+    }
+
+    for n_linhas in args.tamanhos:
+        caminho_csv = os.path.join(args.diretorio_dados,
+                                   f'catalogo_{n_linhas}_m{args.margem}_r{args.ruido}.csv')
+        if not os.path.exists(caminho_csv):
+            print(f"Gerando catálogo sintético com {n_linhas} linhas...")
+            gerar_catalogo(caminho_csv, n_linhas, args.margem, args.ruido)
+        print(f"\nCatálogo com {n_linhas} linhas:")
+        resultado['medicoes'].extend(medir_tamanho(caminho_csv, n_linhas, args.limite_python,
+                                                        args.repeticoes))
+
+    saida = args.saida or os.path.join(
+        DIRETORIO, f"resultados_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(saida, 'w', encoding='utf-8') as arquivo:
+        json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados salvos em: {saida}")
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as arquivo:
+            anterior = json.load(arquivo)
+        regressoes = comparar(resultado, anterior, args.tolerancia)
+        for regressao in regressoes:
+            print(f"REGRESSÃO: {regressao['operacao']} ({regressao['tamanho']} linhas): "
+                  f"{regressao['anterior']:.4f} s -> {regressao['atual']:.4f} s "
+                  f"({regressao['razao']:.2f}x)")
+        if regressoes:
+            sys.exit(1)
+        print("Nenhuma regressão acima da tolerância.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gerador de catálogos sintéticos no formato de data/dataset_ferramentas.csv.
+
+Os rótulos eh_ferramenta vêm de uma regra linear oculta aplicada às mesmas
+features codificadas usadas pelo Perceptron. A separabilidade é controlada por:
+    margem: amostras com |margem da regra| < margem são descartadas
+            (margem > 0 garante um conjunto linearmente separável)
+    ruido:  fração de rótulos invertidos (torna o conjunto não separável)
+
+Uso:
+    python benchmarks/gerar_catalogo.py catalogo_1m.csv --linhas 1000000 --margem 0.05
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import N_CARACTERISTICAS, codificar_colunas
+
+
+CABECALHO = ('nome_item,peso_gramas,dureza_escala_1_10,tamanho_cm,tem_cabo,'
+             'material_metalico,preco_reais,cod_funcao,eh_ferramenta')
+
+TAMANHO_LOTE_GERACAO = 200000
+
+
+def _regra_oculta(gerador: np.random.Generator):
+    """Pesos e bias da regra linear que define os rótulos."""
+    pesos = gerador.normal(0.0, 1.0, N_CARACTERISTICAS)
+    return pesos / np.linalg.norm(pesos), float(gerador.normal(0.0, 0.1))
+
+
+def _sortear_valores(gerador: np.random.Generator, n: int) -> np.ndarray:
+    """Campos numéricos brutos: peso, dureza, tamanho, cabo, metal, cod_funcao."""
+    return np.column_stack([
+        gerador.integers(5, 1001, n),
+        gerador.integers(1, 11, n),
+        gerador.integers(2, 61, n),
+        gerador.integers(0, 2, n),
+        gerador.integers(0, 2, n),
+        gerador.integers(1, 10, n)
+    ]).astype(np.float64)
+
+
+def gerar_catalogo(caminho_arquivo: str, n_linhas: int, margem: float = 0.05,
+                   ruido: float = 0.0, semente: int = 0) -> None:
+    """
+    Gera um catálogo sintético em CSV, em lotes (memória limitada).
+
+    Args:
+        caminho_arquivo (str): CSV de saída
+        n_linhas (int): Número de linhas de dados
+        margem (float): Margem mínima da regra oculta (0 = sem descarte)
+        ruido (float): Fração de rótulos invertidos
+        semente (int): Semente do gerador
+    """
+    gerador = np.random.default_rng(semente)
+    modelo = PerceptronFerramentas()
+    pesos, bias = _regra_oculta(gerador)
+
+    escritas = 0
+    with open(caminho_arquivo, 'w', encoding='utf-8', newline='') as arquivo:
+        arquivo.write(CABECALHO + '\n')
+        while escritas < n_linhas:
+            # Sorteia a mais para compensar as amostras descartadas pela margem
+            valores = _sortear_valores(gerador, TAMANHO_LOTE_GERACAO)
+            margens = codificar_colunas(modelo, valores) @ pesos + bias
+            valores = valores[np.abs(margens) >= margem]
+            margens = margens[np.abs(margens) >= margem]
+            if len(valores) == 0:
+                raise ValueError(f"Nenhuma amostra com margem >= {margem}; use uma margem menor")
+            n = min(len(valores), n_linhas - escritas)
+            valores, margens = valores[:n].astype(np.int64), margens[:n]
+
+            rotulos = (margens >= 0).astype(np.int64)
+            if ruido > 0:
+                inverter = gerador.random(n) < ruido
+                rotulos[inverter] = 1 - rotulos[inverter]
+            precos = np.round(gerador.uniform(0.5, 300.0, n), 2)
+
+            arquivo.write('\n'.join(
+                f"Item_{escritas + i},{v[0]},{v[1]},{v[2]},{v[3]},{v[4]},{p},{v[5]},{r}"
+                for i, (v, p, r) in enumerate(zip(valores.tolist(), precos.tolist(), rotulos.tolist()))
+            ))
+            arquivo.write('\n')
+            escritas += n
+
+
+def main():
+    """Linha de comando do gerador."""
+    parser = argparse.ArgumentParser(description="Gera catálogo sintético de ferramentas")
+    parser.add_argument('saida', help="CSV de saída")
+    parser.add_argument('--linhas', type=int, default=10000)
+    parser.add_argument('--margem', type=float, default=0.05)
+    parser.add_argument('--ruido', type=float, default=0.0)
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    gerar_catalogo(args.saida, args.linhas, args.margem, args.ruido, args.semente)
+    print(f"Catálogo gerado: {args.saida} ({args.linhas} linhas)")
+
+
+if __name__ == "__main__":
+    main()
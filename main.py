@@ -12,17 +12,86 @@ Data: 2025
 
 import sys
 import os
+import argparse
 
-# Garante que estamos no diretório correto
-current_dir = os.path.dirname(os.path.abspath(__file__))
-os.chdir(current_dir)
 
-# Adiciona o diretório src ao path para importar os módulos
-sys.path.append(os.path.join(current_dir, 'src'))
+def criar_parser() -> argparse.ArgumentParser:
+    """Argumentos de linha de comando (caminhos relativos ao diretório de chamada)."""
+    parser = argparse.ArgumentParser(description="Sistema de Classificação de Ferramentas - Perceptron")
+    parser.add_argument('--modelo', metavar='ARQUIVO',
+                        help="Modelo salvo: carrega e vai direto para a classificação "
+                             "(se não existir, treina e salva nesse caminho)")
+    parser.add_argument('--atualizar', metavar='CSV',
+                        help="Atualiza o modelo salvo em --modelo com os novos itens rotulados do CSV")
+    parser.add_argument('--perfil', action='store_true',
+                        help="Mede fases e épocas do treinamento e grava os tempos no JSON de resultados")
+    parser.add_argument('--trace', metavar='ARQUIVO',
+                        help="Grava também um trace do Chrome (chrome://tracing) do treinamento")
+    parser.add_argument('--historico', metavar='ARQUIVO',
+                        help="Grava o histórico por época em JSON Lines durante o treinamento")
+    parser.add_argument('--semente', type=int,
+                        help="Semente dos pesos iniciais e da ordem das amostras (padrão: sorteada)")
+    parser.add_argument('--embaralhar', action='store_true',
+                        help="Embaralha a ordem das amostras a cada época")
+    parser.add_argument('--estratificar', choices=['eh_ferramenta', 'cod_funcao', 'ambos'],
+                        help="Embaralha intercalando os estratos na proporção do seu tamanho")
+    parser.add_argument('--validacao-cruzada', type=int, metavar='K',
+                        help="Validação cruzada com K folds, gravada no JSON de resultados")
+    parser.add_argument('--estratificar-folds', choices=['eh_ferramenta', 'cod_funcao', 'ambos'],
+                        help="Folds da validação cruzada com a mesma proporção de cada estrato")
+    parser.add_argument('--preditor-funcoes', action='store_true',
+                        help="Treina também o preditor do código de função para itens sem código "
+                             "(sempre treinado com --modelo)")
+    subcomandos = parser.add_subparsers(dest='comando')
+    parser_classificar = subcomandos.add_parser(
+        'classificar', help="Classifica um CSV de itens com um modelo salvo (sem interface interativa)")
+    parser_classificar.add_argument('--entrada', required=True, metavar='CSV', help="CSV de itens")
+    parser_classificar.add_argument('--saida', required=True, metavar='CSV',
+                                    help="CSV de saída com predições e margens")
+    parser_classificar.add_argument('--modelo', required=True, metavar='ARQUIVO', help="Modelo salvo")
+    parser_classificar.add_argument('--tamanho-bloco', type=int, default=65536,
+                                    help="Linhas processadas por vez")
+    return parser
 
-from classificador_ferramentas import main
 
-if __name__ == "__main__":
+def main(argv=None):
+    """
+    Executa o sistema a partir da linha de comando.
+
+    Args:
+        argv (Optional[List[str]]): Argumentos (None = sys.argv)
+    """
+    args = criar_parser().parse_args(argv)
+    caminho_modelo = os.path.abspath(args.modelo) if args.modelo else None
+    caminho_atualizacao = os.path.abspath(args.atualizar) if args.atualizar else None
+    caminho_trace = os.path.abspath(args.trace) if args.trace else None
+    caminho_historico = os.path.abspath(args.historico) if args.historico else None
+    if args.comando == 'classificar':
+        caminho_entrada = os.path.abspath(args.entrada)
+        caminho_saida = os.path.abspath(args.saida)
+
+    # Garante que estamos no diretório correto
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(current_dir)
+
+    # Adiciona o diretório src ao path para importar os módulos
+    sys.path.append(os.path.join(current_dir, 'src'))
+
+    # Os módulos são importados por subcomando: `classificar` carrega só o núcleo
+    # de inferência (sem NumPy nem o código de treinamento) para arquivos pequenos
+    if args.comando == 'classificar':
+        from classificacao_lote import classificar_com_modelo_salvo
+        try:
+            if classificar_com_modelo_salvo(caminho_modelo, caminho_entrada, caminho_saida,
+                                            args.tamanho_bloco) is None:
+                sys.exit(1)
+        except (ValueError, OSError) as e:
+            print(f"Erro durante a classificação: {e}")
+            sys.exit(1)
+        return
+
+    from classificador_ferramentas import main as executar_sistema
+    
     print("=" * 60)
     print("    SISTEMA DE CLASSIFICAÇÃO DE FERRAMENTAS")
     print("    Loja de Material de Construção - Perceptron")
@@ -30,7 +99,9 @@ if __name__ == "__main__":
     print()
     
     try:
-        main()
+        executar_sistema(caminho_modelo, caminho_atualizacao, args.perfil, caminho_trace, caminho_historico,
+                         args.semente, args.embaralhar, args.estratificar, args.validacao_cruzada,
+                         args.estratificar_folds, args.preditor_funcoes)
     except KeyboardInterrupt:
         print("\n\nPrograma interrompido pelo usuário.")
     except Exception as e:
@@ -39,4 +110,8 @@ if __name__ == "__main__":
     
     print("\n" + "=" * 60)
     print("    Obrigado por usar o sistema!")
-    print("=" * 60)
\ No newline at end of file
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
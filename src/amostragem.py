@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ordem de visita das amostras a cada época do treinamento.
+
+`AmostradorEpocas` embaralha um único array de índices a cada época, a
+partir de uma semente; X e y nunca são copiados nem reordenados, os
+treinadores recebem apenas a permutação. Com estratos (eh_ferramenta,
+cod_funcao ou os dois), cada estrato é embaralhado separadamente e os
+estratos são intercalados na proporção do seu tamanho, então qualquer
+trecho da época tem aproximadamente a mesma mistura de classes do dataset
+(útil quando o CSV está ordenado por classe ou por função).
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from motor_vetorizado import N_CARACTERISTICAS_FISICAS
+
+
+# Estratos aceitos pela ordem de visita embaralhada
+ESTRATIFICACOES = ('eh_ferramenta', 'cod_funcao', 'ambos')
+
+
+class AmostradorEpocas:
+    """
+    Permutações reprodutíveis das amostras, uma por época.
+
+    Attributes:
+        n_amostras (int): Número de amostras
+        semente (Optional[int]): Semente do gerador
+        estratificado (bool): Se as épocas intercalam os estratos
+    """
+
+    def __init__(self, n_amostras: int, semente: Optional[int] = None,
+                 estratos: Optional[np.ndarray] = None):
+        """
+        Args:
+            n_amostras (int): Número de amostras
+            semente (Optional[int]): Semente do gerador (mesma semente, mesma sequência de épocas)
+            estratos (Optional[np.ndarray]): Rótulo de estrato por amostra (None = sem estratos)
+        """
+        self.n_amostras = n_amostras
+        self.semente = semente
+        self._gerador = np.random.default_rng(semente)
+        self._indices = np.arange(n_amostras, dtype=np.int64)
+        self.estratificado = estratos is not None
+
+        if self.estratificado:
+            estratos = np.asarray(estratos)
+            if estratos.shape != (n_amostras,):
+                raise ValueError("estratos deve ter um rótulo por amostra")
+            _, grupos = np.unique(estratos, return_inverse=True)
+            # Índices agrupados por estrato (ordem fixa); o embaralhamento troca
+            # posições só dentro de cada grupo
+            self._indices = np.argsort(grupos, kind='stable').astype(np.int64)
+            grupo_por_posicao = grupos[self._indices]
+            contagens = np.bincount(grupos)
+            inicios = np.concatenate(([0], np.cumsum(contagens)[:-1]))
+            self._grupos = grupo_por_posicao.astype(np.float64)
+            self._postos = np.arange(n_amostras) - inicios[grupo_por_posicao]
+            self._tamanhos = contagens[grupo_por_posicao].astype(np.float64)
+
+    def ordem_epoca(self) -> np.ndarray:
+        """
+        Ordem de visita da próxima época.
+
+        O array retornado é reutilizado (embaralhado no lugar) na época
+        seguinte quando não há estratos.
+
+        Returns:
+            np.ndarray: Permutação de 0..n_amostras-1 (int64)
+        """
+        if not self.estratificado:
+            self._gerador.shuffle(self._indices)
+            return self._indices
+
+        # Embaralha dentro de cada estrato: a parte inteira da chave mantém o grupo
+        embaralhados = self._indices[np.argsort(self._grupos + self._gerador.random(self.n_amostras))]
+        # Intercala: o k-ésimo item de um estrato de tamanho n fica perto da fração k/n da época
+        prioridade = (self._postos + self._gerador.random(self.n_amostras)) / self._tamanhos
+        return embaralhados[np.argsort(prioridade, kind='stable')]
+
+
+def estratos_matriz(X: np.ndarray, y: np.ndarray, estratificar: str) -> np.ndarray:
+    """
+    Rótulos de estrato a partir das features codificadas.
+
+    Args:
+        X (np.ndarray): Matriz (n, 14) de features (o código de função vem do one-hot)
+        y (np.ndarray): Rótulos eh_ferramenta
+        estratificar (str): 'eh_ferramenta', 'cod_funcao' ou 'ambos'
+
+    Returns:
+        np.ndarray: Rótulo inteiro de estrato por amostra
+    """
+    one_hot = np.asarray(X[:, N_CARACTERISTICAS_FISICAS:])
+    codigos = np.where(one_hot.any(axis=1), one_hot.argmax(axis=1) + 1, 0)
+    return _combinar_estratos(np.asarray(y, dtype=np.int64), codigos, estratificar)
+
+
+def estratos_compactos(indices_funcao, y, estratificar: str) -> np.ndarray:
+    """
+    Rótulos de estrato para os dados do motor 'python' (`DadosCompactos`).
+
+    Args:
+        indices_funcao: Posição do peso da função de cada linha (-1 = nenhuma)
+        y: Rótulos eh_ferramenta
+        estratificar (str): 'eh_ferramenta', 'cod_funcao' ou 'ambos'
+
+    Returns:
+        np.ndarray: Rótulo inteiro de estrato por amostra
+    """
+    codigos = np.asarray(indices_funcao, dtype=np.int64) - (N_CARACTERISTICAS_FISICAS - 1)
+    codigos[codigos < 0] = 0
+    return _combinar_estratos(np.asarray(y, dtype=np.int64), codigos, estratificar)
+
+
+def _combinar_estratos(y: np.ndarray, codigos: np.ndarray, estratificar: str) -> np.ndarray:
+    if estratificar == 'eh_ferramenta':
+        return y
+    if estratificar == 'cod_funcao':
+        return codigos
+    if estratificar == 'ambos':
+        return codigos * 2 + y
+    raise ValueError(f"Estratificação desconhecida: {estratificar} (use uma de {ESTRATIFICACOES})")
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Avaliação paralela de arquivos de teste grandes.
+
+O CSV de teste é dividido em intervalos de bytes (ver
+`carregador_blocos.dividir_em_intervalos`); cada processo lê o seu intervalo
+em blocos, pontua cada bloco com um produto matriz-vetor e acumula apenas
+contadores. Os resumos parciais são combinados em acurácia, matriz de
+confusão e acurácia por código de função, com uma amostra limitada das
+linhas classificadas errado.
+
+Uso:
+    python src/avaliacao_paralela.py --modelo modelo_perceptron.bin --teste teste_grande.csv --processos 4
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+
+from carregador_blocos import (TAMANHO_BLOCO_PADRAO, codificar_bloco, dividir_em_intervalos,
+                               iterar_linhas_intervalo)
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import N_CARACTERISTICAS_FISICAS, N_FUNCOES, pontuar
+
+
+LIMITE_AMOSTRAS_ERROS = 20
+
+
+class ResumoAvaliacao:
+    """
+    Contadores combináveis de uma avaliação.
+
+    Attributes:
+        matriz_confusao (np.ndarray): Contagens (2, 2) indexadas por [real, predição]
+        total_por_funcao (np.ndarray): Amostras por código de função (índice 0 = código inválido)
+        corretas_por_funcao (np.ndarray): Acertos por código de função
+        amostras_erros (List[dict]): Primeiras linhas classificadas errado (no máximo `limite_amostras`)
+        limite_amostras (int): Tamanho máximo da amostra de erros
+    """
+
+    def __init__(self, limite_amostras: int = LIMITE_AMOSTRAS_ERROS):
+        self.matriz_confusao = np.zeros((2, 2), dtype=np.int64)
+        self.total_por_funcao = np.zeros(N_FUNCOES + 1, dtype=np.int64)
+        self.corretas_por_funcao = np.zeros(N_FUNCOES + 1, dtype=np.int64)
+        self.amostras_erros = []
+        self.limite_amostras = limite_amostras
+
+    @property
+    def total(self) -> int:
+        return int(self.matriz_confusao.sum())
+
+    @property
+    def corretas(self) -> int:
+        return int(np.trace(self.matriz_confusao))
+
+    @property
+    def acuracia(self) -> float:
+        """Acurácia em percentual."""
+        if self.total == 0:
+            raise ValueError("Nenhuma amostra avaliada")
+        return (self.corretas / self.total) * 100
+
+    def registrar(self, X: np.ndarray, y: np.ndarray, predicoes: np.ndarray, margens: np.ndarray,
+                  nomes: Optional[List[str]] = None) -> None:
+        """
+        Acumula as predições de um bloco.
+
+        Args:
+            X (np.ndarray): Matriz (n, 14) do bloco (o código de função vem do one-hot)
+            y (np.ndarray): Rótulos reais
+            predicoes (np.ndarray): Predições 0/1
+            margens (np.ndarray): Saídas lineares
+            nomes (Optional[List[str]]): Nomes dos itens, para a amostra de erros
+        """
+        y = y.astype(np.int64)
+        predicoes = predicoes.astype(np.int64)
+        self.matriz_confusao += np.bincount(2 * y + predicoes, minlength=4).reshape(2, 2)
+
+        one_hot = X[:, N_CARACTERISTICAS_FISICAS:]
+        codigos = np.where(one_hot.any(axis=1), one_hot.argmax(axis=1) + 1, 0)
+        corretas = predicoes == y
+        self.total_por_funcao += np.bincount(codigos, minlength=N_FUNCOES + 1)
+        self.corretas_por_funcao += np.bincount(codigos[corretas], minlength=N_FUNCOES + 1)
+
+        vagas = self.limite_amostras - len(self.amostras_erros)
+        if vagas > 0:
+            for i in np.flatnonzero(~corretas)[:vagas]:
+                self.amostras_erros.append({
+                    'item': nomes[i] if nomes is not None else None,
+                    'predicao': int(predicoes[i]),
+                    'real': int(y[i]),
+                    'cod_funcao': int(codigos[i]),
+                    'margem': float(margens[i])
+                })
+
+    def combinar(self, outro: 'ResumoAvaliacao') -> 'ResumoAvaliacao':
+        """
+        Incorpora o resumo de outro intervalo (na ordem do arquivo).
+
+        Args:
+            outro (ResumoAvaliacao): Resumo a incorporar
+
+        Returns:
+            ResumoAvaliacao: Este resumo
+        """
+        self.matriz_confusao += outro.matriz_confusao
+        self.total_por_funcao += outro.total_por_funcao
+        self.corretas_por_funcao += outro.corretas_por_funcao
+        vagas = self.limite_amostras - len(self.amostras_erros)
+        self.amostras_erros.extend(outro.amostras_erros[:max(vagas, 0)])
+        return self
+
+    def para_dict(self, legenda_funcoes: Optional[dict] = None) -> dict:
+        """
+        Resumo serializável em JSON.
+
+        Args:
+            legenda_funcoes (Optional[dict]): Descrições por código, incluídas na acurácia por função
+
+        Returns:
+            dict: total, corretas, acuracia, matriz_confusao, acuracia_por_funcao e amostras_erros
+        """
+        por_funcao = {}
+        for codigo in range(N_FUNCOES + 1):
+            total = int(self.total_por_funcao[codigo])
+            if total == 0:
+                continue
+            chave = str(codigo) if codigo else 'sem_codigo'
+            por_funcao[chave] = {
+                'total': total,
+                'acuracia': (int(self.corretas_por_funcao[codigo]) / total) * 100
+            }
+            if legenda_funcoes and codigo in legenda_funcoes:
+                por_funcao[chave]['funcao'] = legenda_funcoes[codigo]
+        return {
+            'total': self.total,
+            'corretas': self.corretas,
+            'acuracia': self.acuracia if self.total else None,
+            'matriz_confusao': {
+                'verdadeiros_negativos': int(self.matriz_confusao[0, 0]),
+                'falsos_positivos': int(self.matriz_confusao[0, 1]),
+                'falsos_negativos': int(self.matriz_confusao[1, 0]),
+                'verdadeiros_positivos': int(self.matriz_confusao[1, 1])
+            },
+            'acuracia_por_funcao': por_funcao,
+            'amostras_erros': self.amostras_erros
+        }
+
+
+def _avaliar_intervalo(caminho_arquivo: str, inicio: int, fim: int, pesos: List[float], bias: float,
+                       normalizacao_params: dict, tamanho_bloco: int, limite_amostras: int) -> ResumoAvaliacao:
+    """Avalia um intervalo de bytes do CSV (executado nos processos trabalhadores)."""
+    modelo = PerceptronFerramentas()
+    modelo.normalizacao_params = normalizacao_params
+    resumo = ResumoAvaliacao(limite_amostras)
+    for linhas in iterar_linhas_intervalo(caminho_arquivo, inicio, fim, tamanho_bloco):
+        bloco = codificar_bloco(modelo, linhas, incluir_nomes=limite_amostras > 0)
+        predicoes, margens = pontuar(bloco.X, pesos, bias)
+        resumo.registrar(bloco.X, bloco.y, predicoes, margens, bloco.nomes)
+    return resumo
+
+
+def avaliar_arquivo_paralelo(modelo: PerceptronFerramentas, caminho_arquivo: str,
+                             n_processos: Optional[int] = None,
+                             tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                             limite_amostras: int = LIMITE_AMOSTRAS_ERROS) -> ResumoAvaliacao:
+    """
+    Avalia um CSV de teste dividido entre processos.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo treinado
+        caminho_arquivo (str): CSV de teste
+        n_processos (Optional[int]): Processos trabalhadores (padrão: núcleos disponíveis;
+            1 = no próprio processo)
+        tamanho_bloco (int): Linhas pontuadas por vez em cada processo
+        limite_amostras (int): Máximo de linhas erradas guardadas para inspeção
+
+    Returns:
+        ResumoAvaliacao: Contadores combinados de todos os intervalos
+    """
+    if modelo.pesos is None:
+        raise ValueError("Modelo não foi treinado ainda!")
+
+    n_processos = n_processos or os.cpu_count() or 1
+    argumentos = (list(modelo.pesos), float(modelo.bias), modelo.normalizacao_params,
+                  tamanho_bloco, limite_amostras)
+    intervalos = dividir_em_intervalos(caminho_arquivo, n_processos)
+
+    resumo = ResumoAvaliacao(limite_amostras)
+    if n_processos > 1 and len(intervalos) > 1:
+        with ProcessPoolExecutor(max_workers=n_processos) as executor:
+            futuros = [executor.submit(_avaliar_intervalo, caminho_arquivo, inicio, fim, *argumentos)
+                       for inicio, fim in intervalos]
+            for futuro in futuros:
+                resumo.combinar(futuro.result())
+    else:
+        for inicio, fim in intervalos:
+            resumo.combinar(_avaliar_intervalo(caminho_arquivo, inicio, fim, *argumentos))
+
+    if resumo.total == 0:
+        raise ValueError(f"Arquivo sem amostras: {caminho_arquivo}")
+    return resumo
+
+
+def main():
+    """Linha de comando da avaliação paralela."""
+    parser = argparse.ArgumentParser(description="Avaliação paralela de um CSV de teste")
+    parser.add_argument('--modelo', required=True, help="Modelo salvo (main.py --modelo ARQUIVO)")
+    parser.add_argument('--teste', required=True, help="CSV de teste rotulado")
+    parser.add_argument('--processos', type=int, default=None)
+    parser.add_argument('--tamanho-bloco', type=int, default=TAMANHO_BLOCO_PADRAO)
+    parser.add_argument('--amostras-erros', type=int, default=LIMITE_AMOSTRAS_ERROS,
+                        help="Máximo de linhas erradas guardadas no resumo")
+    parser.add_argument('--saida', default=None, help="JSON com o resumo da avaliação")
+    args = parser.parse_args()
+
+    modelo = PerceptronFerramentas.carregar(args.modelo)
+    resumo = avaliar_arquivo_paralelo(modelo, args.teste, args.processos, args.tamanho_bloco,
+                                      args.amostras_erros)
+    resultado = resumo.para_dict(modelo.legenda_funcoes)
+
+    print(f"ACURÁCIA: {resultado['acuracia']:.2f}% ({resultado['corretas']}/{resultado['total']})")
+    print("Matriz de confusão (real x predição):")
+    print(f"  {resumo.matriz_confusao[0, 0]:>10} {resumo.matriz_confusao[0, 1]:>10}")
+    print(f"  {resumo.matriz_confusao[1, 0]:>10} {resumo.matriz_confusao[1, 1]:>10}")
+    print("Acurácia por função:")
+    for codigo, dados in resultado['acuracia_por_funcao'].items():
+        print(f"  {codigo}: {dados['acuracia']:.1f}% ({dados['total']} itens)")
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(resultado, arquivo, indent=2, ensure_ascii=False)
+        print(f"Resumo salvo em: {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
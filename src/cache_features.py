@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Cache binário das features codificadas de um dataset CSV.
+
+Na primeira leitura o CSV é convertido (em blocos) para um arquivo binário com
+a matriz de features (n, 14), os rótulos e os nomes dos itens. Nas execuções
+seguintes o arquivo é mapeado em memória (np.memmap), sem cópia e sem parsing.
+
+Formato do arquivo:
+    [0, 4096)           cabeçalho: MAGICO + JSON (versão, hash do CSV,
+                        parâmetros de normalização usados e ajustados ao
+                        CSV, dtype, deslocamentos)
+    [4096, ...)         X: n x 14 valores no dtype do cabeçalho
+    em seguida          y: n valores int8
+    em seguida          nomes em UTF-8 separados por '\n'
+
+O cache é reconstruído quando o hash do CSV, os parâmetros de normalização,
+o dtype ou a versão do formato mudam. O cabeçalho também guarda mínimo,
+máximo, média e desvio de peso, dureza e tamanho do CSV, calculados na mesma
+passada da codificação: com o cache válido, `normalizacao_do_cache` evita
+reler o CSV para ajustar a normalização.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import List, NamedTuple, Optional
+
+import numpy as np
+
+from carregador_blocos import TAMANHO_BLOCO_PADRAO, codificar_bloco, iterar_linhas_csv
+from motor_vetorizado import N_CARACTERISTICAS
+from normalizacao import COLUNAS_NORMALIZADAS, EstatisticasNormalizacao
+
+
+MAGICO = b'PFCACHE\x00'
+VERSAO_FORMATO = 2
+TAMANHO_CABECALHO = 4096
+SUFIXO_CACHE = '.features.bin'
+
+
+class DatasetCodificado(NamedTuple):
+    """
+    Dataset codificado lido do cache.
+
+    Attributes:
+        X (np.ndarray): Matriz (n, 14) de features (memmap somente leitura)
+        y (np.ndarray): Rótulos eh_ferramenta (memmap somente leitura)
+        nomes (Optional[List[str]]): Nomes dos itens, se solicitados
+    """
+    X: np.ndarray
+    y: np.ndarray
+    nomes: Optional[List[str]]
+
+
+def calcular_hash_arquivo(caminho_arquivo: str) -> str:
+    """Calcula o SHA-256 de um arquivo lendo-o em pedaços."""
+    resumo = hashlib.sha256()
+    with open(caminho_arquivo, 'rb') as arquivo:
+        for pedaco in iter(lambda: arquivo.read(1 << 20), b''):
+            resumo.update(pedaco)
+    return resumo.hexdigest()
+
+
+def ler_cabecalho(caminho_cache: str) -> Optional[dict]:
+    """
+    Lê o cabeçalho de um arquivo de cache.
+
+    Args:
+        caminho_cache (str): Caminho do arquivo de cache
+
+    Returns:
+        Optional[dict]: Cabeçalho ou None se o arquivo não existe ou é inválido
+    """
+    try:
+        with open(caminho_cache, 'rb') as arquivo:
+            bruto = arquivo.read(TAMANHO_CABECALHO)
+    except OSError:
+        return None
+
+    if len(bruto) < TAMANHO_CABECALHO or not bruto.startswith(MAGICO):
+        return None
+    try:
+        return json.loads(bruto[len(MAGICO):].decode('utf-8').rstrip())
+    except ValueError:
+        return None
+
+
+def _cabecalho_valido(cabecalho: Optional[dict], hash_fonte: str, modelo, dtype: np.dtype) -> bool:
+    return (cabecalho is not None
+            and cabecalho.get('versao') == VERSAO_FORMATO
+            and cabecalho.get('hash_fonte') == hash_fonte
+            and cabecalho.get('normalizacao') == modelo.normalizacao_params
+            and cabecalho.get('dtype') == dtype.str)
+
+
+def escrever_cache(caminho_csv: str, caminho_cache: str, modelo, dtype='float32',
+                   tamanho_bloco: int = TAMANHO_BLOCO_PADRAO, hash_fonte: Optional[str] = None) -> dict:
+    """
+    Codifica o CSV em blocos e grava o arquivo de cache.
+
+    A gravação é feita em um arquivo temporário e movida no final, então um
+    cache incompleto nunca é lido.
+
+    Args:
+        caminho_csv (str): CSV de origem
+        caminho_cache (str): Arquivo de cache a ser gravado
+        modelo (PerceptronFerramentas): Modelo com os parâmetros de normalização
+        dtype: Tipo de ponto flutuante da matriz armazenada
+        tamanho_bloco (int): Linhas codificadas por vez
+        hash_fonte (Optional[str]): Hash do CSV, se já calculado
+
+    Returns:
+        dict: Cabeçalho gravado
+    """
+    dtype = np.dtype(dtype)
+    if hash_fonte is None:
+        hash_fonte = calcular_hash_arquivo(caminho_csv)
+
+    diretorio = os.path.dirname(os.path.abspath(caminho_cache))
+    descritor, caminho_temp = tempfile.mkstemp(dir=diretorio, suffix='.tmp')
+    try:
+        n_amostras = 0
+        estatisticas = EstatisticasNormalizacao()
+        with os.fdopen(descritor, 'wb') as saida, \
+                tempfile.TemporaryFile() as rotulos, tempfile.TemporaryFile() as nomes:
+            saida.write(b'\x00' * TAMANHO_CABECALHO)
+            for linhas in iterar_linhas_csv(caminho_csv, tamanho_bloco):
+                bloco = codificar_bloco(modelo, linhas, dtype, incluir_nomes=True)
+                estatisticas.atualizar(np.array([[linha[c] for c in COLUNAS_NORMALIZADAS]
+                                                 for linha in linhas], dtype=np.float64))
+                saida.write(bloco.X.tobytes())
+                rotulos.write(bloco.y.tobytes())
+                texto = '\n'.join(nome.replace('\n', ' ') for nome in bloco.nomes)
+                nomes.write(((b'\n' if n_amostras else b'') + texto.encode('utf-8')))
+                n_amostras += len(bloco.y)
+
+            deslocamento_y = TAMANHO_CABECALHO + n_amostras * N_CARACTERISTICAS * dtype.itemsize
+            rotulos.seek(0)
+            shutil.copyfileobj(rotulos, saida)
+            deslocamento_nomes = deslocamento_y + n_amostras
+            nomes.seek(0)
+            shutil.copyfileobj(nomes, saida)
+            tamanho_nomes = saida.tell() - deslocamento_nomes
+
+            cabecalho = {
+                'versao': VERSAO_FORMATO,
+                'hash_fonte': hash_fonte,
+                'normalizacao': modelo.normalizacao_params,
+                'normalizacao_ajustada': estatisticas.parametros(media_desvio=True) if n_amostras else None,
+                'dtype': dtype.str,
+                'n_amostras': n_amostras,
+                'n_caracteristicas': N_CARACTERISTICAS,
+                'deslocamento_X': TAMANHO_CABECALHO,
+                'deslocamento_y': deslocamento_y,
+                'deslocamento_nomes': deslocamento_nomes,
+                'tamanho_nomes': tamanho_nomes
+            }
+            bruto = MAGICO + json.dumps(cabecalho).encode('utf-8')
+            if len(bruto) > TAMANHO_CABECALHO:
+                raise ValueError("Cabeçalho do cache excede o espaço reservado")
+            saida.seek(0)
+            saida.write(bruto.ljust(TAMANHO_CABECALHO, b' '))
+
+        os.replace(caminho_temp, caminho_cache)
+    except BaseException:
+        if os.path.exists(caminho_temp):
+            os.remove(caminho_temp)
+        raise
+
+    return cabecalho
+
+
+def normalizacao_do_cache(caminho_csv: str, media_desvio: bool = False,
+                          caminho_cache: Optional[str] = None,
+                          hash_fonte: Optional[str] = None) -> Optional[dict]:
+    """
+    Parâmetros de normalização ajustados ao CSV, lidos do cabeçalho do cache.
+
+    Equivalem a `normalizacao.ajustar_normalizacao(caminho_csv)`, sem reler o CSV.
+
+    Args:
+        caminho_csv (str): CSV de origem
+        media_desvio (bool): Inclui também 'media' e 'desvio'
+        caminho_cache (Optional[str]): Arquivo de cache (padrão: CSV + '.features.bin')
+        hash_fonte (Optional[str]): SHA-256 do CSV, se já calculado
+
+    Returns:
+        Optional[dict]: Parâmetros ou None se não houver cache válido para o CSV
+    """
+    if caminho_cache is None:
+        caminho_cache = caminho_csv + SUFIXO_CACHE
+    cabecalho = ler_cabecalho(caminho_cache)
+    if (cabecalho is None or cabecalho.get('versao') != VERSAO_FORMATO
+            or not cabecalho.get('normalizacao_ajustada')):
+        return None
+    if hash_fonte is None:
+        hash_fonte = calcular_hash_arquivo(caminho_csv)
+    if cabecalho.get('hash_fonte') != hash_fonte:
+        return None
+
+    chaves = ('min', 'max', 'media', 'desvio') if media_desvio else ('min', 'max')
+    return {nome: {chave: params[chave] for chave in chaves}
+            for nome, params in cabecalho['normalizacao_ajustada'].items()}
+
+
+def mapear_cache(caminho_cache: str, cabecalho: dict, incluir_nomes: bool = False) -> DatasetCodificado:
+    """
+    Mapeia em memória um arquivo de cache já validado.
+
+    Args:
+        caminho_cache (str): Arquivo de cache
+        cabecalho (dict): Cabeçalho lido com `ler_cabecalho`
+        incluir_nomes (bool): Se os nomes dos itens devem ser decodificados
+
+    Returns:
+        DatasetCodificado: Arrays mapeados do arquivo
+    """
+    n_amostras = cabecalho['n_amostras']
+    dtype = np.dtype(cabecalho['dtype'])
+    if n_amostras == 0:
+        return DatasetCodificado(np.zeros((0, N_CARACTERISTICAS), dtype=dtype),
+                                 np.zeros(0, dtype=np.int8), [] if incluir_nomes else None)
+
+    X = np.memmap(caminho_cache, dtype=dtype, mode='r', offset=cabecalho['deslocamento_X'],
+                  shape=(n_amostras, cabecalho['n_caracteristicas']))
+    y = np.memmap(caminho_cache, dtype=np.int8, mode='r', offset=cabecalho['deslocamento_y'],
+                  shape=(n_amostras,))
+
+    nomes = None
+    if incluir_nomes:
+        with open(caminho_cache, 'rb') as arquivo:
+            arquivo.seek(cabecalho['deslocamento_nomes'])
+            nomes = arquivo.read(cabecalho['tamanho_nomes']).decode('utf-8').split('\n')
+
+    return DatasetCodificado(X, y, nomes)
+
+
+def carregar_features_com_cache(caminho_csv: str, modelo, caminho_cache: Optional[str] = None,
+                                dtype='float32', incluir_nomes: bool = False,
+                                hash_fonte: Optional[str] = None) -> Optional[DatasetCodificado]:
+    """
+    Retorna as features codificadas de um CSV, usando o cache binário quando válido.
+
+    Args:
+        caminho_csv (str): CSV de origem
+        modelo (PerceptronFerramentas): Modelo com os parâmetros de normalização
+        caminho_cache (Optional[str]): Arquivo de cache (padrão: CSV + '.features.bin')
+        dtype: Tipo de ponto flutuante da matriz armazenada
+        incluir_nomes (bool): Se os nomes dos itens devem ser retornados
+        hash_fonte (Optional[str]): SHA-256 do CSV, se já calculado
+
+    Returns:
+        Optional[DatasetCodificado]: Dataset codificado ou None se houver erro
+    """
+    if caminho_cache is None:
+        caminho_cache = caminho_csv + SUFIXO_CACHE
+    dtype = np.dtype(dtype)
+
+    try:
+        if hash_fonte is None:
+            hash_fonte = calcular_hash_arquivo(caminho_csv)
+        cabecalho = ler_cabecalho(caminho_cache)
+
+        if _cabecalho_valido(cabecalho, hash_fonte, modelo, dtype):
+            print(f"Cache de features carregado: {caminho_cache} ({cabecalho['n_amostras']} registros)")
+        else:
+            cabecalho = escrever_cache(caminho_csv, caminho_cache, modelo, dtype,
+                                       hash_fonte=hash_fonte)
+            print(f"Cache de features gerado: {caminho_cache} ({cabecalho['n_amostras']} registros)")
+
+        return mapear_cache(caminho_cache, cabecalho, incluir_nomes)
+
+    except FileNotFoundError:
+        print(f"Erro: Arquivo '{caminho_csv}' não encontrado.")
+        return None
+    except Exception as e:
+        print(f"Erro ao carregar features: {e}")
+        return None
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Leitura em blocos de datasets CSV de ferramentas.
+
+Em vez de carregar o arquivo inteiro em uma lista de listas de strings, os
+geradores deste módulo leem `tamanho_bloco` linhas por vez e entregam cada
+bloco já convertido e codificado em arrays NumPy. A memória usada depende
+apenas do tamanho do bloco, não do tamanho do arquivo.
+
+Um arquivo também pode ser dividido em intervalos de bytes alinhados a
+linhas (`dividir_em_intervalos`), lidos de forma independente por processos
+diferentes com `iterar_linhas_intervalo`.
+"""
+
+import csv
+import io
+import os
+from itertools import chain, islice
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from motor_vetorizado import COLUNAS_NUMERICAS, codificar_colunas
+
+
+TAMANHO_BLOCO_PADRAO = 65536
+
+
+class BlocoDados(NamedTuple):
+    """
+    Bloco de linhas de um CSV já codificado.
+
+    Attributes:
+        X (np.ndarray): Matriz (n, 14) de features
+        y (Optional[np.ndarray]): Rótulos eh_ferramenta (None se o arquivo não tem rótulos)
+        nomes (Optional[List[str]]): Nomes dos itens, se solicitados
+    """
+    X: np.ndarray
+    y: Optional[np.ndarray]
+    nomes: Optional[List[str]]
+
+
+def iterar_linhas_csv(caminho_arquivo: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[List[List[str]]]:
+    """
+    Lê um CSV em blocos de linhas brutas, pulando o cabeçalho e linhas vazias.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV
+        tamanho_bloco (int): Número máximo de linhas por bloco
+
+    Yields:
+        List[List[str]]: Linhas do bloco
+    """
+    if tamanho_bloco < 1:
+        raise ValueError("tamanho_bloco deve ser um inteiro positivo")
+
+    with open(caminho_arquivo, 'r', encoding='utf-8', newline='') as arquivo:
+        leitor = csv.reader(arquivo)
+        next(leitor, None)  # Pula o cabeçalho
+        yield from _agrupar_linhas(leitor, tamanho_bloco)
+
+
+def _agrupar_linhas(leitor: Iterable[List[str]], tamanho_bloco: int) -> Iterator[List[List[str]]]:
+    """Agrupa as linhas não vazias de um leitor CSV em blocos de até `tamanho_bloco`."""
+    linhas_validas = (linha for linha in leitor if linha)
+    while True:
+        bloco = list(islice(linhas_validas, tamanho_bloco))
+        if not bloco:
+            break
+        yield bloco
+
+
+def dividir_em_intervalos(caminho_arquivo: str, n_partes: int) -> List[Tuple[int, int]]:
+    """
+    Divide um arquivo em intervalos de bytes de tamanho parecido.
+
+    Os limites não precisam cair em início de linha: cada linha pertence ao
+    intervalo que contém o seu primeiro byte (ver `iterar_linhas_intervalo`).
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV
+        n_partes (int): Número de intervalos
+
+    Returns:
+        List[Tuple[int, int]]: Intervalos [inicio, fim) em bytes
+    """
+    if n_partes < 1:
+        raise ValueError("n_partes deve ser um inteiro positivo")
+    tamanho = os.path.getsize(caminho_arquivo)
+    limites = [tamanho * parte // n_partes for parte in range(n_partes + 1)]
+    return [(inicio, fim) for inicio, fim in zip(limites, limites[1:]) if fim > inicio]
+
+
+def _textos_intervalo(arquivo, inicio: int, fim: int, tamanho_leitura: int = 1 << 22) -> Iterator[str]:
+    """Trechos de texto com as linhas cujo primeiro byte está em [inicio, fim), sem o cabeçalho."""
+    if inicio == 0:
+        arquivo.readline()  # Cabeçalho
+    else:
+        # Termina a linha que começou antes do intervalo (pertence ao anterior)
+        arquivo.seek(inicio - 1)
+        arquivo.readline()
+    posicao = arquivo.tell()
+
+    while posicao < fim:
+        dados = arquivo.read(min(tamanho_leitura, fim - posicao))
+        if not dados:
+            break
+        posicao += len(dados)
+        if posicao >= fim and not dados.endswith(b'\n'):
+            # A última linha começou dentro do intervalo: lê até o fim dela
+            dados += arquivo.readline()
+        elif not dados.endswith(b'\n'):
+            # Trecho cortado no meio de uma linha: completa a linha
+            restante = arquivo.readline()
+            posicao += len(restante)
+            dados += restante
+        yield dados.decode('utf-8')
+
+
+def iterar_linhas_intervalo(caminho_arquivo: str, inicio: int, fim: int,
+                            tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Iterator[List[List[str]]]:
+    """
+    Lê em blocos as linhas de um intervalo de bytes do CSV.
+
+    Intervalos consecutivos de `dividir_em_intervalos` cobrem todas as linhas
+    de dados exatamente uma vez. Campos entre aspas com quebras de linha não
+    são suportados.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV
+        inicio (int): Primeiro byte do intervalo
+        fim (int): Byte seguinte ao último do intervalo
+        tamanho_bloco (int): Número máximo de linhas por bloco
+
+    Yields:
+        List[List[str]]: Linhas do bloco
+    """
+    if tamanho_bloco < 1:
+        raise ValueError("tamanho_bloco deve ser um inteiro positivo")
+
+    with open(caminho_arquivo, 'rb') as arquivo:
+        linhas = chain.from_iterable(io.StringIO(texto, newline='')
+                                     for texto in _textos_intervalo(arquivo, inicio, fim))
+        yield from _agrupar_linhas(csv.reader(linhas), tamanho_bloco)
+
+
+def valores_numericos(linhas: List[List[str]]) -> np.ndarray:
+    """
+    Colunas numéricas (`COLUNAS_NUMERICAS`) de linhas brutas, sem normalizar.
+
+    Args:
+        linhas (List[List[str]]): Linhas brutas do CSV
+
+    Returns:
+        np.ndarray: Matriz (n, 6) float64 de peso, dureza, tamanho, cabo, metal e cod_funcao
+    """
+    return np.array([[linha[c] for c in COLUNAS_NUMERICAS] for linha in linhas],
+                    dtype=np.float64).reshape(-1, len(COLUNAS_NUMERICAS))
+
+
+def codificar_bloco(modelo, linhas: List[List[str]], dtype=np.float64,
+                    com_rotulos: bool = True, incluir_nomes: bool = False) -> BlocoDados:
+    """
+    Converte um bloco de linhas brutas em arrays tipados e codificados.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo com os parâmetros de normalização
+        linhas (List[List[str]]): Linhas brutas do CSV
+        dtype: Tipo de ponto flutuante da matriz de features
+        com_rotulos (bool): Se a última coluna é o rótulo eh_ferramenta
+        incluir_nomes (bool): Se os nomes dos itens devem ser mantidos
+
+    Returns:
+        BlocoDados: Bloco codificado
+    """
+    X = codificar_colunas(modelo, valores_numericos(linhas), dtype)
+    y = np.array([linha[-1] for linha in linhas], dtype=np.int8) if com_rotulos else None
+    nomes = [linha[0] for linha in linhas] if incluir_nomes else None
+    return BlocoDados(X, y, nomes)
+
+
+def iterar_blocos_csv(caminho_arquivo: str, modelo, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                      dtype=np.float64, com_rotulos: bool = True,
+                      incluir_nomes: bool = False) -> Iterator[BlocoDados]:
+    """
+    Lê um CSV em blocos já codificados para treinamento ou avaliação.
+
+    Args:
+        caminho_arquivo (str): Caminho para o arquivo CSV
+        modelo (PerceptronFerramentas): Modelo com os parâmetros de normalização
+        tamanho_bloco (int): Número máximo de linhas por bloco
+        dtype: Tipo de ponto flutuante da matriz de features
+        com_rotulos (bool): Se a última coluna é o rótulo eh_ferramenta
+        incluir_nomes (bool): Se os nomes dos itens devem ser mantidos
+
+    Yields:
+        BlocoDados: Bloco codificado
+    """
+    for linhas in iterar_linhas_csv(caminho_arquivo, tamanho_bloco):
+        yield codificar_bloco(modelo, linhas, dtype, com_rotulos, incluir_nomes)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Classificação em lote de arquivos CSV com um modelo salvo.
+
+O arquivo de entrada é lido em blocos (a memória usada não depende do
+tamanho do arquivo); cada bloco é convertido coluna a coluna em arrays
+NumPy, pontuado com um produto matriz-vetor e escrito com `csv.writer`, sem
+laços Python por campo.
+
+Entrada: mesmo formato do dataset (nome_item, peso_gramas, dureza_escala_1_10,
+tamanho_cm, tem_cabo, material_metalico, preco_reais, cod_funcao e,
+opcionalmente, eh_ferramenta). Um cod_funcao vazio (ou fora de 1-9) é previsto pelo preditor
+de função salvo junto ao modelo, se existir.
+
+Saída: nome_item, cod_funcao, eh_ferramenta (predição) e margem.
+
+Arquivos pequenos (até `LIMITE_ARQUIVO_PEQUENO` bytes) são classificados
+linha a linha pelo núcleo de inferência (`preditor`), sem importar NumPy:
+é o caso de uma chamada por requisição a partir de scripts, em que o tempo
+de importação domina. As predições são as mesmas nos dois caminhos.
+"""
+
+import csv
+import os
+import time
+from typing import List, Optional, Tuple
+
+from preditor import SUFIXO_MODELO_FUNCOES, PreditorFerramentas, PreditorFuncoes, codigo_funcao
+
+
+CABECALHO_SAIDA = ['nome_item', 'cod_funcao', 'eh_ferramenta', 'margem']
+
+# Colunas lidas de cada linha: nome_item até cod_funcao
+N_COLUNAS_ITEM = 8
+
+# O mesmo de carregador_blocos (sem importar NumPy)
+TAMANHO_BLOCO_PADRAO = 65536
+
+# Entradas até esse tamanho (bytes) são classificadas sem NumPy. A conversão do
+# texto domina o tempo, e o núcleo em Python puro mediu-se tão rápido quanto os
+# blocos NumPy em arquivos de até 7 MB; acima disso fica o caminho em blocos
+LIMITE_ARQUIVO_PEQUENO = 8 * 1024 * 1024
+
+
+def converter_bloco(linhas: List[List[str]]) -> Tuple:
+    """
+    Converte um bloco de linhas brutas em nomes e valores numéricos.
+
+    Args:
+        linhas (List[List[str]]): Linhas do CSV (com ou sem a coluna de rótulo)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Nomes (n,) e matriz (n, 6) de peso, dureza,
+            tamanho, cabo, metal e cod_funcao (NaN quando vazio, não numérico ou
+            fora de 1-9, como em `multiclasse.codigo_ausente`)
+    """
+    import numpy as np
+    from motor_vetorizado import COLUNAS_NUMERICAS, N_FUNCOES
+
+    matriz = np.array([linha[:N_COLUNAS_ITEM] for linha in linhas])
+    if matriz.ndim != 2 or matriz.shape[1] < N_COLUNAS_ITEM:
+        raise ValueError(f"Linhas com menos de {N_COLUNAS_ITEM} colunas no bloco")
+
+    valores = np.empty((len(linhas), len(COLUNAS_NUMERICAS)), dtype=np.float64)
+    valores[:, :-1] = matriz[:, COLUNAS_NUMERICAS[:-1]].astype(np.float64)
+    codigos = matriz[:, COLUNAS_NUMERICAS[-1]]
+    vazios = codigos == ''
+    valores[:, -1] = np.nan
+    try:
+        valores[~vazios, -1] = np.trunc(codigos[~vazios].astype(np.float64))
+    except ValueError:
+        # Algum código não numérico: conversão campo a campo, como em `preditor.codigo_funcao`
+        valores[:, -1] = [np.nan if codigo is None else codigo
+                          for codigo in map(codigo_funcao, codigos.tolist())]
+    valores[~((valores[:, -1] >= 1) & (valores[:, -1] <= N_FUNCOES)), -1] = np.nan
+    return matriz[:, 0], valores
+
+
+def classificar_arquivo(modelo, caminho_entrada: str, caminho_saida: str,
+                        modelo_funcoes=None, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> int:
+    """
+    Classifica todas as linhas de um CSV e grava predições e margens.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo treinado
+        caminho_entrada (str): CSV de itens
+        caminho_saida (str): CSV de saída
+        modelo_funcoes (Optional[PerceptronFuncoes]): Preditor de função para cod_funcao vazio
+        tamanho_bloco (int): Linhas processadas por vez
+
+    Returns:
+        int: Número de linhas classificadas
+    """
+    if modelo.pesos is None:
+        raise ValueError("Modelo não foi treinado ainda!")
+
+    import numpy as np
+    from carregador_blocos import iterar_linhas_csv
+    from motor_vetorizado import codificar_colunas, pontuar
+
+    total = 0
+    with open(caminho_saida, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(CABECALHO_SAIDA)
+
+        for linhas in iterar_linhas_csv(caminho_entrada, tamanho_bloco):
+            nomes, valores = converter_bloco(linhas)
+            sem_codigo = np.isnan(valores[:, -1])
+            if sem_codigo.any():
+                if modelo_funcoes is None:
+                    raise ValueError("cod_funcao ausente e nenhum preditor de função carregado")
+                codigos, _ = modelo_funcoes.prever_lote(
+                    codificar_colunas(modelo_funcoes, np.nan_to_num(valores[sem_codigo])))
+                valores[sem_codigo, -1] = codigos
+
+            predicoes, margens = pontuar(codificar_colunas(modelo, valores), modelo.pesos, modelo.bias)
+            escritor.writerows(zip(nomes.tolist(), valores[:, -1].astype(np.int64).tolist(),
+                                   predicoes.tolist(), margens.round(6).tolist()))
+            total += len(linhas)
+
+    return total
+
+
+def classificar_arquivo_simples(preditor: PreditorFerramentas, caminho_entrada: str,
+                                caminho_saida: str, preditor_funcoes: Optional[PreditorFuncoes] = None) -> int:
+    """
+    Classifica um CSV linha a linha com o núcleo de inferência, sem NumPy.
+
+    Mesma saída de `classificar_arquivo`; indicado para arquivos pequenos.
+
+    Args:
+        preditor (PreditorFerramentas): Pesos do modelo salvo
+        caminho_entrada (str): CSV de itens
+        caminho_saida (str): CSV de saída
+        preditor_funcoes (Optional[PreditorFuncoes]): Preditor de função para cod_funcao vazio
+
+    Returns:
+        int: Número de linhas classificadas
+    """
+    total = 0
+    with open(caminho_entrada, 'r', encoding='utf-8', newline='') as entrada, \
+            open(caminho_saida, 'w', encoding='utf-8', newline='') as saida:
+        leitor = csv.reader(entrada)
+        next(leitor, None)  # Pula o cabeçalho
+        escritor = csv.writer(saida)
+        escritor.writerow(CABECALHO_SAIDA)
+
+        for linha in leitor:
+            if not linha:
+                continue
+            if len(linha) < N_COLUNAS_ITEM:
+                raise ValueError(f"Linha com menos de {N_COLUNAS_ITEM} colunas: {linha}")
+            codigo = codigo_funcao(linha[7])
+            if codigo is None:
+                if preditor_funcoes is None:
+                    raise ValueError("cod_funcao ausente e nenhum preditor de função carregado")
+                codigo = preditor_funcoes.prever(linha)
+            predicao, margem = preditor.prever(linha, codigo)
+            escritor.writerow((linha[0], codigo, predicao, round(margem, 6)))
+            total += 1
+
+    return total
+
+
+def classificar_com_modelo_salvo(caminho_modelo: str, caminho_entrada: str, caminho_saida: str,
+                                 tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> Optional[int]:
+    """
+    Carrega um modelo salvo (e o preditor de função, se houver) e classifica um CSV.
+
+    Args:
+        caminho_modelo (str): Modelo salvo com `PerceptronFerramentas.salvar`
+        caminho_entrada (str): CSV de itens
+        caminho_saida (str): CSV de saída
+        tamanho_bloco (int): Linhas processadas por vez
+
+    Returns:
+        Optional[int]: Linhas classificadas ou None se algum arquivo não existir
+    """
+    for caminho in (caminho_modelo, caminho_entrada):
+        if not os.path.exists(caminho):
+            print(f"Erro: Arquivo '{caminho}' não encontrado.")
+            return None
+
+    caminho_funcoes = caminho_modelo + SUFIXO_MODELO_FUNCOES
+    if not os.path.exists(caminho_funcoes):
+        caminho_funcoes = None
+
+    inicio = time.perf_counter()
+    if os.path.getsize(caminho_entrada) <= LIMITE_ARQUIVO_PEQUENO:
+        preditor = PreditorFerramentas.carregar(caminho_modelo)
+        preditor_funcoes = PreditorFuncoes.carregar(caminho_funcoes) if caminho_funcoes else None
+        total = classificar_arquivo_simples(preditor, caminho_entrada, caminho_saida, preditor_funcoes)
+    else:
+        from classificador_ferramentas import PerceptronFerramentas
+        modelo = PerceptronFerramentas.carregar(caminho_modelo)
+        modelo_funcoes = None
+        if caminho_funcoes:
+            from multiclasse import PerceptronFuncoes
+            modelo_funcoes = PerceptronFuncoes.carregar(caminho_funcoes)
+        total = classificar_arquivo(modelo, caminho_entrada, caminho_saida, modelo_funcoes, tamanho_bloco)
+    segundos = time.perf_counter() - inicio
+    print(f"{total} itens classificados em {segundos:.2f} s "
+          f"({total / max(segundos, 1e-9):,.0f} itens/s): {caminho_saida}")
+    return total
@@ -1,48 +1,298 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 import csv
+import contextlib
 import random
 import json
+import struct
 import datetime
+from array import array
+from collections import OrderedDict
 from typing import List, Tuple, Optional
 
+from historico import HistoricoTreinamento
+from preditor import (MAGICO_MODELO, NORMALIZACAO_PADRAO, SUFIXO_MODELO_FUNCOES, VERSAO_FORMATO_MODELO,
+                      ler_arquivo_modelo)
+
+
+MODOS_TREINAMENTO = ('padrao', 'pocket', 'averaged')
+
+# Cache de predições usado na interface de classificação manual
+TAMANHO_CACHE_INTERFACE = 1024
+
+# Dimensões das features (as mesmas de motor_vetorizado, sem importar NumPy)
+N_CARACTERISTICAS_FISICAS = 5
+N_CARACTERISTICAS = 14
+
+
+class ItemCodificado:
+    """
+    Features de um item em forma compacta.
+
+    Guarda apenas as 5 características físicas e a posição do único 1 do
+    one-hot da função, em vez do vetor de 14 posições: o produto escalar e a
+    atualização dos pesos tocam só 5 + 1 pesos.
+
+    Attributes:
+        fisicas (Tuple[float, ...]): Peso, dureza e tamanho normalizados, tem_cabo e material_metalico
+        indice_funcao (int): Posição do peso da função (5-13) ou -1 se o código for inválido
+    """
+
+    __slots__ = ('fisicas', 'indice_funcao')
+
+    def __init__(self, fisicas: Tuple[float, ...], indice_funcao: int):
+        self.fisicas = fisicas
+        self.indice_funcao = indice_funcao
+
+    def margem(self, pesos: List[float], bias: float) -> float:
+        """Saída linear; igual, bit a bit, ao produto escalar com o vetor denso."""
+        x0, x1, x2, x3, x4 = self.fisicas
+        saida_linear = x0 * pesos[0] + x1 * pesos[1] + x2 * pesos[2] + x3 * pesos[3] + x4 * pesos[4]
+        if self.indice_funcao >= 0:
+            saida_linear += pesos[self.indice_funcao]
+        return saida_linear + bias
+
+    def densa(self) -> List[float]:
+        """Vetor denso de 14 features (formato de `preparar_features`)."""
+        features = list(self.fisicas) + [0.0] * (N_CARACTERISTICAS - N_CARACTERISTICAS_FISICAS)
+        if self.indice_funcao >= 0:
+            features[self.indice_funcao] = 1.0
+        return features
+
+
+class DadosCompactos:
+    """
+    Features de várias linhas em arrays tipados (motor 'python').
+
+    Cada característica física fica em um `array('d')` e a posição da função
+    em um `array('b')`: 41 bytes por linha, contra quase 300 de uma lista de
+    14 floats. Iterar produz tuplas (x0, x1, x2, x3, x4, indice_funcao).
+
+    Attributes:
+        colunas (Tuple[array, ...]): Uma coluna por característica física
+        indices_funcao (array): Posição do peso da função de cada linha (-1 = nenhuma)
+    """
+
+    __slots__ = ('colunas', 'indices_funcao')
+
+    def __init__(self):
+        self.colunas = tuple(array('d') for _ in range(N_CARACTERISTICAS_FISICAS))
+        self.indices_funcao = array('b')
+
+    def adicionar(self, item: ItemCodificado) -> None:
+        """Acrescenta um item ao final."""
+        for coluna, valor in zip(self.colunas, item.fisicas):
+            coluna.append(valor)
+        self.indices_funcao.append(item.indice_funcao)
+
+    def __len__(self) -> int:
+        return len(self.indices_funcao)
+
+    def __getitem__(self, i: int) -> ItemCodificado:
+        return ItemCodificado(tuple(coluna[i] for coluna in self.colunas), self.indices_funcao[i])
+
+    def __iter__(self):
+        return zip(*self.colunas, self.indices_funcao)
+
+    def em_ordem(self, ordem):
+        """Itera as linhas na ordem dada (mesmas tuplas de `__iter__`), sem copiar as colunas.
+
+        `ordem` pode ser uma lista ou um array NumPy de índices inteiros.
+        """
+        return zip(*(map(coluna.__getitem__, ordem) for coluna in self.colunas),
+                   map(self.indices_funcao.__getitem__, ordem))
+
+
+class _TreinadorListas:
+    """
+    Regra do perceptron amostra a amostra sobre `DadosCompactos` (motor 'python').
+
+    Mantém a mesma interface de `motor_vetorizado.TreinadorVetorizado`,
+    incluindo o contador `n_atualizacoes` e o gancho opcional
+    `ao_atualizar(posicao, n_errados)`.
+    """
+
+    def __init__(self, pesos: List[float], bias: float, taxa_aprendizado: float,
+                 media: bool = False):
+        self.pesos = list(pesos)
+        self.bias = bias
+        self.taxa_aprendizado = taxa_aprendizado
+        self.media = media
+        self._n_vistos = 0
+        self._soma_atualizacoes = [0.0] * len(self.pesos)
+        self._soma_atualizacoes_bias = 0.0
+        self.n_atualizacoes = 0
+        self.ao_atualizar = None
+
+    def processar(self, X: DadosCompactos, y, ordem=None) -> int:
+        """
+        Executa uma época da regra do perceptron amostra a amostra.
+
+        Como as features zeradas do one-hot não alteram a soma nem os pesos,
+        o resultado é idêntico ao da regra sobre os vetores densos.
+
+        Args:
+            X (DadosCompactos): Features compactas
+            y: Rótulos (sequência de 0/1)
+            ordem: Índices na ordem de visita, lista ou array (None = ordem das linhas)
+
+        Returns:
+            int: Número de amostras classificadas erradas na época
+        """
+        erros = 0
+        p = self.pesos
+        ao_atualizar = self.ao_atualizar
+        n_amostras = len(y)
+        if ordem is None:
+            linhas = zip(X, y)
+        else:
+            # Lê X e y pela permutação, sem montar cópias reordenadas
+            linhas = zip(X.em_ordem(ordem), map(y.__getitem__, ordem))
+
+        for i, ((x0, x1, x2, x3, x4, k), rotulo) in enumerate(linhas):
+            # Predição (5 pesos físicos + o peso da função)
+            saida_linear = x0 * p[0] + x1 * p[1] + x2 * p[2] + x3 * p[3] + x4 * p[4]
+            if k >= 0:
+                saida_linear += p[k]
+            saida_linear += self.bias
+            predicao = 1 if saida_linear >= 0 else 0
+            erro = rotulo - predicao
+            
+            # Atualiza pesos se há erro (só os das features não nulas)
+            if erro != 0:
+                erros += 1
+                # Regra de aprendizado do perceptron
+                passo = self.taxa_aprendizado * erro
+                p[0] += passo * x0
+                p[1] += passo * x1
+                p[2] += passo * x2
+                p[3] += passo * x3
+                p[4] += passo * x4
+                if k >= 0:
+                    p[k] += passo
+                self.bias += passo
+
+                if self.media:
+                    instante = self._n_vistos + i
+                    soma = self._soma_atualizacoes
+                    for j, valor in enumerate((x0, x1, x2, x3, x4)):
+                        soma[j] += instante * (passo * valor)
+                    if k >= 0:
+                        soma[k] += instante * passo
+                    self._soma_atualizacoes_bias += instante * passo
+                if ao_atualizar is not None:
+                    ao_atualizar(i, 1)
+
+        self._n_vistos += n_amostras
+        self.n_atualizacoes += erros
+        return erros
+
+    def pesos_atuais(self) -> Tuple[List[float], float]:
+        """Retorna uma cópia dos pesos e o bias atuais."""
+        return list(self.pesos), self.bias
+
+    def pesos_medios(self) -> Tuple[List[float], float]:
+        """Retorna a média dos pesos e do bias sobre todas as amostras vistas."""
+        if self._n_vistos == 0:
+            return list(self.pesos), self.bias
+        pesos = [p - u / self._n_vistos for p, u in zip(self.pesos, self._soma_atualizacoes)]
+        return pesos, self.bias - self._soma_atualizacoes_bias / self._n_vistos
+
+    @staticmethod
+    def contar_erros(X: DadosCompactos, y, pesos: List[float], bias: float) -> int:
+        """Conta as amostras classificadas erradas por pesos fixos."""
+        erros = 0
+        for (x0, x1, x2, x3, x4, k), yi in zip(X, y):
+            saida_linear = x0 * pesos[0] + x1 * pesos[1] + x2 * pesos[2] + x3 * pesos[3] + x4 * pesos[4]
+            if k >= 0:
+                saida_linear += pesos[k]
+            if (1 if saida_linear + bias >= 0 else 0) != yi:
+                erros += 1
+        return erros
+
 
 class PerceptronFerramentas:
-    """    
+    """
+    Perceptron para classificação de itens como ferramenta ou não-ferramenta.
+
     Attributes:
         taxa_aprendizado (float): Taxa de aprendizado do perceptron
         max_iteracoes (int): Número máximo de iterações de treinamento
+        semente (Optional[int]): Semente da inicialização aleatória dos pesos
+        modo (str): 'padrao', 'pocket' (melhores pesos vistos) ou 'averaged' (pesos médios)
+        paciencia (Optional[int]): Épocas sem queda no número de erros antes de parar
+        embaralhar (bool): Visita as amostras em uma permutação nova a cada época
+        estratificar (Optional[str]): Estratos intercalados na permutação ('eh_ferramenta',
+            'cod_funcao' ou 'ambos')
+        semente_treinamento (Optional[int]): Semente efetivamente usada no último treinamento
+            (sorteada quando `semente` é None)
         pesos (List[float]): Pesos das características aprendidos
         bias (float): Bias do perceptron
-        hist    # Carrega dataset de treinamento
-    dados_treino = carregar_dataset_csv('data/dataset_ferramentas.csv')
-    if dados_treino is None:
-        print("❌ Erro: Não foi possível carregar o dataset de treinamento.")
-        return_treinamento (List[dict]): Histórico do processo de treinamento
+        historico_treinamento (HistoricoTreinamento): Erros e acurácia por época
         legenda_funcoes (dict): Mapeamento código -> descrição das funções
+        callbacks (list): Ganchos de treinamento (ver `instrumentacao.CallbacksTreinamento`)
+        acertos_cache (int): Predições de `prever_item` servidas pelo cache
+        falhas_cache (int): Predições de `prever_item` calculadas com o cache ativo
     """
     
-    def __init__(self, taxa_aprendizado: float = 0.1, max_iteracoes: int = 1000):
+    def __init__(self, taxa_aprendizado: float = 0.1, max_iteracoes: int = 1000,
+                 semente: Optional[int] = None, modo: str = 'padrao',
+                 paciencia: Optional[int] = None, callbacks: Optional[list] = None,
+                 tamanho_cache: int = 0, embaralhar: bool = False,
+                 estratificar: Optional[str] = None):
         """
         Inicializa o perceptron com os parâmetros especificados.
         
         Args:
             taxa_aprendizado (float): Taxa de aprendizado (padrão: 0.1)
             max_iteracoes (int): Máximo de iterações (padrão: 1000)
+            semente (Optional[int]): Semente da inicialização dos pesos (padrão: aleatória)
+            modo (str): Pesos finais: 'padrao' (última época), 'pocket' (menor número
+                de erros no treino) ou 'averaged' (média dos pesos ao longo do treino)
+            paciencia (Optional[int]): Para o treinamento após esse número de épocas
+                sem reduzir o menor número de erros por época (padrão: sem parada antecipada)
+            callbacks (Optional[list]): Ganchos chamados durante o treinamento; com
+                algum gancho registrado, as mensagens de progresso não são impressas
+            tamanho_cache (int): Máximo de predições guardadas no cache LRU de
+                `prever_item` (padrão: 0, sem cache)
+            embaralhar (bool): Visita as amostras em uma permutação nova a cada
+                época, gerada a partir da semente (padrão: ordem do arquivo)
+            estratificar (Optional[str]): Embaralha dentro de cada estrato
+                ('eh_ferramenta', 'cod_funcao' ou 'ambos') e intercala os estratos
+                na proporção do seu tamanho; implica `embaralhar`
         """
+        if modo not in MODOS_TREINAMENTO:
+            raise ValueError(f"Modo de treinamento desconhecido: {modo}")
+        if estratificar is not None:
+            from amostragem import ESTRATIFICACOES
+            if estratificar not in ESTRATIFICACOES:
+                raise ValueError(f"Estratificação desconhecida: {estratificar}")
+        if paciencia is not None and paciencia < 1:
+            raise ValueError("paciencia deve ser um inteiro positivo")
+        if max_iteracoes < 1:
+            raise ValueError("max_iteracoes deve ser um inteiro positivo")
+        
         self.taxa_aprendizado = taxa_aprendizado
         self.max_iteracoes = max_iteracoes
+        self.semente = semente
+        self.modo = modo
+        self.paciencia = paciencia
+        self.embaralhar = embaralhar or estratificar is not None
+        self.estratificar = estratificar
+        self.semente_treinamento = None
+        self._cache_predicoes = OrderedDict()
+        self.acertos_cache = 0
+        self.falhas_cache = 0
+        self.configurar_cache_predicoes(tamanho_cache)
         self.pesos = None
         self.bias = None
-        self.historico_treinamento = []
+        self.historico_treinamento = HistoricoTreinamento()
+        self.callbacks = list(callbacks) if callbacks else []
         
-        # Parâmetros de normalização baseados no dataset
-        self.normalizacao_params = {
-            'peso': {'min': 7, 'max': 800},      # Atualizado com base nos dados reais
-            'dureza': {'min': 1, 'max': 10},
-            'tamanho': {'min': 3, 'max': 45}
-        }
+        # Parâmetros de normalização padrão (ver `ajustar_normalizacao`)
+        self.normalizacao_params = json.loads(json.dumps(NORMALIZACAO_PADRAO))
         
         # Legenda das funções (código -> descrição)
         self.legenda_funcoes = {
@@ -57,6 +307,116 @@ class PerceptronFerramentas:
             9: "Outros - Outros usos diversos"
         }
     
+    @property
+    def pesos(self) -> Optional[List[float]]:
+        """Pesos das características; atribuir novos pesos esvazia o cache de predições."""
+        return self._pesos
+    
+    @pesos.setter
+    def pesos(self, valor: Optional[List[float]]) -> None:
+        self._pesos = valor
+        self._cache_predicoes.clear()
+    
+    @property
+    def normalizacao_params(self) -> dict:
+        """Parâmetros de normalização; atribuir novos parâmetros esvazia o cache de predições."""
+        return self._normalizacao_params
+    
+    @normalizacao_params.setter
+    def normalizacao_params(self, valor: dict) -> None:
+        self._normalizacao_params = valor
+        self._cache_predicoes.clear()
+    
+    @property
+    def bias(self) -> Optional[float]:
+        """Bias do perceptron; atribuir um novo bias esvazia o cache de predições."""
+        return self._bias
+    
+    @bias.setter
+    def bias(self, valor: Optional[float]) -> None:
+        self._bias = valor
+        self._cache_predicoes.clear()
+    
+    def configurar_cache_predicoes(self, tamanho: int) -> None:
+        """
+        Ativa (tamanho > 0) ou desativa (0) o cache LRU de `prever_item`.
+
+        A chave é a tupla dos campos do item usados na codificação (peso,
+        dureza, tamanho, cabo, metal e código de função), então um acerto
+        dispensa a conversão e a normalização. O cache é esvaziado sempre que
+        `pesos`, `bias` ou `normalizacao_params` recebem novos valores
+        (treino, `atualizar`, `carregar`, `ajustar_normalizacao`); alterações
+        feitas dentro da lista de pesos ou do dicionário de normalização
+        exigem `limpar_cache_predicoes`.
+        
+        Args:
+            tamanho (int): Máximo de predições guardadas
+        """
+        if tamanho < 0:
+            raise ValueError("tamanho do cache deve ser zero ou positivo")
+        self.tamanho_cache = tamanho
+        self.limpar_cache_predicoes()
+    
+    def limpar_cache_predicoes(self) -> None:
+        """Esvazia o cache de predições (os contadores são mantidos)."""
+        self._cache_predicoes.clear()
+    
+    def estatisticas_cache(self) -> dict:
+        """Tamanho, ocupação, acertos, falhas e taxa de acerto do cache de predições."""
+        consultas = self.acertos_cache + self.falhas_cache
+        return {
+            'tamanho_maximo': self.tamanho_cache,
+            'ocupacao': len(self._cache_predicoes),
+            'acertos': self.acertos_cache,
+            'falhas': self.falhas_cache,
+            'taxa_acerto': self.acertos_cache / consultas if consultas else 0.0
+        }
+    
+    def _informar(self, mensagem: str) -> None:
+        """Mensagem de progresso do treinamento (suprimida quando há ganchos registrados)."""
+        if not self.callbacks:
+            print(mensagem)
+    
+    def _fase(self, nome: str):
+        """Contexto que notifica os ganchos do início e do fim de uma fase."""
+        if not self.callbacks:
+            return contextlib.nullcontext()
+        from instrumentacao import fase_callbacks
+        return fase_callbacks(self.callbacks, self, nome)
+    
+    def ajustar_normalizacao(self, caminho_arquivo: str, n_processos: int = 1,
+                             media_desvio: bool = False, tamanho_bloco: int = 65536,
+                             usar_cache: bool = True, hash_fonte: Optional[str] = None) -> None:
+        """
+        Ajusta `normalizacao_params` ao mínimo e máximo do CSV de treinamento.
+
+        Deve ser chamado antes de codificar os dados. Os parâmetros ajustados
+        são salvos com o modelo (`salvar`) e reutilizados na inferência.
+        
+        Args:
+            caminho_arquivo (str): CSV de treinamento
+            n_processos (int): Processos que leem partes do arquivo em paralelo
+            media_desvio (bool): Guarda também média e desvio padrão de cada característica
+            tamanho_bloco (int): Linhas lidas por vez
+            usar_cache (bool): Lê os parâmetros do cache de features do CSV
+                (`cache_features`), quando válido, em vez de reler o arquivo
+            hash_fonte (Optional[str]): SHA-256 do CSV, se já calculado (evita
+                reler o arquivo só para validar o cache)
+        """
+        from normalizacao import ajustar_normalizacao
+        
+        with self._fase('ajustar_normalizacao'):
+            parametros = None
+            if usar_cache:
+                from cache_features import normalizacao_do_cache
+                parametros = normalizacao_do_cache(caminho_arquivo, media_desvio, hash_fonte=hash_fonte)
+            if parametros is None:
+                parametros = ajustar_normalizacao(caminho_arquivo, tamanho_bloco, n_processos,
+                                                  media_desvio)
+            self.normalizacao_params = parametros
+        for tipo, params in self.normalizacao_params.items():
+            self._informar(f"Normalização de {tipo}: {params['min']:g} a {params['max']:g}")
+    
     def _funcao_ativacao(self, x: float) -> int:
         """Função de ativação degrau."""
         return 1 if x >= 0 else 0
@@ -105,6 +465,18 @@ class PerceptronFerramentas:
         Returns:
             List[float]: Vetor de features preparado
         """
+        return self.preparar_features_compactas(linha_dados).densa()
+    
+    def preparar_features_compactas(self, linha_dados: List) -> ItemCodificado:
+        """
+        Prepara as features de uma linha de dados em forma compacta.
+        
+        Args:
+            linha_dados (List): [nome, peso, dureza, tamanho, cabo, metal, preco, cod_funcao, ...]
+            
+        Returns:
+            ItemCodificado: Características físicas e posição do one-hot da função
+        """
         # Características físicas normalizadas
         peso_norm = self.normalizar_valor(float(linha_dados[1]), 'peso')
         dureza_norm = self.normalizar_valor(float(linha_dados[2]), 'dureza')
@@ -112,15 +484,12 @@ class PerceptronFerramentas:
         tem_cabo = float(linha_dados[4])
         material_metalico = float(linha_dados[5])
         
-        # Características da função (one-hot encoding)
+        # Característica da função: posição do 1 no one-hot (códigos fora de 1-9 ficam zerados)
         codigo_funcao = int(linha_dados[7])
-        funcao_one_hot = self.codificar_funcao_one_hot(codigo_funcao)
+        indice_funcao = N_CARACTERISTICAS_FISICAS - 1 + codigo_funcao if 1 <= codigo_funcao <= 9 else -1
         
-        # Combina todas as features
-        features = [peso_norm, dureza_norm, tamanho_norm, tem_cabo, material_metalico]
-        features.extend(funcao_one_hot)
-        
-        return features
+        return ItemCodificado((peso_norm, dureza_norm, tamanho_norm, tem_cabo, material_metalico),
+                              indice_funcao)
     
     def preparar_dados_treinamento(self, dados_brutos: List[List]) -> Tuple[List[List[float]], List[int]]:
         """
@@ -142,66 +511,345 @@ class PerceptronFerramentas:
         
         return X, y
     
-    def treinar(self, dados_brutos: List[List]) -> None:
+    def preparar_dados_compactos(self, dados_brutos: List[List]) -> Tuple[DadosCompactos, array]:
+        """
+        Prepara os dados brutos em forma compacta (motor 'python').
+        
+        Args:
+            dados_brutos (List[List]): Dados brutos do dataset
+            
+        Returns:
+            Tuple[DadosCompactos, array]: Features compactas e rótulos (array 'b')
+        """
+        X = DadosCompactos()
+        for linha in dados_brutos:
+            X.adicionar(self.preparar_features_compactas(linha))
+        y = array('b', (int(linha[-1]) for linha in dados_brutos))  # eh_ferramenta
+        return X, y
+    
+    def treinar(self, dados_brutos: List[List], motor: str = 'python',
+                tamanho_lote: Optional[int] = None, dtype: str = 'float64') -> None:
         """
         Treina o perceptron com os dados fornecidos.
+
+        O motor 'numpy' guarda as amostras em uma matriz contígua e produz os
+        mesmos pesos do motor 'python' para a mesma semente quando
+        `tamanho_lote` é None. Com `tamanho_lote` definido, os pesos são
+        atualizados uma vez por bloco de amostras (batch perceptron).
         
         Args:
             dados_brutos (List[List]): Dados brutos do dataset de treinamento
+            motor (str): 'python' (listas) ou 'numpy' (vetorizado)
+            tamanho_lote (Optional[int]): Amostras por atualização (apenas motor 'numpy')
+            dtype (str): 'float32' ou 'float64' para a matriz do motor 'numpy'
         """
-        print("Iniciando treinamento do Perceptron ...")
+        if motor not in ('python', 'numpy'):
+            raise ValueError(f"Motor de treinamento desconhecido: {motor}")
+        if tamanho_lote is not None and motor != 'numpy':
+            raise ValueError("Treinamento em lotes requer motor='numpy'")
+
+        if motor == 'numpy':
+            from motor_vetorizado import codificar_matriz
+            with self._fase('codificar'):
+                X, y = codificar_matriz(self, dados_brutos, dtype)
+            self.treinar_matriz(X, y, tamanho_lote)
+            return
+
+        self._informar("Iniciando treinamento do Perceptron ...")
         
         # Prepara os dados
-        X, y = self.preparar_dados_treinamento(dados_brutos)
-        
+        with self._fase('codificar'):
+            X, y = self.preparar_dados_compactos(dados_brutos)
         n_amostras = len(X)
-        n_caracteristicas = len(X[0])
-        
-        print(f"Dados de treinamento: {n_amostras} amostras, {n_caracteristicas} características")
-        print(f"- Características físicas: 5")
-        print(f"- Características funcionais (one-hot): 9")
+        n_caracteristicas = N_CARACTERISTICAS
+        self._mostrar_dimensoes(n_amostras, n_caracteristicas)
         
         # Inicializa pesos e bias aleatoriamente
-        self.pesos = [random.uniform(-0.1, 0.1) for _ in range(n_caracteristicas)]
-        self.bias = random.uniform(-0.1, 0.1)
+        self._inicializar_pesos(n_caracteristicas)
+        treinador = _TreinadorListas(self.pesos, self.bias, self.taxa_aprendizado,
+                                     media=self.modo == 'averaged')
+        amostrador = None
+        if self.embaralhar:
+            from amostragem import estratos_compactos
+            amostrador = self._criar_amostrador(
+                n_amostras, lambda: estratos_compactos(X.indices_funcao, y, self.estratificar))
+        
+        def executar_epoca():
+            ordem = amostrador.ordem_epoca() if amostrador is not None else None
+            return treinador.processar(X, y, ordem), n_amostras
+        
+        self._executar_epocas(treinador, executar_epoca,
+                              lambda pesos, bias: treinador.contar_erros(X, y, pesos, bias))
+    
+    def treinar_matriz(self, X, y, tamanho_lote: Optional[int] = None,
+                       embaralhar: Optional[bool] = None, indices=None) -> None:
+        """
+        Treina o perceptron a partir de features já codificadas (motor NumPy).
+
+        Aceita arrays comuns ou mapeados em memória (ver `cache_features`);
+        o treinamento usa o dtype de X.
+        
+        Args:
+            X: Matriz (n, 14) de features
+            y: Rótulos eh_ferramenta (n,)
+            tamanho_lote (Optional[int]): Amostras por atualização (None = por amostra)
+            embaralhar (Optional[bool]): Visita as amostras em uma permutação nova a cada
+                época, gerada a partir da semente do modelo (None = `self.embaralhar`)
+            indices (Optional[np.ndarray]): Linhas de X usadas no treino, na ordem de
+                visita (None = todas). X não é copiado: as épocas percorrem os índices.
+        """
+        import numpy as np
+        from motor_vetorizado import TreinadorVetorizado, contar_erros
+
+        self._informar("Iniciando treinamento do Perceptron ...")
+        
+        n_amostras, n_caracteristicas = X.shape
+        if indices is not None:
+            indices = np.asarray(indices, dtype=np.int64)
+            n_amostras = len(indices)
+        self._mostrar_dimensoes(n_amostras, n_caracteristicas)
+        
+        self._inicializar_pesos(n_caracteristicas)
+        treinador = TreinadorVetorizado(self.pesos, self.bias, self.taxa_aprendizado,
+                                        tamanho_lote, X.dtype, media=self.modo == 'averaged')
+        amostrador = None
+        if self.embaralhar if embaralhar is None else embaralhar:
+            from amostragem import estratos_matriz
+            amostrador = self._criar_amostrador(
+                n_amostras, lambda: estratos_matriz(X, y, self.estratificar)[
+                    slice(None) if indices is None else indices])
+        y = y.astype(X.dtype)
+        
+        def executar_epoca():
+            ordem = amostrador.ordem_epoca() if amostrador is not None else None
+            if indices is not None:
+                ordem = indices if ordem is None else indices[ordem]
+            return treinador.processar(X, y, ordem), n_amostras
+        
+        self._executar_epocas(treinador, executar_epoca,
+                              lambda pesos, bias: contar_erros(X, y, pesos, bias, indices=indices))
+    
+    def _mostrar_dimensoes(self, n_amostras: int, n_caracteristicas: int) -> None:
+        """Exibe as dimensões dos dados de treinamento."""
+        self._informar(f"Dados de treinamento: {n_amostras} amostras, {n_caracteristicas} características")
+        self._informar(f"- Características físicas: 5")
+        self._informar(f"- Características funcionais (one-hot): 9")
+    
+    def _criar_amostrador(self, n_amostras: int, calcular_estratos):
+        """
+        Amostrador das épocas embaralhadas, com a semente do treinamento.
+
+        Deve ser chamado depois de `_inicializar_pesos`.
+
+        Args:
+            n_amostras (int): Número de amostras
+            calcular_estratos: Função sem argumentos que retorna os rótulos de estrato
+                (só chamada com `estratificar` definido)
+        """
+        from amostragem import AmostradorEpocas
+        estratos = calcular_estratos() if self.estratificar is not None else None
+        descricao = f", estratos por {self.estratificar}" if estratos is not None else ""
+        self._informar(f"Ordem embaralhada a cada época (semente {self.semente_treinamento}{descricao})")
+        return AmostradorEpocas(n_amostras, self.semente_treinamento, estratos)
+    
+    def _inicializar_pesos(self, n_caracteristicas: int) -> None:
+        """
+        Inicializa pesos e bias aleatoriamente a partir da semente do modelo.
+
+        Sem semente, sorteia uma e a guarda em `semente_treinamento`, para que
+        o treinamento possa ser reproduzido.
+        """
+        self.semente_treinamento = self.semente if self.semente is not None else random.randrange(2 ** 32)
+        gerador = random.Random(self.semente_treinamento)
+        self.pesos = [gerador.uniform(-0.1, 0.1) for _ in range(n_caracteristicas)]
+        self.bias = gerador.uniform(-0.1, 0.1)
+    
+    def _executar_epocas(self, treinador, executar_epoca, contar_erros) -> None:
+        """
+        Laço de épocas comum aos motores de treinamento.
+
+        Aplica o modo de treinamento e a parada antecipada por paciência,
+        notifica os ganchos registrados e, no final, copia os pesos escolhidos
+        do treinador para o modelo.
+        
+        Args:
+            treinador: Treinador com `pesos_atuais()` e `pesos_medios()`
+            executar_epoca: Função sem argumentos que executa uma época e
+                retorna (erros, n_amostras)
+            contar_erros: Função (pesos, bias) -> erros em todo o treino
+        """
+        with self._fase('treinar'):
+            try:
+                pesos, bias, n_amostras = self._laco_epocas(treinador, executar_epoca, contar_erros)
+            finally:
+                self.historico_treinamento.descarregar()
+        self.pesos = [float(peso) for peso in pesos]
+        self.bias = float(bias)
+        
+        # Estatísticas finais
+        final_accuracy = self.historico_treinamento[-1]['acuracia']
+        self._informar(f"Acurácia final no treinamento: {final_accuracy:.1f}%")
+        if self.modo != 'padrao' and not self.callbacks:
+            acuracia_modelo = ((n_amostras - contar_erros(self.pesos, self.bias)) / n_amostras) * 100
+            print(f"Acurácia dos pesos finais ({self.modo}): {acuracia_modelo:.1f}%")
+    
+    def _laco_epocas(self, treinador, executar_epoca, contar_erros) -> Tuple:
+        """Executa as épocas de `_executar_epocas`; retorna (pesos, bias, n_amostras) finais."""
+        bolso = None  # (erros, pesos, bias) dos melhores pesos vistos no modo pocket
+        menor_erros = None
+        epocas_sem_melhora = 0
+        convergiu = False
+        callbacks = self.callbacks
+        historico = self.historico_treinamento
+        historico.reservar(self.max_iteracoes)
+        
+        if callbacks:
+            from instrumentacao import sobrescreve_ao_atualizar
+            ganchos_atualizacao = [callback for callback in callbacks if sobrescreve_ao_atualizar(callback)]
+            if ganchos_atualizacao:
+                def ao_atualizar(posicao, n_errados):
+                    for callback in ganchos_atualizacao:
+                        callback.ao_atualizar(self, posicao, n_errados)
+                treinador.ao_atualizar = ao_atualizar
         
-        # Treinamento
         for iteracao in range(self.max_iteracoes):
-            erros = 0
+            for callback in callbacks:
+                callback.ao_iniciar_epoca(self, iteracao + 1)
+            atualizacoes_antes = treinador.n_atualizacoes
             
-            for i in range(n_amostras):
-                # Predição
-                saida_linear = self._produto_escalar(X[i], self.pesos) + self.bias
-                predicao = self._funcao_ativacao(saida_linear)
-                erro = y[i] - predicao
-                
-                # Atualiza pesos se há erro
-                if erro != 0:
-                    erros += 1
-                    # Regra de aprendizado do perceptron
-                    for j in range(n_caracteristicas):
-                        self.pesos[j] += self.taxa_aprendizado * erro * X[i][j]
-                    self.bias += self.taxa_aprendizado * erro
+            erros, n_amostras = executar_epoca()
             
             # Registra histórico
-            acuracia_iter = ((n_amostras - erros) / n_amostras) * 100
-            self.historico_treinamento.append({
-                'iteracao': iteracao + 1,
-                'erros': erros,
-                'acuracia': acuracia_iter
-            })
+            historico.registrar(erros, ((n_amostras - erros) / n_amostras) * 100)
+            for callback in callbacks:
+                callback.ao_terminar_epoca(self, iteracao + 1, erros, n_amostras,
+                                           treinador.n_atualizacoes - atualizacoes_antes)
             
             # Convergência alcançada
             if erros == 0:
-                print(f"Convergência alcançada na iteração {iteracao + 1}")
+                self._informar(f"Convergência alcançada na iteração {iteracao + 1}")
+                for callback in callbacks:
+                    callback.ao_convergir(self, iteracao + 1)
+                convergiu = True
                 break
+            
+            if self.modo == 'pocket':
+                pesos, bias = treinador.pesos_atuais()
+                erros_pesos = contar_erros(pesos, bias)
+                if bolso is None or erros_pesos < bolso[0]:
+                    bolso = (erros_pesos, pesos, bias)
+            
+            # Parada antecipada: número de erros por época estagnado
+            if self.paciencia is not None:
+                if menor_erros is None or erros < menor_erros:
+                    menor_erros = erros
+                    epocas_sem_melhora = 0
+                else:
+                    epocas_sem_melhora += 1
+                    if epocas_sem_melhora >= self.paciencia:
+                        self._informar(f"Parada antecipada na iteração {iteracao + 1} "
+                                       f"({self.paciencia} épocas sem reduzir os erros)")
+                        break
         
         else:
-            print(f"Treinamento completo após {self.max_iteracoes} iterações")
+            self._informar(f"Treinamento completo após {self.max_iteracoes} iterações")
         
-        # Estatísticas finais
-        final_accuracy = self.historico_treinamento[-1]['acuracia']
-        print(f"Acurácia final no treinamento: {final_accuracy:.1f}%")
+        # Pesos finais conforme o modo
+        if self.modo == 'pocket' and not convergiu:
+            _, pesos, bias = bolso
+        elif self.modo == 'averaged':
+            pesos, bias = treinador.pesos_medios()
+        else:
+            pesos, bias = treinador.pesos_atuais()
+        return pesos, bias, n_amostras
+    
+    def treinar_em_blocos(self, caminho_arquivo: str, tamanho_bloco: int = 65536,
+                          tamanho_lote: Optional[int] = None, dtype: str = 'float64') -> None:
+        """
+        Treina o perceptron lendo o CSV em blocos a cada época.
+
+        Cada época relê o arquivo bloco a bloco, então a memória usada depende
+        de `tamanho_bloco` e não do tamanho do dataset. Os pesos resultantes
+        são os mesmos de `treinar(..., motor='numpy')` com a mesma semente.
+        
+        Args:
+            caminho_arquivo (str): Caminho para o CSV de treinamento
+            tamanho_bloco (int): Linhas lidas e codificadas por vez
+            tamanho_lote (Optional[int]): Amostras por atualização (None = por amostra)
+            dtype (str): 'float32' ou 'float64' para os blocos
+        """
+        from motor_vetorizado import N_CARACTERISTICAS, TreinadorVetorizado, contar_erros
+        from carregador_blocos import iterar_blocos_csv
+
+        if self.embaralhar:
+            raise ValueError("Embaralhamento requer os dados em memória (treinar ou treinar_matriz)")
+        self._informar("Iniciando treinamento do Perceptron em blocos ...")
+        self._informar(f"Arquivo: {caminho_arquivo} (blocos de {tamanho_bloco} linhas)")
+        
+        self._inicializar_pesos(N_CARACTERISTICAS)
+        treinador = TreinadorVetorizado(self.pesos, self.bias, self.taxa_aprendizado,
+                                        tamanho_lote, dtype, media=self.modo == 'averaged')
+
+        def executar_epoca():
+            erros = 0
+            n_amostras = 0
+            for bloco in iterar_blocos_csv(caminho_arquivo, self, tamanho_bloco, dtype):
+                erros += treinador.processar(bloco.X, bloco.y)
+                n_amostras += len(bloco.y)
+            if n_amostras == 0:
+                raise ValueError(f"Arquivo sem amostras: {caminho_arquivo}")
+            return erros, n_amostras
+
+        def contar_erros_arquivo(pesos, bias):
+            return sum(contar_erros(bloco.X, bloco.y, pesos, bias)
+                       for bloco in iterar_blocos_csv(caminho_arquivo, self, tamanho_bloco, dtype))
+
+        self._executar_epocas(treinador, executar_epoca, contar_erros_arquivo)
+    
+    def atualizar(self, itens: List[List], epocas: int = 1, motor: str = 'python') -> int:
+        """
+        Aprendizado incremental: aplica a regra do perceptron apenas aos novos itens.
+
+        Parte dos pesos e bias atuais (treinados ou carregados com `carregar`),
+        então o custo depende só do número de itens novos. Cada passada é
+        registrada no histórico de treinamento. As atualizações seguem a regra
+        padrão mesmo nos modos 'pocket' e 'averaged'.
+        
+        Args:
+            itens (List[List]): Novos itens rotulados (mesmo formato do dataset)
+            epocas (int): Passadas sobre os novos itens (para antes se não houver erros)
+            motor (str): 'python' (listas) ou 'numpy' (vetorizado)
+            
+        Returns:
+            int: Erros na última passada
+        """
+        if self.pesos is None:
+            raise ValueError("Modelo não foi treinado ainda!")
+        if motor not in ('python', 'numpy'):
+            raise ValueError(f"Motor de treinamento desconhecido: {motor}")
+        if not itens:
+            return 0
+        
+        if motor == 'numpy':
+            from motor_vetorizado import TreinadorVetorizado, codificar_matriz
+            X, y = codificar_matriz(self, itens)
+            treinador = TreinadorVetorizado(self.pesos, self.bias, self.taxa_aprendizado)
+        else:
+            X, y = self.preparar_dados_compactos(itens)
+            treinador = _TreinadorListas(self.pesos, self.bias, self.taxa_aprendizado)
+        
+        erros = 0
+        for _ in range(epocas):
+            erros = treinador.processar(X, y)
+            self.historico_treinamento.registrar(erros, ((len(itens) - erros) / len(itens)) * 100)
+            if erros == 0:
+                break
+        self.historico_treinamento.descarregar()
+        
+        pesos, bias = treinador.pesos_atuais()
+        self.pesos = [float(peso) for peso in pesos]
+        self.bias = float(bias)
+        return erros
     
     def prever_item(self, item_data: List) -> int:
         """
@@ -216,19 +864,59 @@ class PerceptronFerramentas:
         if self.pesos is None:
             raise ValueError("Modelo não foi treinado ainda!")
         
-        # Prepara features do item
-        features = self.preparar_features(item_data)
+        if self.tamanho_cache:
+            # Campos usados na codificação: um acerto dispensa conversão e normalização
+            chave = (item_data[1], item_data[2], item_data[3], item_data[4], item_data[5], item_data[7])
+            predicao = self._cache_predicoes.get(chave)
+            if predicao is not None:
+                self._cache_predicoes.move_to_end(chave)
+                self.acertos_cache += 1
+                return predicao
+            self.falhas_cache += 1
+        
+        # Prepara features do item (forma compacta: 5 + 1 pesos no produto escalar)
+        features = self.preparar_features_compactas(item_data)
         
         # Predição
-        saida_linear = self._produto_escalar(features, self.pesos) + self.bias
-        return self._funcao_ativacao(saida_linear)
+        saida_linear = features.margem(self.pesos, self.bias)
+        predicao = self._funcao_ativacao(saida_linear)
+        
+        if self.tamanho_cache:
+            self._cache_predicoes[chave] = predicao
+            if len(self._cache_predicoes) > self.tamanho_cache:
+                self._cache_predicoes.popitem(last=False)
+        return predicao
+    
+    def prever_lote(self, X) -> Tuple:
+        """
+        Faz predições para vários itens com um único produto matriz-vetor.
+        
+        Args:
+            X: Matriz NumPy (n, 14) já codificada ou lista de linhas brutas
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Predições (1=ferramenta, 0=não-ferramenta) e margens
+        """
+        if self.pesos is None:
+            raise ValueError("Modelo não foi treinado ainda!")
+        
+        import numpy as np
+        from motor_vetorizado import codificar_linhas, pontuar
+        
+        if not (isinstance(X, np.ndarray) and X.ndim == 2 and X.dtype.kind == 'f'):
+            X = codificar_linhas(self, X)
+        if X.shape[1] != len(self.pesos):
+            raise ValueError(f"Matriz com {X.shape[1]} colunas; esperado {len(self.pesos)}")
+        
+        return pontuar(X, self.pesos, self.bias)
     
-    def avaliar_dataset(self, dados_teste: List[List]) -> float:
+    def avaliar_dataset(self, dados_teste: List[List], vetorizado: bool = False) -> float:
         """
         Avalia o modelo em um dataset de teste.
         
         Args:
             dados_teste (List[List]): Dados de teste
+            vetorizado (bool): Se True, pontua todas as linhas com `prever_lote`
             
         Returns:
             float: Acurácia em percentual
@@ -240,21 +928,38 @@ class PerceptronFerramentas:
         total = len(dados_teste)
         detalhes = []
         
-        for linha in dados_teste:
-            predicao = self.prever_item(linha)
-            real = int(linha[-1])
-            correto = predicao == real
-            
-            if correto:
-                corretas += 1
+        if vetorizado:
+            predicoes, _ = self.prever_lote(dados_teste)
+            reais = [int(linha[-1]) for linha in dados_teste]
+            corretas = int((predicoes == reais).sum())
             
-            detalhes.append({
-                'item': linha[0],
-                'predicao': predicao,
-                'real': real,
-                'correto': correto,
-                'funcao': self.legenda_funcoes.get(int(linha[7]), "Desconhecida")
-            })
+            # Detalhes apenas das linhas exibidas
+            for linha, predicao, real in zip(dados_teste[:5], predicoes[:5], reais[:5]):
+                detalhes.append({
+                    'item': linha[0],
+                    'predicao': int(predicao),
+                    'real': real,
+                    'correto': int(predicao) == real,
+                    'funcao': self.legenda_funcoes.get(int(linha[7]), "Desconhecida")
+                })
+        else:
+            for linha in dados_teste:
+                predicao = self.prever_item(linha)
+                real = int(linha[-1])
+                correto = predicao == real
+                
+                if correto:
+                    corretas += 1
+                
+                # Detalhes apenas das linhas exibidas
+                if len(detalhes) < 5:
+                    detalhes.append({
+                        'item': linha[0],
+                        'predicao': predicao,
+                        'real': real,
+                        'correto': correto,
+                        'funcao': self.legenda_funcoes.get(int(linha[7]), "Desconhecida")
+                    })
         
         # Mostra alguns detalhes da avaliação
         print(f"\nDetalhes da avaliação (primeiros 5 itens):")
@@ -266,6 +971,150 @@ class PerceptronFerramentas:
         
         return (corretas / total) * 100
     
+    def avaliar_matriz(self, X, y, nomes: Optional[List[str]] = None) -> float:
+        """
+        Avalia o modelo em features já codificadas.
+        
+        Args:
+            X: Matriz (n, 14) de features
+            y: Rótulos eh_ferramenta (n,)
+            nomes (Optional[List[str]]): Nomes dos itens, para exibir os primeiros resultados
+            
+        Returns:
+            float: Acurácia em percentual
+        """
+        predicoes, _ = self.prever_lote(X)
+        corretas = int((predicoes == y).sum())
+        
+        if nomes is not None:
+            print(f"\nDetalhes da avaliação (primeiros 5 itens):")
+            for nome, predicao, real in zip(nomes[:5], predicoes[:5], y[:5]):
+                status = ""if predicao == real else "Errado"
+                pred_text = "FERRAMENTA"if predicao == 1 else "NÃO-FERRAMENTA"
+                real_text = "FERRAMENTA"if real == 1 else "NÃO-FERRAMENTA"
+                print(f"{status} {nome}: Pred={pred_text}, Real={real_text}")
+        
+        return (corretas / len(y)) * 100
+    
+    def avaliar_em_blocos(self, caminho_arquivo: str, tamanho_bloco: int = 65536) -> float:
+        """
+        Avalia o modelo lendo um CSV de teste em blocos.
+        
+        Args:
+            caminho_arquivo (str): Caminho para o CSV de teste
+            tamanho_bloco (int): Linhas lidas e pontuadas por vez
+            
+        Returns:
+            float: Acurácia em percentual
+        """
+        if self.pesos is None:
+            raise ValueError("Modelo não foi treinado ainda!")
+        
+        from motor_vetorizado import pontuar
+        from carregador_blocos import iterar_blocos_csv
+        
+        corretas = 0
+        total = 0
+        for bloco in iterar_blocos_csv(caminho_arquivo, self, tamanho_bloco):
+            predicoes, _ = pontuar(bloco.X, self.pesos, self.bias)
+            corretas += int((predicoes == bloco.y).sum())
+            total += len(bloco.y)
+        
+        if total == 0:
+            raise ValueError(f"Arquivo sem amostras: {caminho_arquivo}")
+        return (corretas / total) * 100
+    
+    def validacao_cruzada(self, caminho_arquivo: str, k: int = 5,
+                          estratificar_folds: Optional[str] = None,
+                          n_processos: Optional[int] = None) -> dict:
+        """
+        Validação cruzada k-fold com a configuração deste modelo.
+
+        Cada fold é treinado em um processo separado a partir dos dados em
+        memória compartilhada (ver `validacao_cruzada`), com a normalização
+        ajustada às suas linhas de treino; os pesos deste modelo não são alterados.
+        
+        Args:
+            caminho_arquivo (str): CSV rotulado
+            k (int): Número de folds
+            estratificar_folds (Optional[str]): Estratos dos folds ('eh_ferramenta',
+                'cod_funcao' ou 'ambos'; None = k-fold simples)
+            n_processos (Optional[int]): Processos trabalhadores (padrão: min(k, núcleos))
+            
+        Returns:
+            dict: Acurácia média e desvio padrão dos folds, acurácia por função e tabela por fold
+        """
+        from validacao_cruzada import executar_validacao_cruzada
+        return executar_validacao_cruzada(self, caminho_arquivo, k, estratificar_folds, n_processos)
+    
+    def salvar(self, caminho_arquivo: str) -> None:
+        """
+        Salva o modelo treinado em formato binário compacto.
+
+        Formato: MAGICO_MODELO, versão (uint16), tamanho dos metadados
+        (uint32), metadados JSON (hiperparâmetros, normalização, legenda,
+        histórico de treinamento),
+        número de pesos (uint32), pesos e bias em float64 little-endian.
+        
+        Args:
+            caminho_arquivo (str): Caminho do arquivo de modelo
+        """
+        if self.pesos is None:
+            raise ValueError("Modelo não foi treinado ainda!")
+        
+        metadados = json.dumps({
+            'taxa_aprendizado': self.taxa_aprendizado,
+            'max_iteracoes': self.max_iteracoes,
+            'semente': self.semente,
+            'modo': self.modo,
+            'paciencia': self.paciencia,
+            'embaralhar': self.embaralhar,
+            'estratificar': self.estratificar,
+            'semente_treinamento': self.semente_treinamento,
+            'normalizacao_params': self.normalizacao_params,
+            'legenda_funcoes': self.legenda_funcoes,
+            'iteracoes_realizadas': len(self.historico_treinamento),
+            'historico': self.historico_treinamento.colunas(),
+            'timestamp': datetime.datetime.now().isoformat()
+        }, ensure_ascii=False).encode('utf-8')
+        
+        n_pesos = len(self.pesos)
+        with open(caminho_arquivo, 'wb') as arquivo:
+            arquivo.write(MAGICO_MODELO)
+            arquivo.write(struct.pack('<HI', VERSAO_FORMATO_MODELO, len(metadados)))
+            arquivo.write(metadados)
+            arquivo.write(struct.pack(f'<I{n_pesos}dd', n_pesos, *self.pesos, self.bias))
+    
+    @classmethod
+    def carregar(cls, caminho_arquivo: str) -> 'PerceptronFerramentas':
+        """
+        Carrega um modelo salvo com `salvar`, pronto para inferência.
+        
+        Args:
+            caminho_arquivo (str): Caminho do arquivo de modelo
+            
+        Returns:
+            PerceptronFerramentas: Modelo com pesos, bias, parâmetros e histórico restaurados
+        """
+        metadados, conteudo, posicao = ler_arquivo_modelo(
+            caminho_arquivo, MAGICO_MODELO, VERSAO_FORMATO_MODELO, "um modelo do Perceptron")
+        (n_pesos,) = struct.unpack_from('<I', conteudo, posicao)
+        valores = struct.unpack_from(f'<{n_pesos}dd', conteudo, posicao + 4)
+        
+        modelo = cls(metadados['taxa_aprendizado'], metadados['max_iteracoes'], metadados['semente'],
+                     metadados.get('modo', 'padrao'), metadados.get('paciencia'),
+                     embaralhar=metadados.get('embaralhar', False),
+                     estratificar=metadados.get('estratificar'))
+        modelo.semente_treinamento = metadados.get('semente_treinamento')
+        modelo.normalizacao_params = metadados['normalizacao_params']
+        modelo.legenda_funcoes = {int(codigo): descricao
+                                  for codigo, descricao in metadados['legenda_funcoes'].items()}
+        modelo.pesos = list(valores[:n_pesos])
+        modelo.bias = valores[n_pesos]
+        if 'historico' in metadados:
+            modelo.historico_treinamento = HistoricoTreinamento.de_colunas(metadados['historico'])
+        return modelo
+    
     def mostrar_informacoes_modelo(self) -> None:
         """Exibe informações detalhadas sobre o modelo treinado."""
         if self.pesos is None:
@@ -279,6 +1128,9 @@ class PerceptronFerramentas:
         print(f"Taxa de aprendizado: {self.taxa_aprendizado}")
         print(f"Iterações máximas: {self.max_iteracoes}")
         print(f"Iterações realizadas: {len(self.historico_treinamento)}")
+        print(f"Modo de treinamento: {self.modo}")
+        if self.paciencia is not None:
+            print(f"Paciência (parada antecipada): {self.paciencia}")
         
         if self.historico_treinamento:
             print(f"Acurácia final: {self.historico_treinamento[-1]['acuracia']:.1f}%")
@@ -344,12 +1196,14 @@ def carregar_dataset_csv(caminho_arquivo: str) -> Optional[List[List]]:
         return None
 
 
-def interface_classificacao_manual(modelo: PerceptronFerramentas) -> None:
+def interface_classificacao_manual(modelo: PerceptronFerramentas, modelo_funcoes=None) -> None:
     """
     Interface para classificação manual de novos itens.
     
     Args:
         modelo (PerceptronFerramentas): Modelo treinado
+        modelo_funcoes (Optional[PerceptronFuncoes]): Preditor do código de função,
+            usado quando o código é deixado em branco
     """
     print("\n"+ "="*60)
     print("INTERFACE DE CLASSIFICAÇÃO MANUAL DE FERRAMENTAS")
@@ -394,9 +1248,15 @@ def interface_classificacao_manual(modelo: PerceptronFerramentas) -> None:
                 break
             material_metal = int(material_metal)
             
-            cod_funcao = input("Código da função (1-9): ")
+            if modelo_funcoes is not None:
+                cod_funcao = input("Código da função (1-9, vazio = prever): ")
+            else:
+                cod_funcao = input("Código da função (1-9): ")
             if cod_funcao.lower() == 'sair':
                 break
+            if cod_funcao.strip() == '' and modelo_funcoes is not None:
+                cod_funcao = modelo_funcoes.prever_item([nome, peso, dureza, tamanho, tem_cabo, material_metal])
+                print(f"Código de função previsto: {cod_funcao}")
             cod_funcao = int(cod_funcao)
             
             # Verifica se o código é válido
@@ -438,7 +1298,9 @@ def interface_classificacao_manual(modelo: PerceptronFerramentas) -> None:
 
 
 def salvar_resultados_json(modelo: PerceptronFerramentas, total_treino: int, 
-                          total_teste: int, acuracia_teste: float) -> None:
+                          total_teste: int, acuracia_teste: float,
+                          perfil: Optional[dict] = None,
+                          validacao_cruzada: Optional[dict] = None) -> None:
     """
     Salva os resultados do treinamento e avaliação em arquivo JSON.
     
@@ -447,6 +1309,9 @@ def salvar_resultados_json(modelo: PerceptronFerramentas, total_treino: int,
         total_treino (int): Total de registros de treinamento
         total_teste (int): Total de registros de teste
         acuracia_teste (float): Acurácia no dataset de teste
+        perfil (Optional[dict]): Tempos por fase e por época (`PerfiladorTreinamento.resumo()`)
+        validacao_cruzada (Optional[dict]): Métricas agregadas dos folds
+            (`PerceptronFerramentas.validacao_cruzada`)
     """
     try:
         # Prepara dados para salvar
@@ -456,8 +1321,13 @@ def salvar_resultados_json(modelo: PerceptronFerramentas, total_treino: int,
                 "tipo": "Perceptron ",
                 "taxa_aprendizado": modelo.taxa_aprendizado,
                 "max_iteracoes": modelo.max_iteracoes,
+                "modo": modelo.modo,
+                "paciencia": modelo.paciencia,
+                "semente": modelo.semente_treinamento,
+                "embaralhar": modelo.embaralhar,
+                "estratificar": modelo.estratificar,
                 "iteracoes_realizadas": len(modelo.historico_treinamento),
-                "convergiu": len(modelo.historico_treinamento) < modelo.max_iteracoes
+                "convergiu": bool(modelo.historico_treinamento) and modelo.historico_treinamento[-1]['erros'] == 0
             },
             "dados": {
                 "total_treino": total_treino,
@@ -471,13 +1341,17 @@ def salvar_resultados_json(modelo: PerceptronFerramentas, total_treino: int,
                 "acuracia_teste": acuracia_teste,
                 "bias": modelo.bias if modelo.bias else 0
             },
-            "historico_treinamento": modelo.historico_treinamento,
+            "historico_treinamento": modelo.historico_treinamento.resumo(),
             "categorias_funcao": modelo.legenda_funcoes,
             "pesos_modelo": {
                 "bias": modelo.bias if modelo.bias else 0,
                 "pesos_caracteristicas": modelo.pesos if modelo.pesos else []
             }
         }
+        if validacao_cruzada is not None:
+            resultados["validacao_cruzada"] = validacao_cruzada
+        if perfil is not None:
+            resultados["perfil"] = perfil
         
         # Salva no arquivo JSON
         with open('resultados_treinamento.json', 'w', encoding='utf-8') as arquivo:
@@ -492,43 +1366,171 @@ def salvar_resultados_json(modelo: PerceptronFerramentas, total_treino: int,
         print(f"❌ Erro ao salvar JSON: {e}")
 
 
-def main():
-    """Função principal do sistema de classificação de ferramentas."""
+def atualizar_modelo_salvo(caminho_modelo: str, caminho_itens: str, epocas: int = 1) -> None:
+    """
+    Atualiza um modelo salvo com novos itens rotulados, sem retreinar do zero.
+    
+    Args:
+        caminho_modelo (str): Arquivo de modelo (sobrescrito com os novos pesos)
+        caminho_itens (str): CSV com os novos itens (mesmo formato do dataset)
+        epocas (int): Passadas sobre os novos itens
+    """
+    itens = carregar_dataset_csv(caminho_itens)
+    if itens is None:
+        print("Erro: Não foi possível carregar os novos itens.")
+        return
+    
+    modelo = PerceptronFerramentas.carregar(caminho_modelo)
+    erros = modelo.atualizar(itens, epocas)
+    modelo.salvar(caminho_modelo)
+    print(f"Modelo atualizado com {len(itens)} itens ({erros} erros na última passada): {caminho_modelo}")
+
+
+def main(caminho_modelo: Optional[str] = None, caminho_atualizacao: Optional[str] = None,
+         perfilar: bool = False, caminho_trace: Optional[str] = None,
+         caminho_historico: Optional[str] = None, semente: Optional[int] = None,
+         embaralhar: bool = False, estratificar: Optional[str] = None,
+         folds_validacao: Optional[int] = None, estratificar_folds: Optional[str] = None,
+         treinar_funcoes: bool = False):
+    """
+    Função principal do sistema de classificação de ferramentas.
+    
+    Args:
+        caminho_modelo (Optional[str]): Arquivo de modelo salvo. Se existir, é
+            carregado e o sistema vai direto para a classificação; caso
+            contrário o modelo é treinado e salvo nesse caminho.
+        caminho_atualizacao (Optional[str]): CSV de novos itens para atualizar
+            o modelo salvo em `caminho_modelo` (não abre a interface)
+        perfilar (bool): Mede fases e épocas do treinamento e grava os tempos
+            no JSON de resultados
+        caminho_trace (Optional[str]): Grava também um trace do Chrome (implica `perfilar`)
+        caminho_historico (Optional[str]): Grava o histórico por época em JSON Lines
+            durante o treinamento
+        semente (Optional[int]): Semente dos pesos iniciais e da ordem das amostras
+            (sem semente, uma é sorteada e gravada no JSON de resultados)
+        embaralhar (bool): Embaralha a ordem das amostras a cada época
+        estratificar (Optional[str]): Estratos intercalados na ordem embaralhada
+        folds_validacao (Optional[int]): Executa validação cruzada com esse número
+            de folds e grava as métricas no JSON de resultados
+        estratificar_folds (Optional[str]): Estratos dos folds da validação cruzada
+        treinar_funcoes (bool): Treina também o preditor do código de função (usado
+            para itens sem código); sempre treinado quando o modelo é salvo, para
+            que `main.py classificar` possa completar os códigos ausentes
+    """
     print("="*70)
     print("SISTEMA DE CLASSIFICAÇÃO DE FERRAMENTAS - ")
     print("Implementação Perceptron com Códigos Numéricos")
     print("="*70)
     
-    # Carrega dataset de treinamento
-    dados_treino = carregar_dataset_csv('data/dataset_ferramentas.csv')
-    if dados_treino is None:
-        print("Erro: Não foi possível carregar o dataset de treinamento.")
+    if caminho_atualizacao is not None:
+        if caminho_modelo is None or not os.path.exists(caminho_modelo):
+            print("Erro: a atualização requer um modelo salvo existente (--modelo).")
+            return
+        atualizar_modelo_salvo(caminho_modelo, caminho_atualizacao)
+        return
+    
+    if caminho_modelo is not None and os.path.exists(caminho_modelo):
+        modelo = PerceptronFerramentas.carregar(caminho_modelo)
+        print(f"\nModelo carregado: {caminho_modelo}")
+        modelo_funcoes = None
+        if os.path.exists(caminho_modelo + SUFIXO_MODELO_FUNCOES):
+            from multiclasse import PerceptronFuncoes
+            modelo_funcoes = PerceptronFuncoes.carregar(caminho_modelo + SUFIXO_MODELO_FUNCOES)
+        modelo.configurar_cache_predicoes(TAMANHO_CACHE_INTERFACE)
+        interface_classificacao_manual(modelo, modelo_funcoes)
+        
+        print("\n"+ "="*70)
+        print("Obrigado por usar o sistema de classificação!")
+        print("="*70)
         return
     
-    # Cria e treina o modelo
+    # Cria o modelo (os parâmetros de normalização definem a codificação)
     print(f"\nInicializando Perceptron ...")
-    modelo = PerceptronFerramentas(taxa_aprendizado=0.1, max_iteracoes=1000)
+    modelo = PerceptronFerramentas(taxa_aprendizado=0.1, max_iteracoes=1000, semente=semente,
+                                   embaralhar=embaralhar, estratificar=estratificar)
+    perfilador = None
+    if perfilar or caminho_trace:
+        from instrumentacao import PerfiladorTreinamento
+        perfilador = PerfiladorTreinamento()
+        modelo.callbacks.append(perfilador)
+    if caminho_historico:
+        modelo.historico_treinamento.gravar_em(caminho_historico)
+    
+    # Normalização ajustada aos dados de treinamento; o hash do CSV é calculado
+    # uma vez e valida tanto a normalização quanto as features do cache
+    from cache_features import calcular_hash_arquivo, carregar_features_com_cache
+    caminho_treino = 'data/dataset_ferramentas.csv'
+    hash_treino = calcular_hash_arquivo(caminho_treino) if os.path.exists(caminho_treino) else None
+    modelo.ajustar_normalizacao(caminho_treino, hash_fonte=hash_treino)
+    
+    # Carrega dataset de treinamento (cache binário de features quando válido);
+    # float64, como o motor de listas, para que os pesos não mudem com o cache
+    with modelo._fase('carregar'):
+        dados_treino = carregar_features_com_cache(caminho_treino, modelo, dtype='float64',
+                                                   hash_fonte=hash_treino)
+    if dados_treino is None:
+        print("Erro: Não foi possível carregar o dataset de treinamento.")
+        return
     
     print("Treinando modelo...")
-    modelo.treinar(dados_treino)
+    modelo.treinar_matriz(dados_treino.X, dados_treino.y)
+    modelo.historico_treinamento.fechar()
     
     # Mostra informações do modelo
     modelo.mostrar_informacoes_modelo()
     
+    # Preditor do código de função (para itens sem código), a partir do one-hot
+    modelo_funcoes = None
+    if treinar_funcoes or caminho_modelo is not None:
+        from multiclasse import PerceptronFuncoes
+        print("\nTreinando preditor de código de função...")
+        modelo_funcoes = PerceptronFuncoes(normalizacao_params=modelo.normalizacao_params)
+        com_codigo = dados_treino.X[:, 5:].any(axis=1)
+        with modelo._fase('treinar_funcoes'):
+            modelo_funcoes.treinar_matriz(dados_treino.X[com_codigo],
+                                          dados_treino.X[com_codigo, 5:].argmax(axis=1) + 1)
+    
     # Avalia no dataset de teste
-    dados_teste = carregar_dataset_csv('data/dataset_teste.csv')
+    with modelo._fase('carregar'):
+        dados_teste = carregar_features_com_cache('data/dataset_teste.csv', modelo, dtype='float64',
+                                                  incluir_nomes=True)
+    acuracia_teste = 0
     if dados_teste is not None:
         print(f"\nAVALIAÇÃO NO DATASET DE TESTE")
         print("-"* 50)
-        acuracia_teste = modelo.avaliar_dataset(dados_teste)
+        with modelo._fase('avaliar'):
+            acuracia_teste = modelo.avaliar_matriz(dados_teste.X, dados_teste.y, dados_teste.nomes)
         print(f"\nACURÁCIA NO DATASET DE TESTE: {acuracia_teste:.1f}%")
+        if modelo_funcoes is not None:
+            acuracia_funcoes = modelo_funcoes.avaliar_matriz(dados_teste.X,
+                                                             dados_teste.X[:, 5:].argmax(axis=1) + 1)
+            print(f"ACURÁCIA DO PREDITOR DE FUNÇÃO NO TESTE: {acuracia_funcoes:.1f}%")
+    
+    # Validação cruzada no dataset de treinamento
+    validacao = None
+    if folds_validacao:
+        from validacao_cruzada import mostrar_validacao
+        print()
+        with modelo._fase('validacao_cruzada'):
+            validacao = modelo.validacao_cruzada(caminho_treino, folds_validacao,
+                                                 estratificar_folds)
+        mostrar_validacao(validacao)
     
     # Salva resultados em JSON
-    salvar_resultados_json(modelo, len(dados_treino), len(dados_teste) if dados_teste else 0, 
-                          acuracia_teste if dados_teste else 0)
+    salvar_resultados_json(modelo, len(dados_treino.y), len(dados_teste.y) if dados_teste else 0,
+                          acuracia_teste, perfilador.resumo() if perfilador else None, validacao)
+    if caminho_trace:
+        perfilador.salvar_trace_chrome(caminho_trace)
+        print(f"Trace do treinamento salvo em: {caminho_trace}")
+    
+    if caminho_modelo is not None:
+        modelo.salvar(caminho_modelo)
+        modelo_funcoes.salvar(caminho_modelo + SUFIXO_MODELO_FUNCOES)
+        print(f"Modelo salvo em: {caminho_modelo}")
     
     # Interface de classificação manual
-    interface_classificacao_manual(modelo)
+    modelo.configurar_cache_predicoes(TAMANHO_CACHE_INTERFACE)
+    interface_classificacao_manual(modelo, modelo_funcoes)
     
     print("\n"+ "="*70)
     print("Obrigado por usar o sistema de classificação!")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Histórico de treinamento em colunas tipadas.
+
+Cada época ocupa 16 bytes (erros em int64 e acurácia em float64) em arrays
+pré-alocados, em vez de um dicionário por época. O histórico continua
+indexável como a lista de dicionários anterior (`historico[-1]['acuracia']`,
+`len(historico)`) e pode ser gravado incrementalmente em um arquivo JSON
+Lines (uma linha por época) durante o treinamento.
+"""
+
+import json
+from array import array
+from typing import Optional
+
+
+# Épocas reservadas quando o histórico precisa crescer além da capacidade
+CAPACIDADE_INICIAL = 64
+
+# Épocas gravadas entre descargas do arquivo de histórico
+INTERVALO_DESCARGA = 50
+
+
+class HistoricoTreinamento:
+    """
+    Erros e acurácia por época em colunas pré-alocadas.
+
+    A iteração de cada época é a sua posição (1-based), como no histórico
+    em lista: épocas de `atualizar` continuam a numeração.
+
+    Attributes:
+        erros (array): Erros por época (int64; só as primeiras `len(self)` posições são válidas)
+        acuracia (array): Acurácia por época em percentual (float64)
+        caminho_registro (Optional[str]): Arquivo JSON Lines gravado durante o treinamento
+    """
+
+    def __init__(self, capacidade: int = CAPACIDADE_INICIAL):
+        self._n = 0
+        self.erros = array('q', bytes(8 * capacidade))
+        self.acuracia = array('d', bytes(8 * capacidade))
+        self.caminho_registro = None
+        self._arquivo = None
+        self._pendentes = 0
+
+    def reservar(self, n_epocas: int) -> None:
+        """Garante espaço para mais `n_epocas` épocas sem realocar durante o treinamento."""
+        falta = self._n + n_epocas - len(self.erros)
+        if falta > 0:
+            self.erros.extend(array('q', bytes(8 * falta)))
+            self.acuracia.extend(array('d', bytes(8 * falta)))
+
+    def registrar(self, erros: int, acuracia: float) -> None:
+        """
+        Acrescenta uma época.
+
+        Args:
+            erros (int): Erros (ou atualizações) na época
+            acuracia (float): Acurácia no treino em percentual
+        """
+        if self._n == len(self.erros):
+            self.reservar(max(self._n, CAPACIDADE_INICIAL))
+        self.erros[self._n] = erros
+        self.acuracia[self._n] = acuracia
+        self._n += 1
+
+        if self._arquivo is not None:
+            self._arquivo.write(f'{{"iteracao": {self._n}, "erros": {erros}, '
+                                f'"acuracia": {acuracia!r}}}\n')
+            self._pendentes += 1
+            if self._pendentes >= INTERVALO_DESCARGA:
+                self.descarregar()
+
+    def append(self, epoca: dict) -> None:
+        """Compatibilidade com o histórico em lista: acrescenta {'erros', 'acuracia', ...}."""
+        self.registrar(epoca['erros'], epoca['acuracia'])
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._n))]
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("índice fora do histórico de treinamento")
+        return {'iteracao': i + 1, 'erros': self.erros[i], 'acuracia': self.acuracia[i]}
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self[i]
+
+    def gravar_em(self, caminho_arquivo: str, anexar: bool = False) -> None:
+        """
+        Passa a gravar cada nova época em um arquivo JSON Lines.
+
+        As linhas são descarregadas em disco a cada `INTERVALO_DESCARGA`
+        épocas e ao fim de cada treinamento, então um treinamento
+        interrompido preserva as épocas já concluídas.
+
+        Args:
+            caminho_arquivo (str): Arquivo de histórico
+            anexar (bool): Continua um arquivo existente em vez de recriá-lo
+        """
+        self.fechar()
+        self._arquivo = open(caminho_arquivo, 'a' if anexar else 'w', encoding='utf-8')
+        self.caminho_registro = caminho_arquivo
+
+    def descarregar(self) -> None:
+        """Grava em disco as épocas pendentes do arquivo de histórico."""
+        if self._arquivo is not None:
+            self._arquivo.flush()
+            self._pendentes = 0
+
+    def fechar(self) -> None:
+        """Encerra a gravação do arquivo de histórico."""
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
+            self._pendentes = 0
+
+    def resumo(self) -> dict:
+        """
+        Resumo em colunas para o JSON de resultados.
+
+        Returns:
+            dict: epocas, erros e acuracia (listas alinhadas, iteração = posição + 1)
+                e o arquivo JSON Lines com o histórico, se houver
+        """
+        resumo = {
+            'epocas': self._n,
+            'erros': self.erros[:self._n].tolist(),
+            'acuracia': [round(valor, 4) for valor in self.acuracia[:self._n]]
+        }
+        if self.caminho_registro is not None:
+            resumo['arquivo'] = self.caminho_registro
+        return resumo
+
+    def colunas(self) -> dict:
+        """Erros e acurácia registrados, sem arredondamento (salvos junto ao modelo)."""
+        return {'erros': self.erros[:self._n].tolist(), 'acuracia': self.acuracia[:self._n].tolist()}
+
+    @classmethod
+    def de_colunas(cls, colunas: dict) -> 'HistoricoTreinamento':
+        """
+        Reconstrói um histórico a partir de `colunas()`.
+
+        Args:
+            colunas (dict): Listas alinhadas 'erros' e 'acuracia'
+
+        Returns:
+            HistoricoTreinamento: Histórico com as épocas restauradas
+        """
+        erros, acuracia = colunas['erros'], colunas['acuracia']
+        if len(erros) != len(acuracia):
+            raise ValueError("Colunas do histórico com tamanhos diferentes")
+        historico = cls(max(len(erros), CAPACIDADE_INICIAL))
+        for erros_epoca, acuracia_epoca in zip(erros, acuracia):
+            historico.registrar(erros_epoca, acuracia_epoca)
+        return historico
+
+    def __getstate__(self) -> dict:
+        # Só as épocas registradas; o arquivo aberto não é copiado
+        estado = self.__dict__.copy()
+        estado['erros'] = self.erros[:self._n]
+        estado['acuracia'] = self.acuracia[:self._n]
+        estado['_arquivo'] = None
+        estado['_pendentes'] = 0
+        return estado
+
+
+def carregar_historico(caminho_arquivo: str) -> Optional[HistoricoTreinamento]:
+    """
+    Lê um arquivo de histórico gravado com `HistoricoTreinamento.gravar_em`.
+
+    Args:
+        caminho_arquivo (str): Arquivo JSON Lines
+
+    Returns:
+        Optional[HistoricoTreinamento]: Histórico ou None se o arquivo não existir
+    """
+    try:
+        historico = HistoricoTreinamento()
+        with open(caminho_arquivo, 'r', encoding='utf-8') as arquivo:
+            for linha in arquivo:
+                if linha.strip():
+                    historico.append(json.loads(linha))
+        return historico
+    except FileNotFoundError:
+        print(f"Erro: Arquivo '{caminho_arquivo}' não encontrado.")
+        return None
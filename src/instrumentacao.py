@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ganchos (callbacks) e perfilamento do treinamento do Perceptron.
+
+Os ganchos são registrados em `PerceptronFerramentas.callbacks`. Com a lista
+vazia (padrão) o treinamento não chama nada daqui; com algum gancho
+registrado, as mensagens de progresso do treinamento deixam de ser impressas.
+
+`PerfiladorTreinamento` é um gancho pronto que mede o tempo de cada época e
+de cada fase (carregar, codificar, treinar, avaliar), conta as atualizações
+de pesos e exporta tudo para o JSON de resultados ou para um arquivo de trace
+do Chrome (chrome://tracing, Perfetto).
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import List
+
+
+class CallbacksTreinamento:
+    """
+    Interface dos ganchos de treinamento (todos os métodos são opcionais).
+
+    `ao_atualizar` é chamado dentro do laço de amostras; só é instalado no
+    treinador quando uma subclasse o sobrescreve.
+    """
+
+    def ao_iniciar_fase(self, modelo, nome: str) -> None:
+        """Início de uma fase (ex.: 'codificar', 'treinar')."""
+
+    def ao_terminar_fase(self, modelo, nome: str) -> None:
+        """Fim de uma fase."""
+
+    def ao_iniciar_epoca(self, modelo, iteracao: int) -> None:
+        """Início da época `iteracao` (1-based)."""
+
+    def ao_terminar_epoca(self, modelo, iteracao: int, erros: int, n_amostras: int,
+                          atualizacoes: int) -> None:
+        """Fim de uma época, com erros, amostras vistas e atualizações de pesos feitas."""
+
+    def ao_atualizar(self, modelo, posicao: int, n_errados: int) -> None:
+        """
+        Atualização de pesos durante a época.
+
+        Args:
+            modelo (PerceptronFerramentas): Modelo em treinamento
+            posicao (int): Posição na época da amostra (ou do fim do lote) que gerou a atualização
+            n_errados (int): Amostras erradas incluídas na atualização (1 no modo por amostra)
+        """
+
+    def ao_convergir(self, modelo, iteracao: int) -> None:
+        """Época sem erros: o treinamento convergiu."""
+
+
+def sobrescreve_ao_atualizar(callback: CallbacksTreinamento) -> bool:
+    """Indica se o gancho implementa `ao_atualizar` (e precisa ser chamado no laço de amostras)."""
+    return type(callback).ao_atualizar is not CallbacksTreinamento.ao_atualizar
+
+
+@contextmanager
+def fase_callbacks(callbacks: List[CallbacksTreinamento], modelo, nome: str):
+    """Notifica início e fim de uma fase a todos os ganchos."""
+    for callback in callbacks:
+        callback.ao_iniciar_fase(modelo, nome)
+    try:
+        yield
+    finally:
+        for callback in callbacks:
+            callback.ao_terminar_fase(modelo, nome)
+
+
+class PerfiladorTreinamento(CallbacksTreinamento):
+    """
+    Cronômetros de épocas e fases do treinamento.
+
+    Attributes:
+        epocas (List[dict]): Por época: iteracao, segundos, erros, amostras, atualizacoes
+            e amostras_por_segundo
+        fases (List[dict]): Por fase executada: nome, inicio (s desde a criação) e segundos
+        convergiu_em (Optional[int]): Época em que o treinamento convergiu
+    """
+
+    def __init__(self):
+        self.epocas = []
+        self.fases = []
+        self.convergiu_em = None
+        self._origem = time.perf_counter()
+        self._inicio_epoca = None
+        self._fases_abertas = {}
+
+    def ao_iniciar_fase(self, modelo, nome: str) -> None:
+        self._fases_abertas[nome] = time.perf_counter()
+
+    def ao_terminar_fase(self, modelo, nome: str) -> None:
+        inicio = self._fases_abertas.pop(nome)
+        self.fases.append({'nome': nome, 'inicio': inicio - self._origem,
+                           'segundos': time.perf_counter() - inicio})
+
+    @contextmanager
+    def fase(self, nome: str):
+        """Mede uma fase fora do treinamento (ex.: carregamento e avaliação em `main`)."""
+        self.ao_iniciar_fase(None, nome)
+        try:
+            yield
+        finally:
+            self.ao_terminar_fase(None, nome)
+
+    def ao_iniciar_epoca(self, modelo, iteracao: int) -> None:
+        self._inicio_epoca = time.perf_counter()
+
+    def ao_terminar_epoca(self, modelo, iteracao: int, erros: int, n_amostras: int,
+                          atualizacoes: int) -> None:
+        agora = time.perf_counter()
+        segundos = agora - self._inicio_epoca
+        self.epocas.append({
+            'iteracao': iteracao,
+            'inicio': self._inicio_epoca - self._origem,
+            'segundos': segundos,
+            'erros': erros,
+            'amostras': n_amostras,
+            'atualizacoes': atualizacoes,
+            'amostras_por_segundo': n_amostras / segundos if segundos > 0 else None
+        })
+
+    def ao_convergir(self, modelo, iteracao: int) -> None:
+        self.convergiu_em = iteracao
+
+    def resumo(self) -> dict:
+        """
+        Resumo para o JSON de resultados.
+
+        Returns:
+            dict: Tempo total por fase, totais das épocas e a lista de épocas
+        """
+        por_fase = {}
+        for fase in self.fases:
+            por_fase[fase['nome']] = por_fase.get(fase['nome'], 0.0) + fase['segundos']
+
+        segundos_epocas = sum(epoca['segundos'] for epoca in self.epocas)
+        amostras = sum(epoca['amostras'] for epoca in self.epocas)
+        return {
+            'fases_segundos': por_fase,
+            'epocas_segundos': segundos_epocas,
+            'atualizacoes': sum(epoca['atualizacoes'] for epoca in self.epocas),
+            'amostras_por_segundo': amostras / segundos_epocas if segundos_epocas > 0 else None,
+            'convergiu_em': self.convergiu_em,
+            'epocas': [{chave: valor for chave, valor in epoca.items() if chave != 'inicio'}
+                       for epoca in self.epocas]
+        }
+
+    def salvar_trace_chrome(self, caminho_arquivo: str) -> None:
+        """
+        Grava fases e épocas no formato Trace Event do Chrome (eventos completos 'X').
+
+        Args:
+            caminho_arquivo (str): Arquivo JSON de saída
+        """
+        pid = os.getpid()
+        eventos = [{'name': fase['nome'], 'cat': 'fase', 'ph': 'X', 'pid': pid, 'tid': 0,
+                    'ts': fase['inicio'] * 1e6, 'dur': fase['segundos'] * 1e6}
+                   for fase in self.fases]
+        eventos.extend({'name': f"época {epoca['iteracao']}", 'cat': 'epoca', 'ph': 'X',
+                        'pid': pid, 'tid': 0, 'ts': epoca['inicio'] * 1e6,
+                        'dur': epoca['segundos'] * 1e6,
+                        'args': {'erros': epoca['erros'], 'atualizacoes': epoca['atualizacoes']}}
+                       for epoca in self.epocas)
+        with open(caminho_arquivo, 'w', encoding='utf-8') as arquivo:
+            json.dump({'traceEvents': eventos, 'displayTimeUnit': 'ms'}, arquivo, ensure_ascii=False)
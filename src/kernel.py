@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Perceptron com kernel (polinomial ou RBF) e expansão explícita de grau 2.
+
+Para catálogos que não são linearmente separáveis nas 14 features (ex.:
+itens pesados não metálicos contra ferramentas leves metálicas), há duas
+opções:
+
+- `expandir_grau2`: acrescenta os produtos de pares das 5 características
+  físicas e treina o Perceptron linear de sempre sobre 27 features;
+- `PerceptronKernel`: forma dual do Perceptron. Guarda um coeficiente por
+  amostra e mantém as margens de todas as amostras atualizadas a cada erro,
+  então cada atualização custa uma linha da matriz de Gram (O(n)), nunca a
+  matriz inteira.
+
+As linhas de Gram já calculadas ficam em um cache LRU limitado em bytes
+(`limite_cache_bytes`); a predição pontua os itens em blocos de tamanho
+limitado. O número de vetores de suporte pode ser limitado durante o
+treinamento (`max_vetores_suporte`: o de menor coeficiente é descartado) e,
+ao final, vetores de suporte repetidos são fundidos em um só.
+
+Uso:
+    python src/kernel.py --kernel rbf --gamma 2 --max-vetores-suporte 500
+    python src/kernel.py --kernel grau2
+"""
+
+import argparse
+import json
+import struct
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from historico import HistoricoTreinamento
+from motor_vetorizado import N_CARACTERISTICAS, N_CARACTERISTICAS_FISICAS, codificar_linhas
+from preditor import NORMALIZACAO_PADRAO, ler_arquivo_modelo
+
+
+MAGICO_KERNEL = b'PFKERNEL'
+VERSAO_FORMATO_KERNEL = 1
+
+KERNELS = ('linear', 'polinomial', 'rbf')
+
+# Pares (i, j) das características físicas na expansão de grau 2; os
+# quadrados de tem_cabo e material_metalico (0/1) repetiriam a própria coluna
+PARES_GRAU2 = [(i, j) for i in range(N_CARACTERISTICAS_FISICAS)
+               for j in range(i, N_CARACTERISTICAS_FISICAS) if not (i == j and i >= 3)]
+
+# Memória máxima das linhas de Gram guardadas durante o treinamento
+LIMITE_CACHE_GRAM = 256 * 1024 * 1024
+
+# Memória máxima do bloco (itens x vetores de suporte) pontuado de uma vez
+LIMITE_BLOCO_PREDICAO = 64 * 1024 * 1024
+
+
+def expandir_grau2(X: np.ndarray) -> np.ndarray:
+    """
+    Acrescenta os termos de grau 2 das características físicas.
+
+    Args:
+        X (np.ndarray): Matriz (n, 14) de features
+
+    Returns:
+        np.ndarray: Matriz (n, 14 + 13): as 14 features seguidas dos produtos de `PARES_GRAU2`
+    """
+    X = np.asarray(X)
+    expandida = np.empty((X.shape[0], N_CARACTERISTICAS + len(PARES_GRAU2)), dtype=X.dtype)
+    expandida[:, :N_CARACTERISTICAS] = X
+    for coluna, (i, j) in enumerate(PARES_GRAU2, start=N_CARACTERISTICAS):
+        np.multiply(X[:, i], X[:, j], out=expandida[:, coluna])
+    return expandida
+
+
+def calcular_kernel(A: np.ndarray, B: np.ndarray, kernel: str, grau: int = 2,
+                    gamma: float = 1.0, coef0: float = 1.0) -> np.ndarray:
+    """
+    Matriz de kernel entre as linhas de A e de B.
+
+    Args:
+        A (np.ndarray): Matriz (m, d)
+        B (np.ndarray): Matriz (n, d)
+        kernel (str): 'linear', 'polinomial' ((gamma * a.b + coef0) ** grau) ou
+            'rbf' (exp(-gamma * |a - b|²))
+        grau (int): Grau do kernel polinomial
+        gamma (float): Escala do produto escalar (polinomial) ou da distância (RBF)
+        coef0 (float): Termo independente do kernel polinomial
+
+    Returns:
+        np.ndarray: Matriz (m, n)
+    """
+    produtos = A @ B.T
+    if kernel == 'linear':
+        return produtos
+    if kernel == 'polinomial':
+        return (gamma * produtos + coef0) ** grau
+    if kernel == 'rbf':
+        distancias = (np.einsum('ij,ij->i', A, A)[:, None] + np.einsum('ij,ij->i', B, B)[None, :]
+                      - 2 * produtos)
+        return np.exp(-gamma * np.maximum(distancias, 0.0))
+    raise ValueError(f"Kernel desconhecido: {kernel}")
+
+
+class CacheGram:
+    """
+    Linhas da matriz de Gram K(x_i, X) do treino, em um cache LRU limitado.
+
+    Attributes:
+        capacidade (int): Linhas guardadas no máximo (limite em bytes / bytes por linha)
+        acertos (int): Linhas servidas pelo cache
+        falhas (int): Linhas calculadas
+    """
+
+    def __init__(self, X: np.ndarray, modelo: 'PerceptronKernel', limite_bytes: int = LIMITE_CACHE_GRAM):
+        self._X = X
+        self._modelo = modelo
+        self._linhas = OrderedDict()
+        self.capacidade = max(1, min(X.shape[0], limite_bytes // max(X.shape[0] * X.itemsize, 1)))
+        self.acertos = 0
+        self.falhas = 0
+
+    def linha(self, i: int) -> np.ndarray:
+        """Retorna K(x_i, X) (não deve ser alterada)."""
+        linha = self._linhas.get(i)
+        if linha is not None:
+            self._linhas.move_to_end(i)
+            self.acertos += 1
+            return linha
+        self.falhas += 1
+        linha = self._modelo._kernel(self._X[i:i + 1], self._X)[0]
+        self._linhas[i] = linha
+        if len(self._linhas) > self.capacidade:
+            self._linhas.popitem(last=False)
+        return linha
+
+
+class PerceptronKernel:
+    """
+    Perceptron dual com kernel para o rótulo eh_ferramenta.
+
+    Attributes:
+        kernel (str): 'linear', 'polinomial' ou 'rbf'
+        grau (int): Grau do kernel polinomial
+        gamma (float): Parâmetro de escala do kernel
+        coef0 (float): Termo independente do kernel polinomial
+        taxa_aprendizado (float): Taxa de aprendizado
+        max_iteracoes (int): Número máximo de épocas
+        semente (Optional[int]): Semente da ordem embaralhada
+        embaralhar (bool): Visita as amostras em uma permutação nova a cada época
+        max_vetores_suporte (Optional[int]): Limite de vetores de suporte durante o treinamento
+        limite_cache_bytes (int): Memória máxima do cache de linhas de Gram
+        normalizacao_params (dict): Parâmetros de normalização das características físicas
+        vetores_suporte (np.ndarray): Matriz (k, d) dos vetores de suporte
+        coeficientes (np.ndarray): Coeficiente de cada vetor de suporte (taxa * erro acumulado)
+        bias (float): Bias
+        historico_treinamento (HistoricoTreinamento): Erros e acurácia por época
+        estatisticas_cache (dict): Acertos, falhas e capacidade do cache do último treinamento
+    """
+
+    def __init__(self, kernel: str = 'rbf', grau: int = 2, gamma: float = 1.0, coef0: float = 1.0,
+                 taxa_aprendizado: float = 0.1, max_iteracoes: int = 100,
+                 semente: Optional[int] = None, embaralhar: bool = False,
+                 max_vetores_suporte: Optional[int] = None,
+                 limite_cache_bytes: int = LIMITE_CACHE_GRAM,
+                 normalizacao_params: Optional[dict] = None):
+        if kernel not in KERNELS:
+            raise ValueError(f"Kernel desconhecido: {kernel}")
+        if max_vetores_suporte is not None and max_vetores_suporte < 1:
+            raise ValueError("max_vetores_suporte deve ser um inteiro positivo")
+        if max_iteracoes < 1:
+            raise ValueError("max_iteracoes deve ser um inteiro positivo")
+        self.kernel = kernel
+        self.grau = grau
+        self.gamma = gamma
+        self.coef0 = coef0
+        self.taxa_aprendizado = taxa_aprendizado
+        self.max_iteracoes = max_iteracoes
+        self.semente = semente
+        self.embaralhar = embaralhar
+        self.max_vetores_suporte = max_vetores_suporte
+        self.limite_cache_bytes = limite_cache_bytes
+        self.normalizacao_params = normalizacao_params or json.loads(json.dumps(NORMALIZACAO_PADRAO))
+        self.vetores_suporte = None
+        self.coeficientes = None
+        self.bias = None
+        self.historico_treinamento = HistoricoTreinamento()
+        self.estatisticas_cache = {}
+
+    def _kernel(self, A: np.ndarray, B: np.ndarray) -> np.ndarray:
+        return calcular_kernel(A, B, self.kernel, self.grau, self.gamma, self.coef0)
+
+    def codificar(self, linhas: List[List]) -> np.ndarray:
+        """Matriz (n, 14) de features das linhas brutas (mesma codificação do Perceptron linear)."""
+        return codificar_linhas(self, linhas)
+
+    def treinar_matriz(self, X: np.ndarray, y: np.ndarray) -> None:
+        """
+        Treina a partir das features codificadas.
+
+        Args:
+            X (np.ndarray): Matriz (n, d) de features
+            y (np.ndarray): Rótulos eh_ferramenta (n,)
+        """
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        n_amostras = X.shape[0]
+        if n_amostras == 0:
+            raise ValueError("Nenhuma amostra para treinar")
+
+        cache = CacheGram(X, self, self.limite_cache_bytes)
+        estado = {
+            'alfa': np.zeros(n_amostras),           # Coeficiente dual de cada amostra
+            'margens': np.zeros(n_amostras),        # Soma dos kernels ponderados (sem o bias)
+            'bias': 0.0,
+            'n_vetores': 0
+        }
+        amostrador = None
+        if self.embaralhar:
+            from amostragem import AmostradorEpocas
+            amostrador = AmostradorEpocas(n_amostras, self.semente)
+
+        print(f"Treinando Perceptron com kernel {self.kernel}: {n_amostras} amostras, "
+              f"{X.shape[1]} características (cache de {cache.capacidade} linhas de Gram)")
+        self.historico_treinamento.reservar(self.max_iteracoes)
+        for iteracao in range(self.max_iteracoes):
+            ordem = amostrador.ordem_epoca() if amostrador is not None else None
+            erros = self._epoca(y, ordem, cache, estado)
+            self.historico_treinamento.registrar(erros, ((n_amostras - erros) / n_amostras) * 100)
+            if erros == 0:
+                print(f"Convergência alcançada na iteração {iteracao + 1}")
+                break
+        else:
+            print(f"Treinamento completo após {self.max_iteracoes} iterações")
+        self.historico_treinamento.descarregar()
+
+        suporte = np.flatnonzero(estado['alfa'])
+        self.vetores_suporte = X[suporte].copy()
+        self.coeficientes = estado['alfa'][suporte]
+        self.bias = float(estado['bias'])
+        self.estatisticas_cache = {'acertos': cache.acertos, 'falhas': cache.falhas,
+                                   'capacidade': cache.capacidade}
+        antes = len(self.coeficientes)
+        self.compactar()
+        print(f"Vetores de suporte: {len(self.coeficientes)} ({antes - len(self.coeficientes)} "
+              f"repetidos fundidos)")
+        print(f"Acurácia final no treinamento: {self.historico_treinamento[-1]['acuracia']:.1f}%")
+
+    def _epoca(self, y: np.ndarray, ordem: Optional[np.ndarray], cache: CacheGram, estado: dict) -> int:
+        """
+        Uma época: procura o próximo erro em blocos (como o motor NumPy linear).
+
+        Com as margens de todas as amostras sempre atualizadas, basta olhar
+        o sinal delas; cada erro soma uma linha de Gram às margens.
+        """
+        n_amostras = len(y)
+        taxa = self.taxa_aprendizado
+        alfa = estado['alfa']
+        margens = estado['margens']
+        erros = 0
+        inicio = 0
+        bloco = 64
+
+        while inicio < n_amostras:
+            fim = min(inicio + bloco, n_amostras)
+            selecao = slice(inicio, fim) if ordem is None else ordem[inicio:fim]
+            erro = y[selecao] - (margens[selecao] + estado['bias'] >= 0)
+            errados = np.flatnonzero(erro)
+
+            if errados.size == 0:
+                bloco = min(bloco * 2, 8192)
+                inicio = fim
+                continue
+
+            k = int(errados[0])
+            i = inicio + k if ordem is None else int(ordem[inicio + k])
+            passo = taxa * float(erro[k])
+            if alfa[i] == 0:
+                estado['n_vetores'] += 1
+            alfa[i] += passo
+            margens += passo * cache.linha(i)
+            estado['bias'] += passo
+            erros += 1
+
+            if self.max_vetores_suporte is not None and estado['n_vetores'] > self.max_vetores_suporte:
+                self._descartar_vetor(i, cache, estado)
+            bloco = max(16, min(2 * (k + 1), 8192))
+            inicio += k + 1
+
+        return erros
+
+    @staticmethod
+    def _descartar_vetor(protegido: int, cache: CacheGram, estado: dict) -> None:
+        """Remove o vetor de suporte de menor coeficiente (exceto o recém-atualizado)."""
+        alfa = estado['alfa']
+        magnitudes = np.where(alfa != 0, np.abs(alfa), np.inf)
+        magnitudes[protegido] = np.inf
+        j = int(np.argmin(magnitudes))
+        estado['margens'] -= alfa[j] * cache.linha(j)
+        estado['bias'] -= alfa[j]
+        alfa[j] = 0.0
+        estado['n_vetores'] -= 1
+
+    def compactar(self) -> None:
+        """Funde vetores de suporte idênticos (somando os coeficientes) e remove os de coeficiente nulo."""
+        if self.vetores_suporte is None or len(self.coeficientes) == 0:
+            return
+        unicos, inverso = np.unique(self.vetores_suporte, axis=0, return_inverse=True)
+        coeficientes = np.bincount(inverso.ravel(), weights=self.coeficientes, minlength=len(unicos))
+        mantidos = coeficientes != 0
+        self.vetores_suporte = np.ascontiguousarray(unicos[mantidos])
+        self.coeficientes = coeficientes[mantidos]
+
+    def margens(self, X: np.ndarray) -> np.ndarray:
+        """
+        Saídas do modelo, pontuando em blocos de no máximo `LIMITE_BLOCO_PREDICAO` bytes.
+
+        Args:
+            X (np.ndarray): Matriz (n, d) de features
+
+        Returns:
+            np.ndarray: Margens (n,)
+        """
+        if self.coeficientes is None:
+            raise ValueError("Modelo não foi treinado ainda!")
+        X = np.asarray(X, dtype=np.float64)
+        margens = np.full(X.shape[0], self.bias)
+        n_vetores = len(self.coeficientes)
+        if n_vetores == 0:
+            return margens
+        bloco = max(1, LIMITE_BLOCO_PREDICAO // (8 * n_vetores))
+        for inicio in range(0, X.shape[0], bloco):
+            fim = inicio + bloco
+            margens[inicio:fim] += self._kernel(X[inicio:fim], self.vetores_suporte) @ self.coeficientes
+        return margens
+
+    def prever_lote(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Classifica vários itens.
+
+        Args:
+            X: Matriz (n, d) de features ou lista de linhas brutas
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Predições (1=ferramenta, 0=não-ferramenta) e margens
+        """
+        if not (isinstance(X, np.ndarray) and X.ndim == 2 and X.dtype.kind == 'f'):
+            X = self.codificar(X)
+        margens = self.margens(X)
+        return (margens >= 0).astype(np.int64), margens
+
+    def prever_item(self, item_data: List) -> int:
+        """
+        Faz predição para um único item.
+
+        Args:
+            item_data (List): Dados do item (mesmo formato do dataset)
+
+        Returns:
+            int: Predição (1=ferramenta, 0=não-ferramenta)
+        """
+        predicoes, _ = self.prever_lote([item_data])
+        return int(predicoes[0])
+
+    def avaliar_matriz(self, X: np.ndarray, y: np.ndarray) -> float:
+        """
+        Acurácia sobre features codificadas.
+
+        Args:
+            X (np.ndarray): Matriz (n, d) de features
+            y (np.ndarray): Rótulos reais (n,)
+
+        Returns:
+            float: Acurácia em percentual
+        """
+        predicoes, _ = self.prever_lote(np.asarray(X, dtype=np.float64))
+        return (np.count_nonzero(predicoes == np.asarray(y)) / len(y)) * 100
+
+    def salvar(self, caminho_arquivo: str) -> None:
+        """
+        Salva o modelo (mesmo esquema de PerceptronFerramentas.salvar).
+
+        Após os metadados: vetores de suporte (k x d), coeficientes (k) e bias, em float64.
+
+        Args:
+            caminho_arquivo (str): Caminho do arquivo
+        """
+        if self.coeficientes is None:
+            raise ValueError("Modelo não foi treinado ainda!")
+        metadados = json.dumps({
+            'kernel': self.kernel,
+            'grau': self.grau,
+            'gamma': self.gamma,
+            'coef0': self.coef0,
+            'taxa_aprendizado': self.taxa_aprendizado,
+            'max_iteracoes': self.max_iteracoes,
+            'semente': self.semente,
+            'normalizacao_params': self.normalizacao_params,
+            'n_vetores_suporte': len(self.coeficientes),
+            'n_caracteristicas': self.vetores_suporte.shape[1]
+        }).encode('utf-8')
+        with open(caminho_arquivo, 'wb') as arquivo:
+            arquivo.write(MAGICO_KERNEL)
+            arquivo.write(struct.pack('<HI', VERSAO_FORMATO_KERNEL, len(metadados)))
+            arquivo.write(metadados)
+            arquivo.write(self.vetores_suporte.astype('<f8').tobytes())
+            arquivo.write(self.coeficientes.astype('<f8').tobytes())
+            arquivo.write(struct.pack('<d', self.bias))
+
+    @classmethod
+    def carregar(cls, caminho_arquivo: str) -> 'PerceptronKernel':
+        """
+        Carrega um modelo salvo com `salvar`.
+
+        Args:
+            caminho_arquivo (str): Caminho do arquivo
+
+        Returns:
+            PerceptronKernel: Modelo pronto para predição
+        """
+        metadados, conteudo, posicao = ler_arquivo_modelo(
+            caminho_arquivo, MAGICO_KERNEL, VERSAO_FORMATO_KERNEL, "um Perceptron com kernel")
+        modelo = cls(metadados['kernel'], metadados['grau'], metadados['gamma'], metadados['coef0'],
+                     metadados['taxa_aprendizado'], metadados['max_iteracoes'], metadados['semente'],
+                     normalizacao_params=metadados['normalizacao_params'])
+        k, d = metadados['n_vetores_suporte'], metadados['n_caracteristicas']
+        valores = np.frombuffer(conteudo, dtype='<f8', count=k * d + k + 1, offset=posicao)
+        modelo.vetores_suporte = valores[:k * d].reshape(k, d).astype(np.float64)
+        modelo.coeficientes = valores[k * d:k * d + k].astype(np.float64)
+        modelo.bias = float(valores[-1])
+        return modelo
+
+
+def main():
+    """Linha de comando: treina e avalia o modelo não linear escolhido."""
+    from classificador_ferramentas import PerceptronFerramentas, carregar_dataset_csv
+    from motor_vetorizado import codificar_matriz
+    from normalizacao import ajustar_normalizacao
+
+    parser = argparse.ArgumentParser(description="Perceptron com kernel ou expansão de grau 2")
+    parser.add_argument('--treino', default='data/dataset_ferramentas.csv')
+    parser.add_argument('--teste', default='data/dataset_teste.csv')
+    parser.add_argument('--kernel', choices=list(KERNELS) + ['grau2'], default='rbf',
+                        help="'grau2' treina o Perceptron linear sobre a expansão de grau 2")
+    parser.add_argument('--grau', type=int, default=2)
+    parser.add_argument('--gamma', type=float, default=1.0)
+    parser.add_argument('--coef0', type=float, default=1.0)
+    parser.add_argument('--max-iteracoes', type=int, default=100)
+    parser.add_argument('--semente', type=int, default=None)
+    parser.add_argument('--embaralhar', action='store_true')
+    parser.add_argument('--max-vetores-suporte', type=int, default=None)
+    parser.add_argument('--limite-cache-mb', type=float, default=LIMITE_CACHE_GRAM / 2 ** 20,
+                        help="Memória máxima das linhas de Gram guardadas no treinamento")
+    parser.add_argument('--salvar', default=None, help="Arquivo do modelo com kernel treinado (não disponível com grau2)")
+    args = parser.parse_args()
+    if args.salvar and args.kernel == 'grau2':
+        # O modelo linear salvo não guarda a expansão: os caminhos de predição
+        # o usariam sobre as 14 características originais
+        parser.error("--salvar não é suportado com --kernel grau2")
+
+    dados_treino = carregar_dataset_csv(args.treino)
+    dados_teste = carregar_dataset_csv(args.teste)
+    if dados_treino is None or dados_teste is None:
+        return
+    normalizacao_params = ajustar_normalizacao(args.treino)
+
+    if args.kernel == 'grau2':
+        modelo = PerceptronFerramentas(max_iteracoes=args.max_iteracoes, semente=args.semente,
+                                       embaralhar=args.embaralhar)
+        modelo.normalizacao_params = normalizacao_params
+        X, y = codificar_matriz(modelo, dados_treino)
+        X_teste, y_teste = codificar_matriz(modelo, dados_teste)
+        modelo.treinar_matriz(expandir_grau2(X), y)
+        acuracia_teste = modelo.avaliar_matriz(expandir_grau2(X_teste), y_teste)
+    else:
+        modelo = PerceptronKernel(args.kernel, args.grau, args.gamma, args.coef0,
+                                  max_iteracoes=args.max_iteracoes, semente=args.semente,
+                                  embaralhar=args.embaralhar,
+                                  max_vetores_suporte=args.max_vetores_suporte,
+                                  limite_cache_bytes=int(args.limite_cache_mb * 2 ** 20),
+                                  normalizacao_params=normalizacao_params)
+        X, y = codificar_matriz(modelo, dados_treino)
+        X_teste, y_teste = codificar_matriz(modelo, dados_teste)
+        modelo.treinar_matriz(X, y)
+        acuracia_teste = modelo.avaliar_matriz(X_teste, y_teste)
+        print(f"Cache de Gram: {modelo.estatisticas_cache}")
+        if args.salvar:
+            modelo.salvar(args.salvar)
+            print(f"Modelo salvo em: {args.salvar}")
+
+    print(f"Épocas: {len(modelo.historico_treinamento)}, "
+          f"convergiu: {modelo.historico_treinamento[-1]['erros'] == 0}")
+    print(f"ACURÁCIA NO DATASET DE TESTE: {acuracia_teste:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compartilhamento de arrays NumPy entre processos via memória compartilhada.
+
+O processo principal copia cada array uma única vez para um segmento de
+`multiprocessing.shared_memory`; os processos trabalhadores recebem apenas a
+descrição (nome, forma, dtype) e mapeiam o mesmo segmento, sem que os dados
+sejam serializados a cada tarefa.
+"""
+
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+# Descrição de um array compartilhado: (nome do segmento, forma, dtype)
+DescricaoArray = Tuple[str, Tuple[int, ...], str]
+
+
+def compartilhar_arrays(arrays: Dict[str, np.ndarray]) -> Tuple[List[shared_memory.SharedMemory],
+                                                                 Dict[str, DescricaoArray]]:
+    """
+    Copia arrays para segmentos de memória compartilhada.
+
+    Args:
+        arrays (Dict[str, np.ndarray]): Arrays a compartilhar, por nome
+
+    Returns:
+        Tuple: Segmentos criados (liberar com `liberar_segmentos`) e descrições por nome
+    """
+    segmentos = []
+    descricoes = {}
+    try:
+        for nome, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            segmento = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+            segmentos.append(segmento)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=segmento.buf)[...] = array
+            descricoes[nome] = (segmento.name, array.shape, array.dtype.str)
+    except BaseException:
+        liberar_segmentos(segmentos)
+        raise
+    return segmentos, descricoes
+
+
+def anexar_arrays(descricoes: Dict[str, DescricaoArray]) -> Tuple[List[shared_memory.SharedMemory],
+                                                                  Dict[str, np.ndarray]]:
+    """
+    Mapeia, em um processo trabalhador, arrays criados por `compartilhar_arrays`.
+
+    Os segmentos retornados devem ser mantidos vivos enquanto os arrays forem usados.
+
+    Args:
+        descricoes (Dict[str, DescricaoArray]): Descrições por nome
+
+    Returns:
+        Tuple: Segmentos anexados e arrays (somente leitura) por nome
+    """
+    segmentos = []
+    arrays = {}
+    for nome, (nome_segmento, forma, dtype) in descricoes.items():
+        segmento = shared_memory.SharedMemory(name=nome_segmento)
+        segmentos.append(segmento)
+        array = np.ndarray(forma, dtype=np.dtype(dtype), buffer=segmento.buf)
+        array.flags.writeable = False
+        arrays[nome] = array
+    return segmentos, arrays
+
+
+def liberar_segmentos(segmentos: List[shared_memory.SharedMemory]) -> None:
+    """Fecha e remove segmentos criados por `compartilhar_arrays`."""
+    for segmento in segmentos:
+        segmento.close()
+        segmento.unlink()
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motor vetorizado (NumPy) do Perceptron de classificação de ferramentas.
+
+As amostras ficam em uma matriz contígua (n_amostras x 14) e os produtos
+escalares e atualizações de pesos são feitos com operações de array, em vez
+de laços Python sobre listas.
+"""
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+# Colunas numéricas do CSV usadas na codificação:
+# peso, dureza, tamanho, tem_cabo, material_metalico, cod_funcao
+COLUNAS_NUMERICAS = [1, 2, 3, 4, 5, 7]
+
+N_CARACTERISTICAS_FISICAS = 5
+N_FUNCOES = 9
+N_CARACTERISTICAS = N_CARACTERISTICAS_FISICAS + N_FUNCOES
+
+
+def codificar_colunas(modelo, valores: np.ndarray, dtype=np.float64) -> np.ndarray:
+    """
+    Codifica colunas numéricas já convertidas na matriz de features.
+
+    Aplica a mesma normalização e o mesmo one-hot de `preparar_features`.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo com os parâmetros de normalização
+        valores (np.ndarray): Matriz (n, 6) com peso, dureza, tamanho, cabo, metal e cod_funcao
+        dtype: Tipo de ponto flutuante da matriz resultante
+
+    Returns:
+        np.ndarray: Matriz contígua (n, 14) de features
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    n_amostras = valores.shape[0]
+    X = np.zeros((n_amostras, N_CARACTERISTICAS), dtype=np.float64)
+
+    normalizar_fisicas(modelo, valores, X)
+    X[:, 3] = valores[:, 3]
+    X[:, 4] = valores[:, 4]
+
+    # One-hot da função: códigos fora de 1-9 ficam com o bloco zerado
+    codigos = valores[:, 5].astype(np.int64)
+    validos = np.nonzero((codigos >= 1) & (codigos <= N_FUNCOES))[0]
+    X[validos, N_CARACTERISTICAS_FISICAS - 1 + codigos[validos]] = 1.0
+
+    return np.ascontiguousarray(X, dtype=dtype)
+
+
+def normalizar_fisicas(modelo, valores: np.ndarray, X: np.ndarray) -> None:
+    """
+    Escreve peso, dureza e tamanho normalizados nas 3 primeiras colunas de X.
+
+    As demais colunas não são tocadas, então uma matriz já codificada pode
+    ser reaproveitada com outra normalização (ex.: um fold da validação cruzada).
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo com os parâmetros de normalização
+        valores (np.ndarray): Matriz (n, 3 ou mais) com peso, dureza e tamanho brutos nas 3 primeiras colunas
+        X (np.ndarray): Matriz (n, 14) de features, alterada no lugar
+    """
+    for coluna, tipo in enumerate(('peso', 'dureza', 'tamanho')):
+        params = modelo.normalizacao_params[tipo]
+        bruto = np.asarray(valores[:, coluna], dtype=np.float64)
+        normalizado = (bruto - params['min']) / (params['max'] - params['min'])
+        X[:, coluna] = np.clip(normalizado, 0.0, 1.0)
+
+
+def codificar_linhas(modelo, linhas: List[List], dtype=np.float64) -> np.ndarray:
+    """
+    Converte linhas brutas (com ou sem rótulo) na matriz de features.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo com os parâmetros de normalização
+        linhas (List[List]): Linhas no formato [nome, peso, dureza, tamanho, cabo, metal, preco, cod_funcao, ...]
+        dtype: Tipo de ponto flutuante da matriz
+
+    Returns:
+        np.ndarray: Matriz contígua (n, 14) de features
+    """
+    valores = np.array([[linha[c] for c in COLUNAS_NUMERICAS] for linha in linhas],
+                       dtype=np.float64).reshape(-1, len(COLUNAS_NUMERICAS))
+    return codificar_colunas(modelo, valores, dtype)
+
+
+def codificar_matriz(modelo, dados_brutos: List[List], dtype=np.float64) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converte os dados brutos do CSV em matriz de features e vetor de rótulos.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo com os parâmetros de normalização
+        dados_brutos (List[List]): Linhas do dataset (mesmo formato de `carregar_dataset_csv`)
+        dtype: Tipo de ponto flutuante da matriz (float32 ou float64)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Matriz (n, 14) e rótulos eh_ferramenta (n,)
+    """
+    y = np.array([int(linha[-1]) for linha in dados_brutos], dtype=np.int8)
+    return codificar_linhas(modelo, dados_brutos, dtype), y
+
+
+def pontuar(X: np.ndarray, pesos, bias: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula predições e margens de todas as linhas com um único produto matriz-vetor.
+
+    Args:
+        X (np.ndarray): Matriz (n, 14) de features codificadas
+        pesos: Pesos do modelo
+        bias (float): Bias do modelo
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Predições (0/1, int8) e margens (saída linear)
+    """
+    margens = X @ np.asarray(pesos, dtype=X.dtype) + bias
+    return (margens >= 0).astype(np.int8), margens
+
+
+def contar_erros(X: np.ndarray, y: np.ndarray, pesos, bias: float, tamanho_bloco: int = 65536,
+                 indices: Optional[np.ndarray] = None) -> int:
+    """
+    Conta as amostras classificadas erradas por pesos fixos.
+
+    Args:
+        X (np.ndarray): Matriz (n, 14) de features
+        y (np.ndarray): Rótulos (n,)
+        pesos: Pesos a avaliar
+        bias (float): Bias a avaliar
+        tamanho_bloco (int): Linhas pontuadas por vez (limita a memória temporária)
+        indices (Optional[np.ndarray]): Linhas avaliadas (None = todas); só os
+            blocos em uso são copiados
+
+    Returns:
+        int: Número de amostras classificadas erradas
+    """
+    pesos = np.asarray(pesos, dtype=X.dtype)
+    n_amostras = X.shape[0] if indices is None else len(indices)
+    erros = 0
+    for inicio in range(0, n_amostras, tamanho_bloco):
+        selecao = (slice(inicio, inicio + tamanho_bloco) if indices is None
+                   else indices[inicio:inicio + tamanho_bloco])
+        predicoes = X[selecao] @ pesos + bias >= 0
+        erros += int(np.count_nonzero(predicoes != y[selecao]))
+    return erros
+
+
+class TreinadorVetorizado:
+    """
+    Aplica a regra do perceptron sobre matrizes NumPy.
+
+    No modo por amostra (`tamanho_lote=None`) os pesos evoluem exatamente como
+    na regra amostra a amostra: as margens de um bloco de amostras são
+    calculadas de uma vez com os pesos atuais e a varredura só é interrompida
+    na primeira amostra classificada errada, onde a atualização é aplicada.
+    No modo em lotes ("batch perceptron") os erros de cada bloco de
+    `tamanho_lote` amostras são acumulados e aplicados em uma única atualização.
+
+    O estado (pesos e bias) persiste entre chamadas de `processar`, então uma
+    época pode ser feita de uma vez ou bloco a bloco a partir de um arquivo.
+
+    Com `media=True` o treinador também mantém a média dos pesos após cada
+    amostra (perceptron médio), usando a soma das atualizações ponderadas pelo
+    instante em que ocorreram, sem custo por amostra correta.
+
+    Attributes:
+        pesos (np.ndarray): Pesos atuais
+        bias (float): Bias atual
+        n_atualizacoes (int): Atualizações de pesos aplicadas até agora
+        ao_atualizar: Gancho opcional (posicao, n_errados) chamado a cada atualização
+    """
+
+    BLOCO_MINIMO = 16
+    BLOCO_MAXIMO = 8192
+
+    def __init__(self, pesos: List[float], bias: float, taxa_aprendizado: float,
+                 tamanho_lote: Optional[int] = None, dtype=np.float64, media: bool = False):
+        if tamanho_lote is not None and tamanho_lote < 1:
+            raise ValueError("tamanho_lote deve ser um inteiro positivo")
+        self.pesos = np.array(pesos, dtype=dtype)
+        self.bias = float(bias)
+        self.taxa_aprendizado = taxa_aprendizado
+        self.tamanho_lote = tamanho_lote
+        self.media = media
+        self._bloco = 64
+        # Estado do perceptron médio: amostras vistas e soma de (instante - 1) * atualização
+        self._n_vistos = 0
+        self._soma_atualizacoes = np.zeros(len(self.pesos), dtype=np.float64)
+        self._soma_atualizacoes_bias = 0.0
+        self.n_atualizacoes = 0
+        self.ao_atualizar = None
+
+    def pesos_atuais(self) -> Tuple[np.ndarray, float]:
+        """Retorna uma cópia dos pesos e o bias atuais."""
+        return self.pesos.copy(), self.bias
+
+    def pesos_medios(self) -> Tuple[np.ndarray, float]:
+        """
+        Retorna a média dos pesos e do bias sobre todas as amostras vistas.
+
+        Returns:
+            Tuple[np.ndarray, float]: Pesos médios (float64) e bias médio
+        """
+        if not self.media:
+            raise ValueError("Treinador criado sem media=True")
+        if self._n_vistos == 0:
+            return self.pesos.astype(np.float64), self.bias
+        return (self.pesos - self._soma_atualizacoes / self._n_vistos,
+                self.bias - self._soma_atualizacoes_bias / self._n_vistos)
+
+    def _acumular_media(self, instante: int, delta: np.ndarray, delta_bias: float) -> None:
+        # Atualização aplicada após a amostra de número `instante` (1-based)
+        self._soma_atualizacoes += (instante - 1) * delta
+        self._soma_atualizacoes_bias += (instante - 1) * delta_bias
+
+    def processar(self, X: np.ndarray, y: np.ndarray, ordem: Optional[np.ndarray] = None) -> int:
+        """
+        Aplica a regra de aprendizado sobre as amostras.
+
+        Args:
+            X (np.ndarray): Matriz (n, 14) de features
+            y (np.ndarray): Rótulos (n,)
+            ordem (Optional[np.ndarray]): Índices na ordem de visita (None = ordem das
+                linhas). Só os blocos em uso são copiados, nunca X inteiro; os
+                índices podem cobrir só parte das linhas (um fold de treino).
+
+        Returns:
+            int: Número de amostras classificadas erradas
+        """
+        X = np.asarray(X, dtype=self.pesos.dtype)
+        y = np.asarray(y, dtype=self.pesos.dtype)
+        if self.tamanho_lote is None:
+            erros = self._por_amostra(X, y, ordem)
+        else:
+            erros = self._em_lotes(X, y, ordem)
+        self._n_vistos += X.shape[0] if ordem is None else len(ordem)
+        return erros
+
+    def _por_amostra(self, X: np.ndarray, y: np.ndarray, ordem: Optional[np.ndarray]) -> int:
+        n_amostras = X.shape[0] if ordem is None else len(ordem)
+        taxa = self.taxa_aprendizado
+        erros = 0
+        inicio = 0
+
+        while inicio < n_amostras:
+            fim = min(inicio + self._bloco, n_amostras)
+            selecao = slice(inicio, fim) if ordem is None else ordem[inicio:fim]
+            Xb = X[selecao]
+            margens = Xb @ self.pesos + self.bias
+            erro = y[selecao] - (margens >= 0)
+            errados = np.flatnonzero(erro)
+
+            if errados.size == 0:
+                # Bloco inteiro correto: tenta blocos maiores
+                self._bloco = min(self._bloco * 2, self.BLOCO_MAXIMO)
+                inicio = fim
+                continue
+
+            k = int(errados[0])
+            e = float(erro[k])
+            delta = (taxa * e) * Xb[k]
+            self.pesos += delta
+            self.bias += taxa * e
+            erros += 1
+            if self.media:
+                self._acumular_media(self._n_vistos + inicio + k + 1, delta, taxa * e)
+            if self.ao_atualizar is not None:
+                self.ao_atualizar(inicio + k, 1)
+            # Ajusta o bloco à distância típica entre erros
+            self._bloco = max(self.BLOCO_MINIMO, min(2 * (k + 1), self.BLOCO_MAXIMO))
+            inicio += k + 1
+
+        self.n_atualizacoes += erros
+        return erros
+
+    def _em_lotes(self, X: np.ndarray, y: np.ndarray, ordem: Optional[np.ndarray]) -> int:
+        n_amostras = X.shape[0] if ordem is None else len(ordem)
+        taxa = self.taxa_aprendizado
+        erros = 0
+
+        for inicio in range(0, n_amostras, self.tamanho_lote):
+            fim = inicio + self.tamanho_lote
+            selecao = slice(inicio, fim) if ordem is None else ordem[inicio:fim]
+            Xb = X[selecao]
+            erro = y[selecao] - (Xb @ self.pesos + self.bias >= 0)
+            n_errados = int(np.count_nonzero(erro))
+            if n_errados:
+                erros += n_errados
+                delta = taxa * (erro @ Xb)
+                delta_bias = taxa * float(erro.sum())
+                self.pesos += delta
+                self.bias += delta_bias
+                self.n_atualizacoes += 1
+                if self.media:
+                    self._acumular_media(self._n_vistos + min(fim, n_amostras), delta, delta_bias)
+                if self.ao_atualizar is not None:
+                    self.ao_atualizar(min(fim, n_amostras) - 1, n_errados)
+
+        return erros
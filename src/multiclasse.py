@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Predição do código de função (1-9) a partir das características físicas.
+
+Banco de 9 perceptrons um-contra-todos guardado como uma única matriz de
+pesos (9 x 5): um produto matriz-vetor pontua todas as funções de uma vez, e
+a predição é a função de maior margem. Permite classificar itens que chegam
+sem código de função.
+"""
+
+import json
+import random
+import struct
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from historico import HistoricoTreinamento
+from motor_vetorizado import (COLUNAS_NUMERICAS, N_CARACTERISTICAS_FISICAS, N_FUNCOES,
+                              codificar_colunas)
+from preditor import MAGICO_FUNCOES, NORMALIZACAO_PADRAO, VERSAO_FORMATO_FUNCOES, ler_arquivo_modelo
+
+
+def codigo_ausente(valor) -> bool:
+    """Indica se o campo cod_funcao está vazio ou fora do intervalo 1-9."""
+    try:
+        return not 1 <= int(float(valor)) <= N_FUNCOES
+    except (TypeError, ValueError):
+        return True
+
+
+class PerceptronFuncoes:
+    """
+    Perceptron multiclasse (um-contra-todos) para o código de função.
+
+    Attributes:
+        taxa_aprendizado (float): Taxa de aprendizado
+        max_iteracoes (int): Número máximo de épocas
+        semente (Optional[int]): Semente da inicialização dos pesos
+        normalizacao_params (dict): Parâmetros de normalização das características físicas
+        pesos (np.ndarray): Matriz (9, 5) de pesos, uma linha por função
+        bias (np.ndarray): Bias (9,) de cada função
+        historico_treinamento (HistoricoTreinamento): Atualizações e acurácia por época
+    """
+
+    def __init__(self, taxa_aprendizado: float = 0.1, max_iteracoes: int = 1000,
+                 semente: Optional[int] = None, normalizacao_params: Optional[dict] = None):
+        """
+        Inicializa o banco de perceptrons.
+
+        Args:
+            taxa_aprendizado (float): Taxa de aprendizado (padrão: 0.1)
+            max_iteracoes (int): Máximo de épocas (padrão: 1000)
+            semente (Optional[int]): Semente da inicialização (padrão: aleatória)
+            normalizacao_params (Optional[dict]): Normalização (padrão: a mesma de PerceptronFerramentas)
+        """
+        if max_iteracoes < 1:
+            raise ValueError("max_iteracoes deve ser um inteiro positivo")
+        self.taxa_aprendizado = taxa_aprendizado
+        self.max_iteracoes = max_iteracoes
+        self.semente = semente
+        self.normalizacao_params = normalizacao_params or json.loads(json.dumps(NORMALIZACAO_PADRAO))
+        self.pesos = None
+        self.bias = None
+        self.historico_treinamento = HistoricoTreinamento()
+
+    def codificar(self, linhas: List[List]) -> np.ndarray:
+        """
+        Codifica as características físicas de linhas brutas.
+
+        Args:
+            linhas (List[List]): Linhas no formato do dataset (cod_funcao pode estar vazio)
+
+        Returns:
+            np.ndarray: Matriz (n, 5) de características físicas normalizadas
+        """
+        valores = np.array([[linha[c] for c in COLUNAS_NUMERICAS[:N_CARACTERISTICAS_FISICAS]] + [0]
+                            for linha in linhas], dtype=np.float64)
+        return codificar_colunas(self, valores.reshape(-1, N_CARACTERISTICAS_FISICAS + 1))[:, :N_CARACTERISTICAS_FISICAS]
+
+    def treinar_matriz(self, X: np.ndarray, codigos: np.ndarray) -> None:
+        """
+        Treina os 9 perceptrons juntos a partir das características físicas.
+
+        Cada amostra atualiza apenas as funções que ela classificou errado; a
+        varredura é feita em blocos como no motor vetorizado binário.
+
+        Args:
+            X (np.ndarray): Matriz (n, 5) ou (n, 14) de features (usa as 5 primeiras colunas)
+            codigos (np.ndarray): Códigos de função 1-9 (n,)
+        """
+        X = np.ascontiguousarray(np.asarray(X, dtype=np.float64)[:, :N_CARACTERISTICAS_FISICAS])
+        codigos = np.asarray(codigos, dtype=np.int64)
+        if np.any((codigos < 1) | (codigos > N_FUNCOES)):
+            raise ValueError("Códigos de função devem estar entre 1 e 9")
+
+        n_amostras = X.shape[0]
+        alvos = np.zeros((n_amostras, N_FUNCOES), dtype=np.float64)
+        alvos[np.arange(n_amostras), codigos - 1] = 1.0
+
+        gerador = random.Random(self.semente)
+        self.pesos = np.array([[gerador.uniform(-0.1, 0.1) for _ in range(N_CARACTERISTICAS_FISICAS)]
+                               for _ in range(N_FUNCOES)])
+        self.bias = np.array([gerador.uniform(-0.1, 0.1) for _ in range(N_FUNCOES)])
+
+        print(f"Treinando preditor de funções: {n_amostras} amostras, {N_FUNCOES} funções")
+        self.historico_treinamento.reservar(self.max_iteracoes)
+        for iteracao in range(self.max_iteracoes):
+            atualizacoes = self._epoca(X, alvos)
+            acertos = int(np.count_nonzero(self._argmax(X) == codigos))
+            self.historico_treinamento.registrar(atualizacoes, (acertos / n_amostras) * 100)
+            if atualizacoes == 0:
+                print(f"Convergência alcançada na iteração {iteracao + 1}")
+                break
+        else:
+            print(f"Treinamento completo após {self.max_iteracoes} iterações")
+
+        print(f"Acurácia do preditor de funções no treinamento: "
+              f"{self.historico_treinamento[-1]['acuracia']:.1f}%")
+
+    def treinar(self, dados_brutos: List[List]) -> None:
+        """
+        Treina a partir das linhas brutas do dataset.
+
+        Args:
+            dados_brutos (List[List]): Linhas do dataset com cod_funcao preenchido
+        """
+        codigos = np.array([int(linha[7]) for linha in dados_brutos])
+        self.treinar_matriz(self.codificar(dados_brutos), codigos)
+
+    def _epoca(self, X: np.ndarray, alvos: np.ndarray) -> int:
+        """Uma época da regra do perceptron nos 9 classificadores; retorna amostras com erro."""
+        n_amostras = X.shape[0]
+        taxa = self.taxa_aprendizado
+        com_erro = 0
+        inicio = 0
+        bloco = 64
+
+        while inicio < n_amostras:
+            fim = min(inicio + bloco, n_amostras)
+            erro = alvos[inicio:fim] - (X[inicio:fim] @ self.pesos.T + self.bias >= 0)
+            linhas_erradas = np.flatnonzero(erro.any(axis=1))
+
+            if linhas_erradas.size == 0:
+                bloco = min(bloco * 2, 8192)
+                inicio = fim
+                continue
+
+            k = int(linhas_erradas[0])
+            self.pesos += taxa * np.outer(erro[k], X[inicio + k])
+            self.bias += taxa * erro[k]
+            com_erro += 1
+            bloco = max(16, min(2 * (k + 1), 8192))
+            inicio += k + 1
+
+        return com_erro
+
+    def _argmax(self, X: np.ndarray) -> np.ndarray:
+        return np.argmax(X @ self.pesos.T + self.bias, axis=1) + 1
+
+    def prever_lote(self, X) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Prevê o código de função de vários itens com um único produto de matrizes.
+
+        Args:
+            X: Matriz (n, 5)/(n, 14) de features ou lista de linhas brutas
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Códigos previstos (1-9) e margens (n, 9)
+        """
+        if self.pesos is None:
+            raise ValueError("Modelo não foi treinado ainda!")
+        if not (isinstance(X, np.ndarray) and X.ndim == 2 and X.dtype.kind == 'f'):
+            X = self.codificar(X)
+        margens = X[:, :N_CARACTERISTICAS_FISICAS] @ self.pesos.T + self.bias
+        return np.argmax(margens, axis=1) + 1, margens
+
+    def prever_item(self, item_data: List) -> int:
+        """
+        Prevê o código de função de um único item.
+
+        Args:
+            item_data (List): [nome, peso, dureza, tamanho, cabo, metal, ...]
+
+        Returns:
+            int: Código de função previsto (1-9)
+        """
+        codigos, _ = self.prever_lote([item_data])
+        return int(codigos[0])
+
+    def completar_codigos(self, linhas: List[List]) -> int:
+        """
+        Preenche, no lugar, o cod_funcao das linhas em que ele está ausente.
+
+        Todas as linhas sem código são pontuadas em uma única chamada.
+
+        Args:
+            linhas (List[List]): Linhas no formato do dataset (listas mutáveis)
+
+        Returns:
+            int: Número de códigos preenchidos
+        """
+        pendentes = [linha for linha in linhas if codigo_ausente(linha[7])]
+        if pendentes:
+            codigos, _ = self.prever_lote(pendentes)
+            for linha, codigo in zip(pendentes, codigos):
+                linha[7] = int(codigo)
+        return len(pendentes)
+
+    def avaliar_matriz(self, X: np.ndarray, codigos: np.ndarray) -> float:
+        """
+        Acurácia da predição de função.
+
+        Args:
+            X (np.ndarray): Matriz (n, 5)/(n, 14) de features
+            codigos (np.ndarray): Códigos reais (n,)
+
+        Returns:
+            float: Acurácia em percentual
+        """
+        previstos, _ = self.prever_lote(np.asarray(X, dtype=np.float64))
+        return (np.count_nonzero(previstos == np.asarray(codigos)) / len(codigos)) * 100
+
+    def salvar(self, caminho_arquivo: str) -> None:
+        """
+        Salva o banco de perceptrons (mesmo esquema de PerceptronFerramentas.salvar).
+
+        Args:
+            caminho_arquivo (str): Caminho do arquivo
+        """
+        if self.pesos is None:
+            raise ValueError("Modelo não foi treinado ainda!")
+        metadados = json.dumps({
+            'taxa_aprendizado': self.taxa_aprendizado,
+            'max_iteracoes': self.max_iteracoes,
+            'semente': self.semente,
+            'normalizacao_params': self.normalizacao_params
+        }).encode('utf-8')
+        with open(caminho_arquivo, 'wb') as arquivo:
+            arquivo.write(MAGICO_FUNCOES)
+            arquivo.write(struct.pack('<HI', VERSAO_FORMATO_FUNCOES, len(metadados)))
+            arquivo.write(metadados)
+            arquivo.write(self.pesos.astype('<f8').tobytes())
+            arquivo.write(self.bias.astype('<f8').tobytes())
+
+    @classmethod
+    def carregar(cls, caminho_arquivo: str) -> 'PerceptronFuncoes':
+        """
+        Carrega um banco salvo com `salvar`.
+
+        Args:
+            caminho_arquivo (str): Caminho do arquivo
+
+        Returns:
+            PerceptronFuncoes: Modelo pronto para predição
+        """
+        metadados, conteudo, posicao = ler_arquivo_modelo(
+            caminho_arquivo, MAGICO_FUNCOES, VERSAO_FORMATO_FUNCOES, "um preditor de funções")
+        modelo = cls(metadados['taxa_aprendizado'], metadados['max_iteracoes'], metadados['semente'],
+                     metadados['normalizacao_params'])
+        n_pesos = N_FUNCOES * N_CARACTERISTICAS_FISICAS
+        valores = np.frombuffer(conteudo, dtype='<f8', count=n_pesos + N_FUNCOES, offset=posicao)
+        modelo.pesos = valores[:n_pesos].reshape(N_FUNCOES, N_CARACTERISTICAS_FISICAS).astype(np.float64)
+        modelo.bias = valores[n_pesos:].astype(np.float64)
+        return modelo
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ajuste dos parâmetros de normalização a partir dos dados.
+
+Calcula mínimo e máximo (e, opcionalmente, média e desvio padrão) de peso,
+dureza e tamanho em uma única passada em blocos sobre o CSV. As estatísticas
+de blocos ou de partes diferentes do arquivo são combináveis, então o
+arquivo pode ser dividido em intervalos de bytes e processado em paralelo.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from carregador_blocos import (TAMANHO_BLOCO_PADRAO, dividir_em_intervalos,
+                               iterar_linhas_intervalo)
+
+
+# Características normalizadas e suas colunas no CSV
+CARACTERISTICAS_NORMALIZADAS = ('peso', 'dureza', 'tamanho')
+COLUNAS_NORMALIZADAS = (1, 2, 3)
+
+
+class EstatisticasNormalizacao:
+    """
+    Estatísticas combináveis das características normalizadas.
+
+    Média e variância são acumuladas pela fórmula de combinação de Chan et al.
+    (soma dos quadrados dos desvios), estável em uma passada.
+
+    Attributes:
+        n (int): Amostras acumuladas
+        minimo (np.ndarray): Mínimo por característica
+        maximo (np.ndarray): Máximo por característica
+        media (np.ndarray): Média por característica
+        m2 (np.ndarray): Soma dos quadrados dos desvios em relação à média
+    """
+
+    def __init__(self):
+        k = len(CARACTERISTICAS_NORMALIZADAS)
+        self.n = 0
+        self.minimo = np.full(k, np.inf)
+        self.maximo = np.full(k, -np.inf)
+        self.media = np.zeros(k)
+        self.m2 = np.zeros(k)
+
+    def atualizar(self, valores: np.ndarray) -> None:
+        """
+        Acumula um bloco de valores.
+
+        Args:
+            valores (np.ndarray): Matriz (n, 3) com peso, dureza e tamanho
+        """
+        valores = np.asarray(valores, dtype=np.float64)
+        if len(valores) == 0:
+            return
+        bloco = EstatisticasNormalizacao()
+        bloco.n = len(valores)
+        bloco.minimo = valores.min(axis=0)
+        bloco.maximo = valores.max(axis=0)
+        bloco.media = valores.mean(axis=0)
+        bloco.m2 = ((valores - bloco.media) ** 2).sum(axis=0)
+        self.combinar(bloco)
+
+    def combinar(self, outra: 'EstatisticasNormalizacao') -> 'EstatisticasNormalizacao':
+        """
+        Incorpora as estatísticas de outro bloco ou parte do arquivo.
+
+        Args:
+            outra (EstatisticasNormalizacao): Estatísticas a incorporar
+
+        Returns:
+            EstatisticasNormalizacao: Este acumulador
+        """
+        if outra.n == 0:
+            return self
+        n = self.n + outra.n
+        delta = outra.media - self.media
+        self.media = self.media + delta * (outra.n / n)
+        self.m2 = self.m2 + outra.m2 + delta ** 2 * (self.n * outra.n / n)
+        self.minimo = np.minimum(self.minimo, outra.minimo)
+        self.maximo = np.maximum(self.maximo, outra.maximo)
+        self.n = n
+        return self
+
+    def parametros(self, media_desvio: bool = False) -> dict:
+        """
+        Parâmetros no formato de `PerceptronFerramentas.normalizacao_params`.
+
+        Uma característica constante recebe max = min + 1 (normaliza para 0).
+
+        Args:
+            media_desvio (bool): Inclui também 'media' e 'desvio' (populacional)
+
+        Returns:
+            dict: {'peso': {'min', 'max', ...}, 'dureza': {...}, 'tamanho': {...}}
+        """
+        if self.n == 0:
+            raise ValueError("Nenhuma amostra para ajustar a normalização")
+        parametros = {}
+        for i, nome in enumerate(CARACTERISTICAS_NORMALIZADAS):
+            minimo, maximo = float(self.minimo[i]), float(self.maximo[i])
+            parametros[nome] = {'min': minimo, 'max': maximo if maximo > minimo else minimo + 1.0}
+            if media_desvio:
+                parametros[nome]['media'] = float(self.media[i])
+                parametros[nome]['desvio'] = float(np.sqrt(self.m2[i] / self.n))
+        return parametros
+
+
+def estatisticas_intervalo(caminho_arquivo: str, inicio: int = 0, fim: Optional[int] = None,
+                           tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> EstatisticasNormalizacao:
+    """
+    Estatísticas de um intervalo de bytes do CSV (todo o arquivo por padrão).
+
+    Args:
+        caminho_arquivo (str): Caminho para o CSV
+        inicio (int): Primeiro byte do intervalo
+        fim (Optional[int]): Byte seguinte ao último do intervalo (None = fim do arquivo)
+        tamanho_bloco (int): Linhas lidas por vez
+
+    Returns:
+        EstatisticasNormalizacao: Estatísticas do intervalo
+    """
+    if fim is None:
+        fim = os.path.getsize(caminho_arquivo)
+    estatisticas = EstatisticasNormalizacao()
+    for linhas in iterar_linhas_intervalo(caminho_arquivo, inicio, fim, tamanho_bloco):
+        estatisticas.atualizar(np.array([[linha[c] for c in COLUNAS_NORMALIZADAS] for linha in linhas],
+                                        dtype=np.float64))
+    return estatisticas
+
+
+def ajustar_normalizacao(caminho_arquivo: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                         n_processos: int = 1, media_desvio: bool = False) -> dict:
+    """
+    Ajusta os parâmetros de normalização em uma passada sobre o CSV.
+
+    Com `n_processos > 1`, o arquivo é dividido em intervalos de bytes e cada
+    processo calcula as estatísticas de um intervalo; os resultados são
+    combinados no processo principal.
+
+    Args:
+        caminho_arquivo (str): Caminho para o CSV de treinamento
+        tamanho_bloco (int): Linhas lidas por vez
+        n_processos (int): Processos usados na leitura
+        media_desvio (bool): Inclui também média e desvio padrão
+
+    Returns:
+        dict: Parâmetros no formato de `PerceptronFerramentas.normalizacao_params`
+    """
+    intervalos = dividir_em_intervalos(caminho_arquivo, max(n_processos, 1))
+    estatisticas = EstatisticasNormalizacao()
+
+    if n_processos > 1 and len(intervalos) > 1:
+        with ProcessPoolExecutor(max_workers=n_processos) as executor:
+            futuros = [executor.submit(estatisticas_intervalo, caminho_arquivo, inicio, fim, tamanho_bloco)
+                       for inicio, fim in intervalos]
+            for futuro in futuros:
+                estatisticas.combinar(futuro.result())
+    else:
+        for inicio, fim in intervalos:
+            estatisticas.combinar(estatisticas_intervalo(caminho_arquivo, inicio, fim, tamanho_bloco))
+
+    if estatisticas.n == 0:
+        raise ValueError(f"Arquivo sem amostras: {caminho_arquivo}")
+    return estatisticas.parametros(media_desvio)
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Núcleo de inferência com inicialização rápida.
+
+Lê os modelos salvos por `PerceptronFerramentas.salvar` e
+`PerceptronFuncoes.salvar` e classifica linhas brutas do CSV usando apenas
+a biblioteca padrão (struct e json): não importa NumPy nem o código de
+treinamento, carregamento de datasets e relatórios. É o caminho usado por
+`main.py classificar` para arquivos pequenos, em que o tempo de importação
+domina o tempo total (ver `classificacao_lote`).
+
+As margens são calculadas na mesma ordem de `PerceptronFerramentas.prever_item`,
+então as predições são idênticas às do modelo completo.
+"""
+
+import json
+import math
+import struct
+from typing import List, Optional, Tuple
+
+
+# Formato binário do modelo salvo (ver PerceptronFerramentas.salvar)
+MAGICO_MODELO = b'PFMODEL\x00'
+VERSAO_FORMATO_MODELO = 1
+
+# Formato binário do preditor de função (ver multiclasse.PerceptronFuncoes.salvar)
+MAGICO_FUNCOES = b'PFFUNC\x00\x00'
+VERSAO_FORMATO_FUNCOES = 1
+
+# Arquivo do preditor de função salvo junto ao modelo (caminho do modelo + sufixo)
+SUFIXO_MODELO_FUNCOES = '.funcoes'
+
+N_CARACTERISTICAS_FISICAS = 5
+N_FUNCOES = 9
+
+# Normalização usada enquanto `ajustar_normalizacao` não é chamado
+NORMALIZACAO_PADRAO = {
+    'peso': {'min': 7, 'max': 800},
+    'dureza': {'min': 1, 'max': 10},
+    'tamanho': {'min': 3, 'max': 45}
+}
+
+
+def ler_arquivo_modelo(caminho_arquivo: str, magico: bytes, versao: int,
+                       descricao: str) -> Tuple[dict, bytes, int]:
+    """
+    Lê o cabeçalho comum dos arquivos de modelo.
+
+    Formato: número mágico, versão (uint16), tamanho dos metadados (uint32)
+    e metadados JSON, seguidos dos valores do modelo.
+
+    Args:
+        caminho_arquivo (str): Caminho do arquivo
+        magico (bytes): Número mágico esperado
+        versao (int): Versão de formato suportada
+        descricao (str): Tipo de modelo, para a mensagem de erro
+
+    Returns:
+        Tuple[dict, bytes, int]: Metadados, conteúdo do arquivo e posição dos valores
+    """
+    with open(caminho_arquivo, 'rb') as arquivo:
+        conteudo = arquivo.read()
+
+    if not conteudo.startswith(magico):
+        raise ValueError(f"Arquivo não é {descricao}: {caminho_arquivo}")
+    posicao = len(magico)
+    versao_arquivo, tamanho_metadados = struct.unpack_from('<HI', conteudo, posicao)
+    if versao_arquivo != versao:
+        raise ValueError(f"Versão de modelo não suportada: {versao_arquivo}")
+    posicao += struct.calcsize('<HI')
+
+    metadados = json.loads(conteudo[posicao:posicao + tamanho_metadados].decode('utf-8'))
+    return metadados, conteudo, posicao + tamanho_metadados
+
+
+def _normalizar(valor: float, params: dict) -> float:
+    """Mesma normalização de `motor_vetorizado.codificar_colunas` (limitada a [0, 1]; NaN se mantém)."""
+    valor_norm = (valor - params['min']) / (params['max'] - params['min'])
+    if math.isnan(valor_norm):
+        return valor_norm
+    return max(0.0, min(1.0, valor_norm))
+
+
+def caracteristicas_fisicas(linha: List[str], normalizacao_params: dict) -> Tuple[float, ...]:
+    """
+    Características físicas normalizadas de uma linha bruta do CSV.
+
+    Args:
+        linha (List[str]): [nome, peso, dureza, tamanho, cabo, metal, ...]
+        normalizacao_params (dict): Mínimo e máximo de peso, dureza e tamanho
+
+    Returns:
+        Tuple[float, ...]: Peso, dureza e tamanho normalizados, tem_cabo e material_metalico
+    """
+    return (_normalizar(float(linha[1]), normalizacao_params['peso']),
+            _normalizar(float(linha[2]), normalizacao_params['dureza']),
+            _normalizar(float(linha[3]), normalizacao_params['tamanho']),
+            float(linha[4]),
+            float(linha[5]))
+
+
+def codigo_funcao(valor: str) -> Optional[int]:
+    """Código de função de um campo do CSV (None se vazio, não numérico, não finito ou fora de 1-9)."""
+    try:
+        numero = float(valor)
+    except ValueError:
+        return None
+    if not math.isfinite(numero):
+        return None
+    codigo = int(numero)
+    return codigo if 1 <= codigo <= N_FUNCOES else None
+
+
+class PreditorFerramentas:
+    """
+    Pesos de um `PerceptronFerramentas` salvo, só para predição.
+
+    Attributes:
+        pesos (List[float]): Pesos das 14 características
+        bias (float): Bias do perceptron
+        normalizacao_params (dict): Mínimo e máximo de peso, dureza e tamanho
+        legenda_funcoes (dict): Mapeamento código -> descrição das funções
+    """
+
+    __slots__ = ('pesos', 'bias', 'normalizacao_params', 'legenda_funcoes')
+
+    def __init__(self, pesos: List[float], bias: float, normalizacao_params: dict,
+                 legenda_funcoes: Optional[dict] = None):
+        self.pesos = pesos
+        self.bias = bias
+        self.normalizacao_params = normalizacao_params
+        self.legenda_funcoes = legenda_funcoes or {}
+
+    @classmethod
+    def carregar(cls, caminho_arquivo: str) -> 'PreditorFerramentas':
+        """
+        Carrega os pesos de um modelo salvo.
+
+        Args:
+            caminho_arquivo (str): Arquivo salvo com `PerceptronFerramentas.salvar`
+
+        Returns:
+            PreditorFerramentas: Preditor pronto para uso
+        """
+        metadados, conteudo, posicao = ler_arquivo_modelo(
+            caminho_arquivo, MAGICO_MODELO, VERSAO_FORMATO_MODELO, "um modelo do Perceptron")
+        (n_pesos,) = struct.unpack_from('<I', conteudo, posicao)
+        valores = struct.unpack_from(f'<{n_pesos}dd', conteudo, posicao + 4)
+        legenda = {int(codigo): descricao for codigo, descricao in metadados['legenda_funcoes'].items()}
+        return cls(list(valores[:n_pesos]), valores[n_pesos], metadados['normalizacao_params'], legenda)
+
+    def fisicas(self, linha: List[str]) -> Tuple[float, ...]:
+        """Características físicas normalizadas de uma linha bruta."""
+        return caracteristicas_fisicas(linha, self.normalizacao_params)
+
+    def margem(self, fisicas: Tuple[float, ...], codigo: int) -> float:
+        """
+        Saída linear (mesma ordem de soma de `ItemCodificado.margem`).
+
+        Args:
+            fisicas (Tuple[float, ...]): Características físicas normalizadas
+            codigo (int): Código de função (1-9)
+
+        Returns:
+            float: Margem; o item é ferramenta quando ela é >= 0
+        """
+        pesos = self.pesos
+        x0, x1, x2, x3, x4 = fisicas
+        saida_linear = x0 * pesos[0] + x1 * pesos[1] + x2 * pesos[2] + x3 * pesos[3] + x4 * pesos[4]
+        saida_linear += pesos[N_CARACTERISTICAS_FISICAS - 1 + codigo]
+        return saida_linear + self.bias
+
+    def prever(self, linha: List[str], codigo: int) -> Tuple[int, float]:
+        """
+        Classifica uma linha bruta do CSV.
+
+        Args:
+            linha (List[str]): [nome, peso, dureza, tamanho, cabo, metal, ...]
+            codigo (int): Código de função (1-9)
+
+        Returns:
+            Tuple[int, float]: Predição (1=ferramenta, 0=não-ferramenta) e margem
+        """
+        margem = self.margem(self.fisicas(linha), codigo)
+        return (1 if margem >= 0 else 0), margem
+
+
+class PreditorFuncoes:
+    """
+    Pesos de um `PerceptronFuncoes` salvo, só para predição.
+
+    Attributes:
+        pesos (List[List[float]]): Pesos (9 x 5), uma linha por função
+        bias (List[float]): Bias de cada função
+        normalizacao_params (dict): Normalização das características físicas
+    """
+
+    __slots__ = ('pesos', 'bias', 'normalizacao_params')
+
+    def __init__(self, pesos: List[List[float]], bias: List[float], normalizacao_params: dict):
+        self.pesos = pesos
+        self.bias = bias
+        self.normalizacao_params = normalizacao_params
+
+    @classmethod
+    def carregar(cls, caminho_arquivo: str) -> 'PreditorFuncoes':
+        """
+        Carrega os pesos de um preditor de função salvo.
+
+        Args:
+            caminho_arquivo (str): Arquivo salvo com `PerceptronFuncoes.salvar`
+
+        Returns:
+            PreditorFuncoes: Preditor pronto para uso
+        """
+        metadados, conteudo, posicao = ler_arquivo_modelo(
+            caminho_arquivo, MAGICO_FUNCOES, VERSAO_FORMATO_FUNCOES, "um preditor de funções")
+        n_pesos = N_FUNCOES * N_CARACTERISTICAS_FISICAS
+        valores = struct.unpack_from(f'<{n_pesos + N_FUNCOES}d', conteudo, posicao)
+        pesos = [list(valores[i:i + N_CARACTERISTICAS_FISICAS])
+                 for i in range(0, n_pesos, N_CARACTERISTICAS_FISICAS)]
+        return cls(pesos, list(valores[n_pesos:]), metadados['normalizacao_params'])
+
+    def prever(self, linha: List[str]) -> int:
+        """
+        Prevê o código de função de uma linha bruta (o de maior margem).
+
+        Args:
+            linha (List[str]): [nome, peso, dureza, tamanho, cabo, metal, ...]
+
+        Returns:
+            int: Código de função previsto (1-9)
+        """
+        fisicas = caracteristicas_fisicas(linha, self.normalizacao_params)
+        melhor, maior_margem = 0, None
+        for indice, (pesos, bias) in enumerate(zip(self.pesos, self.bias)):
+            margem = sum(x * w for x, w in zip(fisicas, pesos)) + bias
+            if maior_margem is None or margem > maior_margem:
+                melhor, maior_margem = indice, margem
+        return melhor + 1
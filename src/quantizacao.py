@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Exportação do Perceptron para inferência em ponto fixo (int8/int16).
+
+A normalização min-max de peso, dureza e tamanho é uma função afim, então
+ela é incorporada aos pesos: a margem passa a ser uma combinação dos valores
+brutos inteiros mais uma constante. Fora do intervalo da normalização o
+termo satura no valor exato da função afim em min ou max (o mesmo de
+`np.clip(normalizado, 0, 1)` no modelo original), com limiares inteiros
+floor(min) e ceil(max); tem_cabo e material_metalico são limitados a 0/1.
+Cada coeficiente é quantizado para `bits` bits com o seu próprio
+expoente de potência de 2 (o peso por grama é milhares de vezes menor que o
+peso de uma função, e uma escala única zeraria os coeficientes pequenos). A
+margem é acumulada em inteiros, alinhando os termos por deslocamento de bits,
+sem nenhuma operação de ponto flutuante.
+
+`gerar_modulo` grava um módulo Python sem dependências (nem NumPy) com os
+coeficientes e as funções de predição; `verificar_paridade` compara a
+acurácia do modelo quantizado com a de `avaliar_dataset`.
+
+Uso:
+    python src/quantizacao.py --modelo modelo_perceptron.bin --bits 8 --saida preditor_ferramentas.py
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import math
+from typing import List, Optional
+
+import numpy as np
+
+from motor_vetorizado import COLUNAS_NUMERICAS, N_CARACTERISTICAS_FISICAS, N_FUNCOES
+
+
+BITS_SUPORTADOS = (8, 16)
+
+# Maior diferença entre o expoente do menor e o do maior coeficiente: abaixo
+# disso o coeficiente é desprezível e o acumulador continua cabendo em int64
+FAIXA_EXPOENTES = 30
+
+
+class ModeloQuantizado:
+    """
+    Coeficientes em ponto fixo de um Perceptron com a normalização incorporada.
+
+    A margem, multiplicada por 2**expoente_acumulador, é
+    constante + soma de (coeficiente_j * x_j) << deslocamento_j, com x_j os
+    valores brutos inteiros. Para peso, dureza e tamanho, x_j <= limites[j][0]
+    ou x_j >= limites[j][1] somam o termo saturado termos_limite[j] no lugar
+    do produto.
+
+    Attributes:
+        bits (int): Bits de cada coeficiente (8 ou 16)
+        limites (List[Tuple[int, int]]): Limiares inteiros de saturação (floor(min), ceil(max))
+            de peso, dureza e tamanho
+        termos_limite (List[Tuple[int, int]]): Termos de peso, dureza e tamanho em min e em max,
+            já alinhados ao acumulador
+        coeficientes_fisicos (List[int]): Coeficientes de peso, dureza, tamanho, cabo e metal
+        deslocamentos_fisicos (List[int]): Deslocamento de cada coeficiente físico
+        coeficientes_funcao (List[int]): Coeficiente por código de função (índice 0 = código inválido)
+        deslocamentos_funcao (List[int]): Deslocamento de cada coeficiente de função
+        constante (int): Bias e deslocamentos da normalização, já alinhados ao acumulador
+        expoente_acumulador (int): Expoente de 2 da escala da margem inteira
+    """
+
+    def __init__(self, bits: int, limites, termos_limite, coeficientes_fisicos, deslocamentos_fisicos,
+                 coeficientes_funcao, deslocamentos_funcao, constante: int, expoente_acumulador: int):
+        self.bits = bits
+        self.limites = [tuple(limite) for limite in limites]
+        self.termos_limite = [tuple(termos) for termos in termos_limite]
+        self.coeficientes_fisicos = list(coeficientes_fisicos)
+        self.deslocamentos_fisicos = list(deslocamentos_fisicos)
+        self.coeficientes_funcao = list(coeficientes_funcao)
+        self.deslocamentos_funcao = list(deslocamentos_funcao)
+        self.constante = constante
+        self.expoente_acumulador = expoente_acumulador
+
+    def margens_inteiras(self, valores: np.ndarray) -> np.ndarray:
+        """
+        Margens inteiras de um lote.
+
+        Args:
+            valores (np.ndarray): Matriz inteira (n, 6) de peso, dureza, tamanho,
+                cabo, metal e cod_funcao brutos
+
+        Returns:
+            np.ndarray: Margens (int64) na escala 2**expoente_acumulador
+        """
+        valores = np.asarray(valores, dtype=np.int64)
+        margens = np.full(valores.shape[0], self.constante, dtype=np.int64)
+        for coluna in range(N_CARACTERISTICAS_FISICAS):
+            x = valores[:, coluna]
+            if coluna < len(self.limites):
+                inferior, superior = self.limites[coluna]
+                x = np.clip(x, inferior, superior)
+                termo = (self.coeficientes_fisicos[coluna] * x) << self.deslocamentos_fisicos[coluna]
+                termo_min, termo_max = self.termos_limite[coluna]
+                margens += np.where(x == inferior, termo_min, np.where(x == superior, termo_max, termo))
+            else:
+                x = np.clip(x, 0, 1)
+                margens += (self.coeficientes_fisicos[coluna] * x) << self.deslocamentos_fisicos[coluna]
+        codigos = valores[:, N_CARACTERISTICAS_FISICAS]
+        codigos = np.where((codigos >= 1) & (codigos <= N_FUNCOES), codigos, 0)
+        termos_funcao = np.array([c << d for c, d in zip(self.coeficientes_funcao, self.deslocamentos_funcao)],
+                                 dtype=np.int64)
+        return margens + termos_funcao[codigos]
+
+    def prever_lote(self, valores: np.ndarray) -> np.ndarray:
+        """Predições (1=ferramenta, 0=não-ferramenta) de uma matriz inteira (n, 6)."""
+        return (self.margens_inteiras(valores) >= 0).astype(np.int64)
+
+    def bytes_coeficientes(self) -> int:
+        """Memória dos coeficientes (mantissas de `bits` bits e deslocamentos em 1 byte)."""
+        n_coeficientes = len(self.coeficientes_fisicos) + len(self.coeficientes_funcao)
+        return n_coeficientes * (self.bits // 8 + 1)
+
+    def gerar_modulo(self, caminho_arquivo: str) -> None:
+        """
+        Grava um módulo Python autônomo (sem imports) para o preditor em ponto fixo.
+
+        O módulo expõe `prever(peso, dureza, tamanho, tem_cabo, material_metalico,
+        cod_funcao)` e `prever_lote(...)`, que recebe uma sequência de inteiros
+        por característica (ex.: `array('h')`) e devolve uma lista de 0/1.
+
+        Args:
+            caminho_arquivo (str): Arquivo .py de saída
+        """
+        with open(caminho_arquivo, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(MODELO_MODULO.format(
+                bits=self.bits,
+                limites=tuple(self.limites),
+                termos_limite=tuple(self.termos_limite),
+                coeficientes_fisicos=tuple(self.coeficientes_fisicos),
+                deslocamentos_fisicos=tuple(self.deslocamentos_fisicos),
+                coeficientes_funcao=tuple(self.coeficientes_funcao),
+                deslocamentos_funcao=tuple(self.deslocamentos_funcao),
+                constante=self.constante,
+                expoente_acumulador=self.expoente_acumulador
+            ))
+
+
+MODELO_MODULO = '''# -*- coding: utf-8 -*-
+"""
+Preditor de ferramentas em ponto fixo ({bits} bits), gerado por quantizacao.py.
+
+Não depende de nenhum pacote. As entradas são os valores brutos inteiros:
+peso (g), dureza (1-10), tamanho (cm), tem_cabo (0/1), material_metalico
+(0/1) e cod_funcao (1-9; outros valores contam como código ausente).
+"""
+
+BITS = {bits}
+LIMITES = {limites}
+TERMOS_LIMITE = {termos_limite}
+COEFICIENTES_FISICOS = {coeficientes_fisicos}
+DESLOCAMENTOS_FISICOS = {deslocamentos_fisicos}
+COEFICIENTES_FUNCAO = {coeficientes_funcao}
+DESLOCAMENTOS_FUNCAO = {deslocamentos_funcao}
+CONSTANTE = {constante}
+EXPOENTE_ACUMULADOR = {expoente_acumulador}
+
+_TERMOS_FUNCAO = tuple(c << d for c, d in zip(COEFICIENTES_FUNCAO, DESLOCAMENTOS_FUNCAO))
+(_P, _D, _T, _C, _M) = COEFICIENTES_FISICOS
+(_SP, _SD, _ST, _SC, _SM) = DESLOCAMENTOS_FISICOS
+((_P0, _P1), (_D0, _D1), (_T0, _T1)) = LIMITES
+((_TP0, _TP1), (_TD0, _TD1), (_TT0, _TT1)) = TERMOS_LIMITE
+
+
+def margem(peso, dureza, tamanho, tem_cabo, material_metalico, cod_funcao):
+    """Margem inteira (escala 2 ** EXPOENTE_ACUMULADOR)."""
+    total = CONSTANTE
+    total += _TP0 if peso <= _P0 else _TP1 if peso >= _P1 else (_P * peso) << _SP
+    total += _TD0 if dureza <= _D0 else _TD1 if dureza >= _D1 else (_D * dureza) << _SD
+    total += _TT0 if tamanho <= _T0 else _TT1 if tamanho >= _T1 else (_T * tamanho) << _ST
+    if tem_cabo > 0:
+        total += _C << _SC
+    if material_metalico > 0:
+        total += _M << _SM
+    if 1 <= cod_funcao <= 9:
+        total += _TERMOS_FUNCAO[cod_funcao]
+    return total
+
+
+def prever(peso, dureza, tamanho, tem_cabo, material_metalico, cod_funcao):
+    """1 = ferramenta, 0 = não-ferramenta."""
+    return 1 if margem(peso, dureza, tamanho, tem_cabo, material_metalico, cod_funcao) >= 0 else 0
+
+
+def prever_lote(pesos, durezas, tamanhos, cabos, metais, codigos):
+    """Predições de colunas inteiras de mesmo tamanho (listas ou array.array)."""
+    return [1 if margem(*linha) >= 0 else 0
+            for linha in zip(pesos, durezas, tamanhos, cabos, metais, codigos)]
+'''
+
+
+def _quantizar(valor: float, bits: int, expoente_maximo: Optional[int] = None):
+    """
+    Mantissa inteira de `bits` bits e expoente e com valor ~= mantissa / 2**e.
+
+    Usa o maior expoente em que a mantissa cabe (limitado a `expoente_maximo`);
+    zero não tem expoente (None).
+    """
+    limite = 2 ** (bits - 1) - 1
+    if valor == 0:
+        return 0, None
+    expoente = math.floor(math.log2(limite / abs(valor)))
+    if round(abs(valor) * 2.0 ** expoente) > limite:
+        expoente -= 1
+    if expoente_maximo is not None:
+        expoente = min(expoente, expoente_maximo)
+    return int(round(valor * 2.0 ** expoente)), expoente
+
+
+def quantizar_modelo(modelo, bits: int = 8) -> ModeloQuantizado:
+    """
+    Incorpora a normalização aos pesos e quantiza o modelo.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo treinado (14 pesos)
+        bits (int): 8 ou 16 bits por coeficiente
+
+    Returns:
+        ModeloQuantizado: Coeficientes em ponto fixo
+    """
+    if modelo.pesos is None:
+        raise ValueError("Modelo não foi treinado ainda!")
+    if bits not in BITS_SUPORTADOS:
+        raise ValueError(f"bits deve ser um de {BITS_SUPORTADOS}")
+    if len(modelo.pesos) != N_CARACTERISTICAS_FISICAS + N_FUNCOES:
+        raise ValueError("Quantização requer o modelo linear de 14 features")
+
+    # w * (v - min) / (max - min) = (w / (max - min)) * v - w * min / (max - min)
+    fisicos = list(modelo.pesos[:N_CARACTERISTICAS_FISICAS])
+    constante = float(modelo.bias)
+    limites = []
+    extremos = []
+    for coluna, tipo in enumerate(('peso', 'dureza', 'tamanho')):
+        params = modelo.normalizacao_params[tipo]
+        escala = fisicos[coluna] / (params['max'] - params['min'])
+        fisicos[coluna] = escala
+        constante -= escala * params['min']
+        # Inteiros <= floor(min) normalizam para 0 e >= ceil(max) para 1
+        limites.append((math.floor(params['min']), math.ceil(params['max'])))
+        extremos.append((escala * params['min'], escala * params['max']))
+    funcoes = [0.0] + list(modelo.pesos[N_CARACTERISTICAS_FISICAS:])
+
+    valores = fisicos + funcoes + [constante]
+    expoente_minimo = min(_quantizar(valor, bits)[1] for valor in valores if valor != 0)
+    expoente_maximo = expoente_minimo + FAIXA_EXPOENTES
+    quantizados = [_quantizar(valor, bits, expoente_maximo) for valor in valores]
+    expoente_acumulador = max(expoente for _, expoente in quantizados if expoente is not None)
+
+    mantissas = [mantissa for mantissa, _ in quantizados]
+    deslocamentos = [expoente_acumulador - expoente if expoente is not None else 0
+                     for _, expoente in quantizados]
+    # Termos saturados: a função afim exata em min e max, na escala do acumulador
+    termos_limite = [tuple(int(round(valor * 2.0 ** expoente_acumulador)) for valor in par)
+                     for par in extremos]
+    n_fisicos = N_CARACTERISTICAS_FISICAS
+    return ModeloQuantizado(
+        bits, limites, termos_limite,
+        mantissas[:n_fisicos], deslocamentos[:n_fisicos],
+        mantissas[n_fisicos:-1], deslocamentos[n_fisicos:-1],
+        mantissas[-1] << deslocamentos[-1], expoente_acumulador
+    )
+
+
+def valores_inteiros(dados: List[List], normalizacao_params: Optional[dict] = None) -> np.ndarray:
+    """
+    Matriz inteira (n, 6) das colunas brutas usadas pelo preditor.
+
+    Peso, dureza e tamanho fracionários são arredondados para o inteiro mais
+    próximo; com `normalizacao_params`, valores <= min viram floor(min) e
+    valores >= max viram ceil(max), então a saturação coincide com a do
+    modelo original mesmo com limites fracionários. O código de função é
+    truncado, como em `codificar_colunas`.
+
+    Args:
+        dados (List[List]): Linhas brutas do dataset
+        normalizacao_params (Optional[dict]): Mínimo e máximo de peso, dureza e tamanho
+
+    Returns:
+        np.ndarray: Matriz int64 (n, 6)
+    """
+    valores = np.array([[linha[c] for c in COLUNAS_NUMERICAS] for linha in dados], dtype=np.float64)
+    valores = valores.reshape(-1, len(COLUNAS_NUMERICAS))
+    inteiros = np.rint(valores)
+    inteiros[:, -1] = np.trunc(valores[:, -1])
+    if normalizacao_params is not None:
+        for coluna, tipo in enumerate(('peso', 'dureza', 'tamanho')):
+            params = normalizacao_params[tipo]
+            inferior, superior = math.floor(params['min']), math.ceil(params['max'])
+            x = valores[:, coluna]
+            inteiros[:, coluna] = np.where(x <= params['min'], inferior,
+                                           np.where(x >= params['max'], superior, inteiros[:, coluna]))
+    return inteiros.astype(np.int64)
+
+
+def carregar_modulo_gerado(caminho_arquivo: str):
+    """Importa um módulo gerado por `ModeloQuantizado.gerar_modulo`."""
+    especificacao = importlib.util.spec_from_file_location('preditor_quantizado', caminho_arquivo)
+    modulo = importlib.util.module_from_spec(especificacao)
+    especificacao.loader.exec_module(modulo)
+    return modulo
+
+
+def verificar_paridade(modelo, quantizado: ModeloQuantizado, dados: List[List],
+                       caminho_modulo: Optional[str] = None) -> dict:
+    """
+    Compara o modelo quantizado com o modelo em ponto flutuante.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo original
+        quantizado (ModeloQuantizado): Modelo quantizado
+        dados (List[List]): Dataset rotulado
+        caminho_modulo (Optional[str]): Módulo gerado a verificar também (predição item a item)
+
+    Returns:
+        dict: acuracia_original (de `avaliar_dataset`), acuracia_quantizada,
+            concordancia (% de predições iguais) e divergencias
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        acuracia_original = modelo.avaliar_dataset(dados, vetorizado=True)
+    predicoes_originais, _ = modelo.prever_lote(dados)
+    valores = valores_inteiros(dados, modelo.normalizacao_params)
+    predicoes = quantizado.prever_lote(valores)
+    reais = np.array([int(linha[-1]) for linha in dados])
+
+    resultado = {
+        'bits': quantizado.bits,
+        'acuracia_original': acuracia_original,
+        'acuracia_quantizada': (int(np.count_nonzero(predicoes == reais)) / len(reais)) * 100,
+        'concordancia': (int(np.count_nonzero(predicoes == predicoes_originais)) / len(reais)) * 100,
+        'divergencias': int(np.count_nonzero(predicoes != predicoes_originais))
+    }
+    if caminho_modulo is not None:
+        modulo = carregar_modulo_gerado(caminho_modulo)
+        predicoes_modulo = modulo.prever_lote(*(valores[:, coluna].tolist()
+                                                 for coluna in range(valores.shape[1])))
+        resultado['modulo_igual_numpy'] = predicoes_modulo == predicoes.tolist()
+    return resultado
+
+
+def main():
+    """Linha de comando: quantiza um modelo salvo, gera o módulo e verifica a paridade."""
+    from classificador_ferramentas import PerceptronFerramentas, carregar_dataset_csv
+
+    parser = argparse.ArgumentParser(description="Exporta o Perceptron em ponto fixo")
+    parser.add_argument('--modelo', required=True, help="Modelo salvo (main.py --modelo ARQUIVO)")
+    parser.add_argument('--bits', type=int, choices=BITS_SUPORTADOS, default=8)
+    parser.add_argument('--saida', default='preditor_ferramentas.py', help="Módulo Python gerado")
+    parser.add_argument('--teste', default='data/dataset_teste.csv',
+                        help="CSV rotulado para a verificação de paridade")
+    args = parser.parse_args()
+
+    modelo = PerceptronFerramentas.carregar(args.modelo)
+    quantizado = quantizar_modelo(modelo, args.bits)
+    quantizado.gerar_modulo(args.saida)
+    print(f"Preditor de {args.bits} bits gerado em: {args.saida} "
+          f"({quantizado.bytes_coeficientes()} bytes de coeficientes)")
+
+    dados = carregar_dataset_csv(args.teste)
+    if dados is None:
+        return
+    paridade = verificar_paridade(modelo, quantizado, dados, args.saida)
+    print(f"Acurácia original: {paridade['acuracia_original']:.2f}%")
+    print(f"Acurácia quantizada: {paridade['acuracia_quantizada']:.2f}%")
+    print(f"Predições iguais: {paridade['concordancia']:.2f}% ({paridade['divergencias']} divergências)")
+    print(f"Módulo gerado igual ao NumPy: {paridade['modulo_igual_numpy']}")
+
+
+if __name__ == "__main__":
+    main()
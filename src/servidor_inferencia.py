@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Serviço HTTP/JSON local de inferência com micro-lotes.
+
+Carrega um modelo salvo uma única vez e atende requisições concorrentes. As
+requisições que chegam dentro de uma janela curta são agrupadas em um
+micro-lote e pontuadas com uma única chamada vetorizada.
+
+Rotas:
+    POST /prever     item único (objeto) ou {"itens": [...]} com os campos do CSV:
+                     nome_item, peso_gramas, dureza_escala_1_10, tamanho_cm,
+                     tem_cabo, material_metalico, cod_funcao
+    GET  /metricas   contadores e latências p50/p99 (ms)
+    GET  /saude      verificação simples
+
+Uso:
+    python src/servidor_inferencia.py --modelo modelo_perceptron.bin --porta 8080
+"""
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import numpy as np
+
+from classificador_ferramentas import SUFIXO_MODELO_FUNCOES, PerceptronFerramentas
+from motor_vetorizado import codificar_colunas, pontuar
+from preditor import codigo_funcao
+
+
+CAMPOS_ITEM = ['peso_gramas', 'dureza_escala_1_10', 'tamanho_cm', 'tem_cabo',
+               'material_metalico', 'cod_funcao']
+
+
+class _Pedido:
+    """Itens de uma requisição aguardando o resultado do micro-lote."""
+
+    __slots__ = ('valores', 'pronto', 'predicoes', 'margens', 'erro')
+
+    def __init__(self, valores: np.ndarray):
+        self.valores = valores
+        self.pronto = threading.Event()
+        self.predicoes = None
+        self.margens = None
+        self.erro = None
+
+
+class AgrupadorLotes:
+    """
+    Agrupa pedidos concorrentes em micro-lotes pontuados por uma thread dedicada.
+
+    A thread espera o primeiro pedido, junta os que chegarem até `janela_ms`
+    depois (ou até `lote_max` itens) e pontua todos com um produto matriz-vetor.
+
+    Attributes:
+        modelo (PerceptronFerramentas): Modelo carregado
+        modelo_funcoes (Optional[PerceptronFuncoes]): Preditor de função para itens sem código
+    """
+
+    def __init__(self, modelo: PerceptronFerramentas, modelo_funcoes=None,
+                 janela_ms: float = 2.0, lote_max: int = 4096):
+        self.modelo = modelo
+        self.modelo_funcoes = modelo_funcoes
+        self.janela = janela_ms / 1000.0
+        self.lote_max = lote_max
+        self._fila = queue.Queue()
+        self._trava = threading.Lock()
+        self._latencias = deque(maxlen=10000)
+        self.n_requisicoes = 0
+        self.n_itens = 0
+        self.n_lotes = 0
+        self._thread = threading.Thread(target=self._executar, daemon=True)
+        self._thread.start()
+
+    def prever(self, valores: np.ndarray):
+        """
+        Enfileira os itens de uma requisição e espera o resultado do micro-lote.
+
+        Args:
+            valores (np.ndarray): Matriz (n, 6) com os campos numéricos dos itens
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Predições e margens dos itens
+        """
+        # Validado antes de enfileirar: um erro no micro-lote afetaria os outros pedidos
+        if self.modelo_funcoes is None and np.isnan(valores[:, 5]).any():
+            raise ValueError("cod_funcao ausente e nenhum preditor de função carregado")
+        pedido = _Pedido(valores)
+        self._fila.put(pedido)
+        pedido.pronto.wait()
+        if pedido.erro is not None:
+            raise pedido.erro
+        return pedido.predicoes, pedido.margens
+
+    def registrar_latencia(self, segundos: float) -> None:
+        """Registra a latência total de uma requisição atendida."""
+        with self._trava:
+            self._latencias.append(segundos)
+
+    def metricas(self) -> dict:
+        """Contadores e percentis de latência (ms) das últimas requisições."""
+        with self._trava:
+            latencias = sorted(self._latencias)
+        resultado = {
+            'requisicoes': self.n_requisicoes,
+            'itens': self.n_itens,
+            'lotes': self.n_lotes,
+            'itens_por_lote': self.n_itens / self.n_lotes if self.n_lotes else 0.0,
+            'latencia_p50_ms': None,
+            'latencia_p99_ms': None
+        }
+        if latencias:
+            resultado['latencia_p50_ms'] = latencias[int(0.50 * (len(latencias) - 1))] * 1000
+            resultado['latencia_p99_ms'] = latencias[int(0.99 * (len(latencias) - 1))] * 1000
+        return resultado
+
+    def _executar(self) -> None:
+        while True:
+            pedidos = [self._fila.get()]
+            n_itens = len(pedidos[0].valores)
+            limite = time.perf_counter() + self.janela
+            while n_itens < self.lote_max:
+                restante = limite - time.perf_counter()
+                if restante <= 0:
+                    break
+                try:
+                    pedido = self._fila.get(timeout=restante)
+                except queue.Empty:
+                    break
+                pedidos.append(pedido)
+                n_itens += len(pedido.valores)
+            self._pontuar(pedidos)
+
+    def _pontuar(self, pedidos: List[_Pedido]) -> None:
+        try:
+            valores = np.concatenate([pedido.valores for pedido in pedidos])
+            sem_codigo = np.isnan(valores[:, 5])
+            if sem_codigo.any():
+                codigos, _ = self.modelo_funcoes.prever_lote(
+                    codificar_colunas(self.modelo_funcoes, np.nan_to_num(valores[sem_codigo])))
+                valores[sem_codigo, 5] = codigos
+
+            predicoes, margens = pontuar(codificar_colunas(self.modelo, valores),
+                                         self.modelo.pesos, self.modelo.bias)
+            inicio = 0
+            for pedido in pedidos:
+                fim = inicio + len(pedido.valores)
+                pedido.predicoes = predicoes[inicio:fim]
+                pedido.margens = margens[inicio:fim]
+                inicio = fim
+        except Exception as e:
+            for pedido in pedidos:
+                pedido.erro = e
+        finally:
+            with self._trava:
+                self.n_requisicoes += len(pedidos)
+                self.n_itens += sum(len(pedido.valores) for pedido in pedidos)
+                self.n_lotes += 1
+            for pedido in pedidos:
+                pedido.pronto.set()
+
+
+def converter_itens(itens: List[dict]) -> np.ndarray:
+    """
+    Converte itens JSON na matriz (n, 6) de campos numéricos.
+
+    cod_funcao ausente, nulo ou fora de 1-9 vira NaN (será previsto, se
+    possível), como em `main.py classificar`. Um item que não é objeto, sem
+    campo obrigatório ou com campo físico não finito gera ValueError.
+
+    Args:
+        itens (List[dict]): Itens com os campos do CSV
+
+    Returns:
+        np.ndarray: Matriz (n, 6) float64
+    """
+    valores = np.empty((len(itens), len(CAMPOS_ITEM)), dtype=np.float64)
+    for i, item in enumerate(itens):
+        if not isinstance(item, dict):
+            raise ValueError(f"Item {i} não é um objeto JSON")
+        for j, campo in enumerate(CAMPOS_ITEM[:-1]):
+            valor = item.get(campo)
+            if valor is None or valor == '':
+                raise ValueError(f"Campo obrigatório ausente: {campo}")
+            valores[i, j] = float(valor)
+            if not np.isfinite(valores[i, j]):
+                raise ValueError(f"Item {i}: {campo} não é um número finito")
+        codigo = item.get('cod_funcao')
+        codigo = None if codigo is None else codigo_funcao(codigo)
+        valores[i, -1] = np.nan if codigo is None else codigo
+    return valores
+
+
+class ServidorInferencia(ThreadingHTTPServer):
+    """Servidor HTTP com uma thread por conexão e fila de conexões maior que o padrão (5)."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+
+def criar_manipulador(agrupador: AgrupadorLotes):
+    """Cria a classe de manipulador HTTP ligada a um agrupador de lotes."""
+
+    class ManipuladorInferencia(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _responder(self, status: int, corpo: dict) -> None:
+            dados = json.dumps(corpo, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(dados)))
+            self.end_headers()
+            self.wfile.write(dados)
+
+        def do_GET(self):
+            if self.path == '/metricas':
+                self._responder(200, agrupador.metricas())
+            elif self.path == '/saude':
+                self._responder(200, {'status': 'ok'})
+            else:
+                self._responder(404, {'erro': 'Rota não encontrada'})
+
+        def do_POST(self):
+            if self.path != '/prever':
+                self._responder(404, {'erro': 'Rota não encontrada'})
+                return
+
+            inicio = time.perf_counter()
+            try:
+                tamanho = int(self.headers.get('Content-Length', 0))
+                corpo = json.loads(self.rfile.read(tamanho).decode('utf-8'))
+                unico = isinstance(corpo, dict) and 'itens' not in corpo
+                itens = [corpo] if unico else corpo['itens'] if isinstance(corpo, dict) else corpo
+                predicoes, margens = agrupador.prever(converter_itens(itens))
+            except (ValueError, KeyError, TypeError) as e:
+                self._responder(400, {'erro': str(e)})
+                return
+
+            resultados = [
+                {'nome_item': item.get('nome_item'), 'eh_ferramenta': int(predicao), 'margem': float(margem)}
+                for item, predicao, margem in zip(itens, predicoes, margens)
+            ]
+            self._responder(200, resultados[0] if unico else {'itens': resultados})
+            agrupador.registrar_latencia(time.perf_counter() - inicio)
+
+        def log_message(self, formato, *args):
+            # Sem log por requisição: o custo de escrita domina sob concorrência
+            pass
+
+    return ManipuladorInferencia
+
+
+def iniciar_servidor(caminho_modelo: str, host: str = '127.0.0.1', porta: int = 8080,
+                     janela_ms: float = 2.0, lote_max: int = 4096) -> ServidorInferencia:
+    """
+    Carrega o modelo e cria o servidor (chamar `serve_forever()` para atender).
+
+    Args:
+        caminho_modelo (str): Modelo salvo com PerceptronFerramentas.salvar
+        host (str): Endereço de escuta
+        porta (int): Porta de escuta (0 = porta livre qualquer)
+        janela_ms (float): Espera máxima para completar um micro-lote
+        lote_max (int): Itens máximos por micro-lote
+
+    Returns:
+        ServidorInferencia: Servidor pronto
+    """
+    modelo = PerceptronFerramentas.carregar(caminho_modelo)
+    modelo_funcoes = None
+    if os.path.exists(caminho_modelo + SUFIXO_MODELO_FUNCOES):
+        from multiclasse import PerceptronFuncoes
+        modelo_funcoes = PerceptronFuncoes.carregar(caminho_modelo + SUFIXO_MODELO_FUNCOES)
+
+    agrupador = AgrupadorLotes(modelo, modelo_funcoes, janela_ms, lote_max)
+    servidor = ServidorInferencia((host, porta), criar_manipulador(agrupador))
+    servidor.agrupador = agrupador
+    return servidor
+
+
+def main():
+    """Linha de comando do serviço de inferência."""
+    parser = argparse.ArgumentParser(description="Serviço HTTP de inferência do Perceptron")
+    parser.add_argument('--modelo', required=True, help="Modelo salvo (main.py --modelo ARQUIVO)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8080)
+    parser.add_argument('--janela-ms', type=float, default=2.0,
+                        help="Espera máxima para agrupar requisições em um micro-lote")
+    parser.add_argument('--lote-max', type=int, default=4096, help="Itens máximos por micro-lote")
+    args = parser.parse_args()
+
+    servidor = iniciar_servidor(args.modelo, args.host, args.porta, args.janela_ms, args.lote_max)
+    print(f"Servidor de inferência em http://{args.host}:{servidor.server_port} "
+          f"(janela {args.janela_ms} ms, lote máximo {args.lote_max})")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.")
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Validação cruzada k-fold (opcionalmente estratificada) do Perceptron.
+
+O dataset é lido e codificado uma única vez no processo principal; a matriz
+de features, as colunas brutas de peso, dureza e tamanho e o fold de cada
+linha vão para memória compartilhada. Cada fold é treinado em um processo
+de um ProcessPoolExecutor que mapeia os arrays e copia a matriz uma vez. A
+normalização de cada fold é ajustada só às suas linhas de treino (as linhas
+de teste não influenciam mínimo e máximo) e só as 3 colunas normalizadas
+da cópia do processo são recalculadas com ela; o treino percorre os índices
+do fold (`PerceptronFerramentas.treinar_matriz(..., indices=...)`), sem
+copiar as linhas a cada época. As tarefas carregam apenas o número do fold.
+
+O resultado agrega média e desvio padrão da acurácia dos folds e a acurácia
+por função fora do fold (cada linha é testada exatamente uma vez).
+
+Uso:
+    python src/validacao_cruzada.py -k 5 --estratificar-folds eh_ferramenta
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from amostragem import ESTRATIFICACOES
+from avaliacao_paralela import ResumoAvaliacao
+from carregador_blocos import iterar_linhas_csv, valores_numericos
+from classificador_ferramentas import PerceptronFerramentas
+from memoria_compartilhada import anexar_arrays, compartilhar_arrays, liberar_segmentos
+from motor_vetorizado import codificar_colunas, normalizar_fisicas, pontuar
+from normalizacao import EstatisticasNormalizacao
+
+
+# Linhas de teste pontuadas por vez em cada fold
+TAMANHO_BLOCO_AVALIACAO = 65536
+
+# Estado de cada processo trabalhador (preenchido por _inicializar_trabalhador)
+_SEGMENTOS = []
+_DADOS: Dict = {}
+_PARAMETROS: Dict = {}
+
+
+def gerar_folds(n_amostras: int, k: int, semente: Optional[int] = None,
+                estratos: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Sorteia o fold de cada amostra.
+
+    As amostras são embaralhadas e distribuídas em rodízio entre os folds;
+    com estratos, o rodízio percorre um estrato de cada vez, então cada fold
+    recebe a mesma proporção de cada estrato (a menos de uma amostra).
+
+    Args:
+        n_amostras (int): Número de amostras
+        k (int): Número de folds
+        semente (Optional[int]): Semente do sorteio
+        estratos (Optional[np.ndarray]): Rótulo de estrato por amostra (ver `amostragem`)
+
+    Returns:
+        np.ndarray: Fold (0..k-1) de cada amostra (int32)
+    """
+    if not 2 <= k <= n_amostras:
+        raise ValueError(f"k deve estar entre 2 e o número de amostras ({n_amostras})")
+
+    ordem = np.random.default_rng(semente).permutation(n_amostras)
+    if estratos is not None:
+        estratos = np.asarray(estratos)
+        if estratos.shape != (n_amostras,):
+            raise ValueError("estratos deve ter um rótulo por amostra")
+        ordem = ordem[np.argsort(estratos[ordem], kind='stable')]
+
+    folds = np.empty(n_amostras, dtype=np.int32)
+    folds[ordem] = np.arange(n_amostras) % k
+    return folds
+
+
+def carregar_valores(caminho_arquivo: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lê as colunas numéricas (sem normalizar) e os rótulos de um CSV.
+
+    Args:
+        caminho_arquivo (str): CSV rotulado
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Matriz (n, 6) float64 (ver `valores_numericos`) e rótulos int8
+    """
+    valores, rotulos = [], []
+    for linhas in iterar_linhas_csv(caminho_arquivo):
+        valores.append(valores_numericos(linhas))
+        rotulos.append(np.array([linha[-1] for linha in linhas], dtype=np.int8))
+    if not valores:
+        raise ValueError(f"Arquivo sem amostras: {caminho_arquivo}")
+    return np.concatenate(valores), np.concatenate(rotulos)
+
+
+def _inicializar_trabalhador(descricoes: dict, parametros: dict) -> None:
+    """Mapeia os arrays compartilhados uma vez por processo trabalhador."""
+    global _SEGMENTOS, _DADOS, _PARAMETROS
+    _SEGMENTOS, _DADOS = anexar_arrays(descricoes)
+    # Cópia própria do processo: cada fold reescreve só as colunas normalizadas
+    _DADOS['X'] = np.array(_DADOS['X'])
+    _PARAMETROS = parametros
+
+
+def _treinar_fold(fold: int) -> dict:
+    """Treina sem o fold e o avalia, usando os arrays do trabalhador."""
+    X, fisicas, y, folds = _DADOS['X'], _DADOS['fisicas'], _DADOS['y'], _DADOS['folds']
+    treino = np.flatnonzero(folds != fold)
+    teste = np.flatnonzero(folds == fold)
+    modelo = PerceptronFerramentas(**_PARAMETROS)
+
+    # Normalização ajustada só ao treino do fold; o one-hot e as colunas
+    # binárias já vêm codificadas
+    estatisticas = EstatisticasNormalizacao()
+    estatisticas.atualizar(fisicas[treino])
+    modelo.normalizacao_params = estatisticas.parametros()
+    normalizar_fisicas(modelo, fisicas, X)
+
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        modelo.treinar_matriz(X, y, indices=treino)
+    tempo = time.perf_counter() - inicio
+
+    resumo = ResumoAvaliacao(limite_amostras=0)
+    for posicao in range(0, len(teste), TAMANHO_BLOCO_AVALIACAO):
+        linhas = teste[posicao:posicao + TAMANHO_BLOCO_AVALIACAO]
+        Xb = X[linhas]
+        predicoes, margens = pontuar(Xb, modelo.pesos, modelo.bias)
+        resumo.registrar(Xb, y[linhas], predicoes, margens)
+
+    return {
+        'fold': fold + 1,
+        'n_treino': len(treino),
+        'n_teste': len(teste),
+        'acuracia_teste': resumo.acuracia,
+        'acuracia_treino': modelo.historico_treinamento[-1]['acuracia'],
+        'iteracoes_realizadas': len(modelo.historico_treinamento),
+        'convergiu': modelo.historico_treinamento[-1]['erros'] == 0,
+        'tempo_segundos': tempo,
+        'resumo': resumo
+    }
+
+
+def agregar_folds(resultados: List[dict], legenda_funcoes: Optional[dict] = None) -> dict:
+    """
+    Combina os resultados dos folds.
+
+    Args:
+        resultados (List[dict]): Resultados de `_treinar_fold`, um por fold
+        legenda_funcoes (Optional[dict]): Descrições por código de função
+
+    Returns:
+        dict: Média, desvio padrão (amostral), mínimo e máximo da acurácia dos
+            folds, acurácia fora do fold geral e por função, matriz de confusão
+            e a tabela por fold
+    """
+    resultados = sorted(resultados, key=lambda r: r['fold'])
+    acuracias = np.array([r['acuracia_teste'] for r in resultados])
+    combinado = ResumoAvaliacao(limite_amostras=0)
+    for resultado in resultados:
+        combinado.combinar(resultado['resumo'])
+    geral = combinado.para_dict(legenda_funcoes)
+
+    return {
+        'k': len(resultados),
+        'acuracia_media': float(acuracias.mean()),
+        'acuracia_desvio': float(acuracias.std(ddof=1)) if len(acuracias) > 1 else 0.0,
+        'acuracia_minima': float(acuracias.min()),
+        'acuracia_maxima': float(acuracias.max()),
+        'acuracia_fora_do_fold': geral['acuracia'],
+        'acuracia_por_funcao': geral['acuracia_por_funcao'],
+        'matriz_confusao': geral['matriz_confusao'],
+        'folds': [{chave: valor for chave, valor in resultado.items() if chave != 'resumo'}
+                  for resultado in resultados]
+    }
+
+
+def executar_validacao_cruzada(modelo: PerceptronFerramentas,
+                               caminho_arquivo: str = 'data/dataset_ferramentas.csv', k: int = 5,
+                               estratificar_folds: Optional[str] = None,
+                               n_processos: Optional[int] = None) -> dict:
+    """
+    Validação cruzada com os hiperparâmetros de um modelo.
+
+    O modelo não é alterado; cada fold treina uma cópia com a mesma
+    configuração (taxa, iterações, modo, paciência, embaralhamento e semente)
+    e com a normalização ajustada às suas linhas de treino.
+
+    Args:
+        modelo (PerceptronFerramentas): Modelo que fornece a configuração
+        caminho_arquivo (str): CSV rotulado
+        k (int): Número de folds
+        estratificar_folds (Optional[str]): Estratos dos folds ('eh_ferramenta',
+            'cod_funcao' ou 'ambos'; None = k-fold simples)
+        n_processos (Optional[int]): Processos trabalhadores (padrão: min(k, núcleos);
+            1 = no próprio processo)
+
+    Returns:
+        dict: Resultado de `agregar_folds` com k, estratificação, semente e tempo total
+    """
+    if estratificar_folds is not None and estratificar_folds not in ESTRATIFICACOES:
+        raise ValueError(f"Estratificação desconhecida: {estratificar_folds}")
+
+    try:
+        valores, y = carregar_valores(caminho_arquivo)
+    except FileNotFoundError:
+        raise ValueError(f"Arquivo '{caminho_arquivo}' não encontrado")
+
+    # A mesma semente sorteia os folds e inicializa o modelo de cada fold
+    semente = modelo.semente_treinamento if modelo.semente_treinamento is not None else modelo.semente
+    if semente is None:
+        semente = random.randrange(2 ** 32)
+    # Codificado uma vez; as colunas normalizadas são refeitas em cada fold
+    X = codificar_colunas(modelo, valores, np.float32)
+    fisicas = np.ascontiguousarray(valores[:, :3])
+    estratos = None
+    if estratificar_folds is not None:
+        from amostragem import estratos_matriz
+        estratos = estratos_matriz(X, y, estratificar_folds)
+    folds = gerar_folds(len(y), k, semente, estratos)
+    dados = {'X': X, 'fisicas': fisicas, 'y': y, 'folds': folds}
+
+    parametros = {
+        'taxa_aprendizado': modelo.taxa_aprendizado, 'max_iteracoes': modelo.max_iteracoes,
+        'semente': semente, 'modo': modelo.modo, 'paciencia': modelo.paciencia,
+        'embaralhar': modelo.embaralhar, 'estratificar': modelo.estratificar
+    }
+    n_processos = n_processos or min(k, os.cpu_count() or 1)
+
+    inicio = time.perf_counter()
+    resultados = []
+    if n_processos > 1:
+        segmentos, descricoes = compartilhar_arrays(dados)
+        try:
+            with ProcessPoolExecutor(max_workers=n_processos, initializer=_inicializar_trabalhador,
+                                     initargs=(descricoes, parametros)) as executor:
+                futuros = [executor.submit(_treinar_fold, fold) for fold in range(k)]
+                for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+                    resultados.append(futuro.result())
+                    print(f"\rFolds concluídos: {concluidos}/{k}", end='', flush=True)
+            print()
+        finally:
+            liberar_segmentos(segmentos)
+    else:
+        global _DADOS, _PARAMETROS
+        _DADOS = dados
+        _PARAMETROS = parametros
+        try:
+            resultados = [_treinar_fold(fold) for fold in range(k)]
+        finally:
+            _DADOS, _PARAMETROS = {}, {}
+
+    validacao = agregar_folds(resultados, modelo.legenda_funcoes)
+    validacao.update({
+        'estratificar_folds': estratificar_folds,
+        'semente': semente,
+        'tempo_segundos': time.perf_counter() - inicio
+    })
+    return validacao
+
+
+def mostrar_validacao(validacao: dict) -> None:
+    """Exibe o resumo da validação cruzada."""
+    print(f"VALIDAÇÃO CRUZADA ({validacao['k']} folds"
+          + (f", estratificada por {validacao['estratificar_folds']}" if validacao['estratificar_folds'] else "")
+          + ")")
+    for fold in validacao['folds']:
+        print(f"  Fold {fold['fold']}: {fold['acuracia_teste']:.1f}% "
+              f"({fold['n_teste']} itens, {fold['iteracoes_realizadas']} iterações)")
+    print(f"  Acurácia: {validacao['acuracia_media']:.1f}% ± {validacao['acuracia_desvio']:.1f}%")
+    print("  Acurácia por função (fora do fold):")
+    for codigo, dados in validacao['acuracia_por_funcao'].items():
+        print(f"    {codigo}: {dados['acuracia']:.1f}% ({dados['total']} itens)")
+
+
+def main():
+    """Linha de comando da validação cruzada."""
+    parser = argparse.ArgumentParser(description="Validação cruzada k-fold do Perceptron")
+    parser.add_argument('-k', '--folds', type=int, default=5)
+    parser.add_argument('--estratificar-folds', choices=ESTRATIFICACOES, default=None)
+    parser.add_argument('--semente', type=int, default=None)
+    parser.add_argument('--taxa', type=float, default=0.1)
+    parser.add_argument('--max-iteracoes', type=int, default=1000)
+    parser.add_argument('--embaralhar', action='store_true')
+    parser.add_argument('--processos', type=int, default=None)
+    parser.add_argument('--treino', default='data/dataset_ferramentas.csv')
+    args = parser.parse_args()
+
+    modelo = PerceptronFerramentas(args.taxa, args.max_iteracoes, args.semente,
+                                   embaralhar=args.embaralhar)
+    validacao = executar_validacao_cruzada(modelo, args.treino, args.folds, args.estratificar_folds,
+                                           args.processos)
+    mostrar_validacao(validacao)
+    print(f"Tempo total: {validacao['tempo_segundos']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Varredura paralela de sementes e hiperparâmetros do Perceptron.
+
+Cada configuração (semente, taxa de aprendizado, máximo de iterações,
+embaralhamento) é treinada em um processo de um ProcessPoolExecutor. Os
+datasets codificados ficam em memória compartilhada e cada trabalhador os
+mapeia uma única vez, então as tarefas carregam apenas a configuração.
+
+Uso:
+    python src/varredura.py --sementes 0-9 --taxas 0.01 0.1 0.5 --embaralhar ambos
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from cache_features import carregar_features_com_cache
+from classificador_ferramentas import PerceptronFerramentas
+from memoria_compartilhada import anexar_arrays, compartilhar_arrays, liberar_segmentos
+
+
+COLUNAS_RESULTADO = ['posicao', 'semente', 'taxa_aprendizado', 'max_iteracoes', 'embaralhar',
+                     'acuracia_teste', 'acuracia_treino', 'iteracoes_realizadas', 'convergiu',
+                     'tempo_segundos']
+
+# Campos que identificam uma configuração (desempate da ordenação)
+CHAVES_CONFIGURACAO = ['semente', 'taxa_aprendizado', 'max_iteracoes', 'embaralhar']
+
+# Estado de cada processo trabalhador (preenchido por _inicializar_trabalhador)
+_SEGMENTOS = []
+_DADOS: Dict = {}
+
+
+def gerar_configuracoes(sementes: List[int], taxas: List[float], max_iteracoes: List[int],
+                        embaralhar: List[bool]) -> List[dict]:
+    """
+    Gera a grade completa de configurações da varredura.
+
+    Args:
+        sementes (List[int]): Sementes de inicialização
+        taxas (List[float]): Taxas de aprendizado
+        max_iteracoes (List[int]): Limites de iterações
+        embaralhar (List[bool]): Valores de embaralhamento por época
+
+    Returns:
+        List[dict]: Uma configuração por combinação
+    """
+    return [
+        {'semente': semente, 'taxa_aprendizado': taxa, 'max_iteracoes': iteracoes,
+         'embaralhar': embaralha}
+        for semente, taxa, iteracoes, embaralha in itertools.product(sementes, taxas, max_iteracoes,
+                                                                     embaralhar)
+    ]
+
+
+def _inicializar_trabalhador(descricoes: dict) -> None:
+    """Mapeia os datasets compartilhados uma vez por processo trabalhador."""
+    global _SEGMENTOS, _DADOS
+    _SEGMENTOS, _DADOS = anexar_arrays(descricoes)
+
+
+def _treinar_configuracao(configuracao: dict) -> dict:
+    """Treina e avalia uma configuração usando os datasets do trabalhador."""
+    modelo = PerceptronFerramentas(configuracao['taxa_aprendizado'], configuracao['max_iteracoes'],
+                                   configuracao['semente'])
+
+    inicio = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        modelo.treinar_matriz(_DADOS['X_treino'], _DADOS['y_treino'],
+                              embaralhar=configuracao['embaralhar'])
+        acuracia_teste = modelo.avaliar_matriz(_DADOS['X_teste'], _DADOS['y_teste'])
+    tempo = time.perf_counter() - inicio
+
+    iteracoes = len(modelo.historico_treinamento)
+    resultado = dict(configuracao)
+    resultado.update({
+        'acuracia_teste': acuracia_teste,
+        'acuracia_treino': modelo.historico_treinamento[-1]['acuracia'],
+        'iteracoes_realizadas': iteracoes,
+        'convergiu': modelo.historico_treinamento[-1]['erros'] == 0,
+        'tempo_segundos': tempo
+    })
+    return resultado
+
+
+def ordenar_resultados(resultados: List[dict]) -> List[dict]:
+    """
+    Ordena os resultados: maior acurácia de teste, depois de treino, depois menos iterações.
+
+    Empates são desfeitos pela configuração, então a tabela não depende da
+    ordem em que os processos terminam.
+
+    Args:
+        resultados (List[dict]): Resultados da varredura
+
+    Returns:
+        List[dict]: Resultados ordenados, com a coluna 'posicao'
+    """
+    ordenados = sorted(resultados, key=lambda r: (-r['acuracia_teste'], -r['acuracia_treino'],
+                                                  r['iteracoes_realizadas'],
+                                                  [r.get(chave) for chave in CHAVES_CONFIGURACAO]))
+    for posicao, resultado in enumerate(ordenados, start=1):
+        resultado['posicao'] = posicao
+    return ordenados
+
+
+def executar_varredura(configuracoes: List[dict], caminho_treino: str = 'data/dataset_ferramentas.csv',
+                       caminho_teste: str = 'data/dataset_teste.csv', n_processos: Optional[int] = None,
+                       caminho_saida: Optional[str] = 'resultados_varredura.csv') -> List[dict]:
+    """
+    Treina todas as configurações em paralelo e grava a tabela ordenada.
+
+    Args:
+        configuracoes (List[dict]): Configurações (ver `gerar_configuracoes`)
+        caminho_treino (str): CSV de treinamento
+        caminho_teste (str): CSV de teste
+        n_processos (Optional[int]): Processos trabalhadores (padrão: núcleos disponíveis)
+        caminho_saida (Optional[str]): CSV com a tabela ordenada (None = não grava)
+
+    Returns:
+        List[dict]: Resultados ordenados
+    """
+    # A codificação depende apenas dos parâmetros de normalização: os mesmos
+    # ajustados ao treino em main, para ranquear as configurações sobre as mesmas features
+    modelo_base = PerceptronFerramentas()
+    modelo_base.ajustar_normalizacao(caminho_treino)
+    treino = carregar_features_com_cache(caminho_treino, modelo_base)
+    teste = carregar_features_com_cache(caminho_teste, modelo_base)
+    if treino is None or teste is None:
+        raise ValueError("Não foi possível carregar os datasets da varredura")
+
+    segmentos, descricoes = compartilhar_arrays({
+        'X_treino': treino.X, 'y_treino': treino.y,
+        'X_teste': teste.X, 'y_teste': teste.y
+    })
+    resultados = []
+    try:
+        with ProcessPoolExecutor(max_workers=n_processos or os.cpu_count(),
+                                 initializer=_inicializar_trabalhador,
+                                 initargs=(descricoes,)) as executor:
+            futuros = [executor.submit(_treinar_configuracao, configuracao)
+                       for configuracao in configuracoes]
+            for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+                resultados.append(futuro.result())
+                print(f"\rConfigurações concluídas: {concluidos}/{len(futuros)}", end='', flush=True)
+        print()
+    finally:
+        liberar_segmentos(segmentos)
+
+    resultados = ordenar_resultados(resultados)
+    if caminho_saida is not None:
+        salvar_tabela_resultados(resultados, caminho_saida)
+    return resultados
+
+
+def salvar_tabela_resultados(resultados: List[dict], caminho_saida: str) -> None:
+    """
+    Grava os resultados ordenados em CSV.
+
+    Args:
+        resultados (List[dict]): Resultados ordenados
+        caminho_saida (str): Caminho do CSV
+    """
+    with open(caminho_saida, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.DictWriter(arquivo, fieldnames=COLUNAS_RESULTADO, extrasaction='ignore')
+        escritor.writeheader()
+        escritor.writerows(resultados)
+    print(f"Tabela da varredura salva em: {caminho_saida}")
+
+
+def _intervalo_sementes(texto: str) -> List[int]:
+    """Converte '0-9' ou '1,5,7' em lista de sementes."""
+    if '-' in texto:
+        inicio, fim = texto.split('-', 1)
+        return list(range(int(inicio), int(fim) + 1))
+    return [int(parte) for parte in texto.split(',')]
+
+
+def main():
+    """Linha de comando da varredura."""
+    parser = argparse.ArgumentParser(description="Varredura paralela de hiperparâmetros do Perceptron")
+    parser.add_argument('--sementes', type=_intervalo_sementes, default=list(range(10)),
+                        help="Intervalo '0-9' ou lista '1,2,3' (padrão: 0-9)")
+    parser.add_argument('--taxas', type=float, nargs='+', default=[0.01, 0.1, 0.5])
+    parser.add_argument('--max-iteracoes', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--embaralhar', choices=['sim', 'nao', 'ambos'], default='ambos')
+    parser.add_argument('--processos', type=int, default=None)
+    parser.add_argument('--treino', default='data/dataset_ferramentas.csv')
+    parser.add_argument('--teste', default='data/dataset_teste.csv')
+    parser.add_argument('--saida', default='resultados_varredura.csv')
+    args = parser.parse_args()
+
+    embaralhar = {'sim': [True], 'nao': [False], 'ambos': [False, True]}[args.embaralhar]
+    configuracoes = gerar_configuracoes(args.sementes, args.taxas, args.max_iteracoes, embaralhar)
+    print(f"Varredura: {len(configuracoes)} configurações")
+
+    resultados = executar_varredura(configuracoes, args.treino, args.teste, args.processos, args.saida)
+
+    print("\nMELHORES CONFIGURAÇÕES")
+    print("-" * 70)
+    for resultado in resultados[:10]:
+        print(f"{resultado['posicao']:>3}. semente={resultado['semente']} "
+              f"taxa={resultado['taxa_aprendizado']} max_iter={resultado['max_iteracoes']} "
+              f"embaralhar={resultado['embaralhar']}: teste={resultado['acuracia_teste']:.1f}% "
+              f"treino={resultado['acuracia_treino']:.1f}% iter={resultado['iteracoes_realizadas']}")
+
+
+if __name__ == "__main__":
+    main()
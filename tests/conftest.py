@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Configuração comum dos testes: módulos de src/ e modelos treinados no dataset de exemplo."""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+DIRETORIO_RAIZ = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, os.path.join(DIRETORIO_RAIZ, 'src'))
+
+from classificador_ferramentas import PerceptronFerramentas, carregar_dataset_csv  # noqa: E402
+from multiclasse import PerceptronFuncoes  # noqa: E402
+
+CAMINHO_TREINO = os.path.join(DIRETORIO_RAIZ, 'data', 'dataset_ferramentas.csv')
+CAMINHO_TESTE = os.path.join(DIRETORIO_RAIZ, 'data', 'dataset_teste.csv')
+
+
+def copiar_dataset(caminho_origem: str, diretorio) -> str:
+    """Copia um CSV de exemplo para um diretório temporário (o cache é gravado ao lado do CSV)."""
+    destino = os.path.join(str(diretorio), os.path.basename(caminho_origem))
+    shutil.copyfile(caminho_origem, destino)
+    return destino
+
+
+def alterar_primeiro_peso(caminho_csv: str, novo_peso: str) -> None:
+    """Troca o peso do primeiro item do CSV."""
+    with open(caminho_csv, encoding='utf-8') as arquivo:
+        linhas = arquivo.read().splitlines()
+    campos = linhas[1].split(',')
+    campos[1] = novo_peso
+    linhas[1] = ','.join(campos)
+    with open(caminho_csv, 'w', encoding='utf-8') as arquivo:
+        arquivo.write('\n'.join(linhas) + '\n')
+
+
+@pytest.fixture(scope='session')
+def dados_treino():
+    return carregar_dataset_csv(CAMINHO_TREINO)
+
+
+@pytest.fixture(scope='session')
+def dados_teste():
+    return carregar_dataset_csv(CAMINHO_TESTE)
+
+
+@pytest.fixture(scope='session')
+def modelo_treinado(dados_treino):
+    modelo = PerceptronFerramentas(max_iteracoes=50, semente=42)
+    modelo.treinar(dados_treino)
+    return modelo
+
+
+@pytest.fixture(scope='session')
+def modelo_funcoes(dados_treino, modelo_treinado):
+    modelo = PerceptronFuncoes(max_iteracoes=50, semente=42,
+                               normalizacao_params=modelo_treinado.normalizacao_params)
+    modelo.treinar(dados_treino)
+    return modelo
+
+
+@pytest.fixture(scope='session')
+def caminho_modelo(tmp_path_factory, modelo_treinado, modelo_funcoes):
+    """Modelo e preditor de função salvos lado a lado, como em `main.py --modelo`."""
+    from preditor import SUFIXO_MODELO_FUNCOES
+
+    caminho = str(tmp_path_factory.mktemp('modelo') / 'modelo.bin')
+    modelo_treinado.salvar(caminho)
+    modelo_funcoes.salvar(caminho + SUFIXO_MODELO_FUNCOES)
+    return caminho
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""Ordem de visita embaralhada: reprodutível pela semente e estratificada."""
+
+import numpy as np
+import pytest
+
+from amostragem import AmostradorEpocas, estratos_matriz
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import codificar_matriz
+
+
+def _epocas(amostrador, n_epocas):
+    return [amostrador.ordem_epoca().copy() for _ in range(n_epocas)]
+
+
+@pytest.mark.parametrize('estratos', [None, np.repeat([0, 1, 2], [50, 30, 20])])
+def test_mesma_semente_mesma_ordem(estratos):
+    primeira = _epocas(AmostradorEpocas(100, semente=5, estratos=estratos), 4)
+    segunda = _epocas(AmostradorEpocas(100, semente=5, estratos=estratos), 4)
+    outra = _epocas(AmostradorEpocas(100, semente=6, estratos=estratos), 4)
+
+    for ordem_a, ordem_b in zip(primeira, segunda):
+        np.testing.assert_array_equal(ordem_a, ordem_b)
+    for ordem in primeira:
+        assert sorted(ordem.tolist()) == list(range(100))
+    # Épocas diferentes e sementes diferentes geram permutações diferentes
+    assert not np.array_equal(primeira[0], primeira[1])
+    assert not np.array_equal(primeira[0], outra[0])
+
+
+def test_estratos_intercalados_em_qualquer_trecho():
+    # Dataset ordenado por classe: 75% de uma, 25% da outra
+    estratos = np.repeat([0, 1], [300, 100])
+    amostrador = AmostradorEpocas(400, semente=1, estratos=estratos)
+
+    for ordem in _epocas(amostrador, 3):
+        assert sorted(ordem.tolist()) == list(range(400))
+        for inicio in range(0, 400, 40):
+            trecho = estratos[ordem[inicio:inicio + 40]]
+            assert 8 <= np.count_nonzero(trecho) <= 12
+
+
+def test_estratos_por_funcao(dados_treino):
+    modelo = PerceptronFerramentas()
+    X, y = codificar_matriz(modelo, dados_treino)
+
+    codigos = estratos_matriz(X, y, 'cod_funcao')
+    assert codigos.tolist() == [int(linha[7]) for linha in dados_treino]
+    np.testing.assert_array_equal(estratos_matriz(X, y, 'ambos'), codigos * 2 + y)
+    with pytest.raises(ValueError):
+        estratos_matriz(X, y, 'peso')
+    with pytest.raises(ValueError):
+        AmostradorEpocas(len(y), semente=1, estratos=codigos[:-1])
+
+
+@pytest.mark.parametrize('estratificar', [None, 'eh_ferramenta', 'ambos'])
+def test_motores_embaralhados_geram_os_mesmos_pesos(dados_treino, estratificar):
+    modelos = {}
+    for motor in ('python', 'numpy'):
+        modelo = PerceptronFerramentas(max_iteracoes=5, semente=11, embaralhar=True,
+                                       estratificar=estratificar)
+        modelo.treinar(dados_treino, motor=motor)
+        modelos[motor] = modelo
+
+    assert [float(peso) for peso in modelos['numpy'].pesos] == list(modelos['python'].pesos)
+    assert float(modelos['numpy'].bias) == modelos['python'].bias
+
+
+def test_estratificacao_desconhecida():
+    with pytest.raises(ValueError):
+        PerceptronFerramentas(estratificar='peso')
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Aprendizado incremental com `atualizar` e histórico gravado no modelo salvo."""
+
+import copy
+
+import numpy as np
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas, atualizar_modelo_salvo
+
+from .conftest import CAMINHO_TESTE
+
+
+def test_atualizar_equivale_a_continuar_o_treino(modelo_treinado, dados_teste):
+    modelos = {motor: copy.deepcopy(modelo_treinado) for motor in ('python', 'numpy')}
+    for motor, modelo in modelos.items():
+        modelo.atualizar(dados_teste, epocas=3, motor=motor)
+
+    np.testing.assert_allclose(modelos['numpy'].pesos, modelos['python'].pesos, rtol=0, atol=1e-12)
+    assert modelos['numpy'].bias == pytest.approx(modelos['python'].bias, abs=1e-12)
+
+
+def test_atualizar_sem_erros_nao_muda_os_pesos(modelo_treinado, dados_treino):
+    modelo = copy.deepcopy(modelo_treinado)
+    # O modelo de teste converge no treino: nenhuma atualização nos mesmos itens
+    assert modelo.atualizar(dados_treino, epocas=5) == 0
+    assert modelo.pesos == modelo_treinado.pesos
+    assert len(modelo.historico_treinamento) == len(modelo_treinado.historico_treinamento) + 1
+
+
+def test_atualizar_aprende_os_novos_itens(modelo_treinado, dados_teste):
+    modelo = copy.deepcopy(modelo_treinado)
+    erros_antes = sum(modelo.prever_item(linha) != int(linha[-1]) for linha in dados_teste)
+    modelo.atualizar(dados_teste, epocas=50)
+    erros_depois = sum(modelo.prever_item(linha) != int(linha[-1]) for linha in dados_teste)
+
+    assert erros_antes > 0
+    assert erros_depois < erros_antes
+
+
+def test_atualizar_sem_treino(dados_teste):
+    with pytest.raises(ValueError):
+        PerceptronFerramentas().atualizar(dados_teste)
+
+
+def test_historico_salvo_com_o_modelo(tmp_path, modelo_treinado):
+    caminho = str(tmp_path / 'modelo.bin')
+    modelo_treinado.salvar(caminho)
+    carregado = PerceptronFerramentas.carregar(caminho)
+
+    assert len(carregado.historico_treinamento) == len(modelo_treinado.historico_treinamento)
+    assert carregado.historico_treinamento.colunas() == modelo_treinado.historico_treinamento.colunas()
+
+
+def test_atualizar_modelo_salvo_anexa_ao_historico(tmp_path, modelo_treinado):
+    caminho = str(tmp_path / 'modelo.bin')
+    modelo_treinado.salvar(caminho)
+    n_epocas = len(modelo_treinado.historico_treinamento)
+
+    atualizar_modelo_salvo(caminho, CAMINHO_TESTE)
+    atualizar_modelo_salvo(caminho, CAMINHO_TESTE)
+    atualizado = PerceptronFerramentas.carregar(caminho)
+
+    assert len(atualizado.historico_treinamento) == n_epocas + 2
+    assert atualizado.pesos != list(modelo_treinado.pesos)
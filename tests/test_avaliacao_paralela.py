@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Avaliação dividida entre processos igual à avaliação serial."""
+
+import csv
+
+import pytest
+
+from avaliacao_paralela import avaliar_arquivo_paralelo
+
+from .conftest import CAMINHO_TESTE
+
+
+@pytest.fixture(scope='module')
+def caminho_grande(tmp_path_factory, dados_teste):
+    """CSV de teste repetido 40 vezes, com nomes distintos."""
+    caminho = tmp_path_factory.mktemp('avaliacao') / 'teste_grande.csv'
+    with open(CAMINHO_TESTE, encoding='utf-8', newline='') as arquivo:
+        cabecalho = next(csv.reader(arquivo))
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(cabecalho)
+        for repeticao in range(40):
+            escritor.writerows([f'{linha[0]} {repeticao}'] + linha[1:] for linha in dados_teste)
+    return str(caminho)
+
+
+def test_processos_nao_mudam_o_resumo(modelo_treinado, caminho_grande):
+    serial = avaliar_arquivo_paralelo(modelo_treinado, caminho_grande, n_processos=1, tamanho_bloco=50)
+    paralelo = avaliar_arquivo_paralelo(modelo_treinado, caminho_grande, n_processos=4, tamanho_bloco=17)
+
+    assert paralelo.para_dict() == serial.para_dict()
+
+
+def test_resumo_igual_a_avaliacao_serial(modelo_treinado, dados_teste, caminho_grande):
+    resumo = avaliar_arquivo_paralelo(modelo_treinado, caminho_grande, n_processos=3, limite_amostras=5)
+    predicoes = [modelo_treinado.prever_item(linha) for linha in dados_teste]
+    reais = [int(linha[-1]) for linha in dados_teste]
+    erros = [linha[0] for linha, predicao, real in zip(dados_teste, predicoes, reais) if predicao != real]
+
+    assert resumo.total == 40 * len(dados_teste)
+    assert resumo.acuracia == pytest.approx(modelo_treinado.avaliar_dataset(dados_teste))
+    assert resumo.matriz_confusao[1, 0] == 40 * sum(p == 0 and r == 1 for p, r in zip(predicoes, reais))
+    assert resumo.matriz_confusao[0, 1] == 40 * sum(p == 1 and r == 0 for p, r in zip(predicoes, reais))
+    # Amostra de erros na ordem do arquivo, limitada
+    esperados = [f'{nome} {repeticao}' for repeticao in range(40) for nome in erros][:5]
+    assert [amostra['item'] for amostra in resumo.amostras_erros] == esperados
+
+
+def test_acuracia_por_funcao(modelo_treinado, dados_teste, caminho_grande):
+    por_funcao = avaliar_arquivo_paralelo(modelo_treinado, caminho_grande, n_processos=2) \
+        .para_dict(modelo_treinado.legenda_funcoes)['acuracia_por_funcao']
+
+    for codigo, dados in por_funcao.items():
+        linhas = [linha for linha in dados_teste if linha[7] == codigo]
+        corretas = sum(modelo_treinado.prever_item(linha) == int(linha[-1]) for linha in linhas)
+        assert dados['total'] == 40 * len(linhas)
+        assert dados['acuracia'] == pytest.approx(100 * corretas / len(linhas))
+        assert dados['funcao'] == modelo_treinado.legenda_funcoes[int(codigo)]
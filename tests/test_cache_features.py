@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Cache binário de features: reutilização e invalidação quando o CSV muda."""
+
+import os
+
+import numpy as np
+import pytest
+
+import cache_features
+from cache_features import SUFIXO_CACHE, calcular_hash_arquivo, carregar_features_com_cache, ler_cabecalho
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import codificar_matriz
+
+from .conftest import CAMINHO_TREINO, alterar_primeiro_peso, copiar_dataset
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+def test_cache_igual_a_codificacao_direta(tmp_path, dados_treino, dtype):
+    caminho_csv = copiar_dataset(CAMINHO_TREINO, tmp_path)
+    modelo = PerceptronFerramentas()
+    dados = carregar_features_com_cache(caminho_csv, modelo, dtype=dtype, incluir_nomes=True)
+    X, y = codificar_matriz(modelo, dados_treino, dtype)
+
+    assert dados.X.dtype == np.dtype(dtype)
+    np.testing.assert_array_equal(dados.X, X)
+    np.testing.assert_array_equal(dados.y, y)
+    assert dados.nomes == [linha[0] for linha in dados_treino]
+
+
+def test_cache_reutilizado_sem_alteracao(tmp_path):
+    caminho_csv = copiar_dataset(CAMINHO_TREINO, tmp_path)
+    modelo = PerceptronFerramentas()
+
+    primeiro = carregar_features_com_cache(caminho_csv, modelo)
+    mtime = os.path.getmtime(caminho_csv + SUFIXO_CACHE)
+    segundo = carregar_features_com_cache(caminho_csv, modelo)
+
+    assert os.path.getmtime(caminho_csv + SUFIXO_CACHE) == mtime
+    np.testing.assert_array_equal(primeiro.X, segundo.X)
+
+
+def test_cache_invalidado_quando_csv_muda(tmp_path):
+    caminho_csv = copiar_dataset(CAMINHO_TREINO, tmp_path)
+    modelo = PerceptronFerramentas()
+
+    antes = np.array(carregar_features_com_cache(caminho_csv, modelo).X)
+    hash_antes = ler_cabecalho(caminho_csv + SUFIXO_CACHE)['hash_fonte']
+    alterar_primeiro_peso(caminho_csv, '400')
+    depois = carregar_features_com_cache(caminho_csv, modelo).X
+
+    assert ler_cabecalho(caminho_csv + SUFIXO_CACHE)['hash_fonte'] != hash_antes
+    assert depois[0, 0] != antes[0, 0]
+    np.testing.assert_array_equal(depois[1:], antes[1:])
+
+
+@pytest.mark.parametrize('alterar', ['normalizacao', 'dtype'])
+def test_cache_invalidado_quando_codificacao_muda(tmp_path, alterar):
+    caminho_csv = copiar_dataset(CAMINHO_TREINO, tmp_path)
+    modelo = PerceptronFerramentas()
+    carregar_features_com_cache(caminho_csv, modelo)
+    mtime = os.path.getmtime(caminho_csv + SUFIXO_CACHE)
+    os.utime(caminho_csv + SUFIXO_CACHE, (mtime - 10, mtime - 10))
+
+    dtype = 'float32'
+    if alterar == 'normalizacao':
+        modelo.normalizacao_params['peso'] = {'min': 0, 'max': 1600}
+    else:
+        dtype = 'float64'
+    dados = carregar_features_com_cache(caminho_csv, modelo, dtype=dtype)
+
+    assert os.path.getmtime(caminho_csv + SUFIXO_CACHE) > mtime - 10
+    assert ler_cabecalho(caminho_csv + SUFIXO_CACHE)['normalizacao'] == modelo.normalizacao_params
+    assert dados.X.dtype == np.dtype(dtype)
+
+
+def test_hash_informado_nao_rele_o_csv(tmp_path, monkeypatch):
+    caminho_csv = copiar_dataset(CAMINHO_TREINO, tmp_path)
+    modelo = PerceptronFerramentas()
+    hash_fonte = calcular_hash_arquivo(caminho_csv)
+    carregar_features_com_cache(caminho_csv, modelo)
+
+    def falhar(caminho):
+        raise AssertionError("hash recalculado")
+
+    monkeypatch.setattr(cache_features, 'calcular_hash_arquivo', falhar)
+    assert carregar_features_com_cache(caminho_csv, modelo, hash_fonte=hash_fonte) is not None
+    assert cache_features.normalizacao_do_cache(caminho_csv, hash_fonte=hash_fonte) is not None
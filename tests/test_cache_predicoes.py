@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""Cache LRU de `prever_item`: acertos, despejo e invalidação."""
+
+import copy
+
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+
+
+@pytest.fixture
+def modelo(modelo_treinado):
+    modelo = copy.deepcopy(modelo_treinado)
+    modelo.configurar_cache_predicoes(4)
+    return modelo
+
+
+def test_acerto_devolve_a_mesma_predicao(modelo, modelo_treinado, dados_teste):
+    primeira = [modelo.prever_item(linha) for linha in dados_teste[:3]]
+    segunda = [modelo.prever_item(linha) for linha in dados_teste[:3]]
+    estatisticas = modelo.estatisticas_cache()
+
+    assert primeira == segunda == [modelo_treinado.prever_item(linha) for linha in dados_teste[:3]]
+    assert (estatisticas['acertos'], estatisticas['falhas'], estatisticas['ocupacao']) == (3, 3, 3)
+    assert estatisticas['taxa_acerto'] == 0.5
+
+
+def test_campos_fora_da_codificacao_nao_entram_na_chave(modelo, dados_teste):
+    linha = list(dados_teste[0])
+    modelo.prever_item(linha)
+    linha[0] = 'Outro nome'
+    linha[6] = '999.99'
+    modelo.prever_item(linha)
+
+    assert modelo.acertos_cache == 1
+
+
+def test_despeja_o_menos_usado(modelo, dados_teste):
+    for linha in dados_teste[:4]:
+        modelo.prever_item(linha)
+    modelo.prever_item(dados_teste[0])   # 0 passa a ser o mais recente
+    modelo.prever_item(dados_teste[4])   # despeja o 1
+    modelo.acertos_cache = modelo.falhas_cache = 0
+
+    modelo.prever_item(dados_teste[0])
+    modelo.prever_item(dados_teste[1])
+    assert (modelo.acertos_cache, modelo.falhas_cache) == (1, 1)
+    assert modelo.estatisticas_cache()['ocupacao'] == 4
+
+
+@pytest.mark.parametrize('atributo', ['pesos', 'bias', 'normalizacao_params'])
+def test_atribuicao_invalida_o_cache(modelo, dados_teste, atributo):
+    predicao = modelo.prever_item(dados_teste[0])
+    if atributo == 'pesos':
+        modelo.pesos = [-peso for peso in modelo.pesos]
+    elif atributo == 'bias':
+        modelo.bias = 100.0 if predicao == 0 else -100.0
+    else:
+        modelo.normalizacao_params = {nome: {'min': params['max'], 'max': params['max'] + 1}
+                                      for nome, params in modelo.normalizacao_params.items()}
+
+    assert modelo.estatisticas_cache()['ocupacao'] == 0
+    sem_cache = copy.deepcopy(modelo)
+    sem_cache.configurar_cache_predicoes(0)
+    assert modelo.prever_item(dados_teste[0]) == sem_cache.prever_item(dados_teste[0])
+    if atributo == 'bias':
+        assert modelo.prever_item(dados_teste[0]) != predicao
+
+
+def test_atualizar_invalida_o_cache(modelo, dados_teste):
+    modelo.prever_item(dados_teste[0])
+    modelo.atualizar(dados_teste, epocas=3)
+
+    assert modelo.estatisticas_cache()['ocupacao'] == 0
+
+
+def test_tamanho_negativo():
+    with pytest.raises(ValueError):
+        PerceptronFerramentas(tamanho_cache=-1)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Leitura em blocos: mesmas linhas e mesmos pesos do carregamento completo."""
+
+import numpy as np
+import pytest
+
+from carregador_blocos import (dividir_em_intervalos, iterar_blocos_csv, iterar_linhas_csv,
+                               iterar_linhas_intervalo)
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import codificar_matriz
+
+from .conftest import CAMINHO_TREINO
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 7, 1000])
+def test_blocos_reproduzem_carregar_dataset_csv(dados_treino, tamanho_bloco):
+    blocos = list(iterar_linhas_csv(CAMINHO_TREINO, tamanho_bloco))
+
+    assert all(len(bloco) <= tamanho_bloco for bloco in blocos)
+    assert [linha for bloco in blocos for linha in bloco] == dados_treino
+
+
+def test_blocos_codificados_iguais_a_matriz(dados_treino):
+    modelo = PerceptronFerramentas()
+    X, y = codificar_matriz(modelo, dados_treino)
+    blocos = list(iterar_blocos_csv(CAMINHO_TREINO, modelo, tamanho_bloco=10))
+
+    np.testing.assert_array_equal(np.concatenate([bloco.X for bloco in blocos]), X)
+    np.testing.assert_array_equal(np.concatenate([bloco.y for bloco in blocos]), y)
+
+
+@pytest.mark.parametrize('n_partes', [1, 3, 8])
+def test_intervalos_cobrem_o_arquivo_sem_repetir(dados_treino, n_partes):
+    linhas = [linha
+              for inicio, fim in dividir_em_intervalos(CAMINHO_TREINO, n_partes)
+              for bloco in iterar_linhas_intervalo(CAMINHO_TREINO, inicio, fim, 16)
+              for linha in bloco]
+
+    assert [linha[0] for linha in linhas] == [linha[0] for linha in dados_treino]
+
+
+def test_treinar_em_blocos_igual_ao_motor_numpy(dados_treino):
+    em_memoria = PerceptronFerramentas(max_iteracoes=5, semente=11)
+    em_memoria.treinar(dados_treino, motor='numpy')
+    em_blocos = PerceptronFerramentas(max_iteracoes=5, semente=11)
+    em_blocos.treinar_em_blocos(CAMINHO_TREINO, tamanho_bloco=9)
+
+    np.testing.assert_array_equal(em_blocos.pesos, em_memoria.pesos)
+    assert em_blocos.bias == em_memoria.bias
+
+
+def test_avaliar_em_blocos_igual_a_avaliar_dataset(modelo_treinado, dados_treino):
+    assert modelo_treinado.avaliar_em_blocos(CAMINHO_TREINO, tamanho_bloco=8) == \
+        modelo_treinado.avaliar_dataset(dados_treino)
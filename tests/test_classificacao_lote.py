@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Classificação em lote de arquivos CSV (`main.py classificar`)."""
+
+import csv
+
+import pytest
+
+import classificacao_lote
+from classificacao_lote import CABECALHO_SAIDA, classificar_arquivo, classificar_com_modelo_salvo
+
+from .conftest import CAMINHO_TESTE
+
+
+def _ler_saida(caminho):
+    with open(caminho, encoding='utf-8', newline='') as arquivo:
+        return list(csv.reader(arquivo))
+
+
+@pytest.fixture
+def entrada_sem_codigos(tmp_path, dados_teste):
+    """CSV de teste com os primeiros códigos de função apagados."""
+    caminho = tmp_path / 'itens.csv'
+    with open(CAMINHO_TESTE, encoding='utf-8', newline='') as arquivo:
+        cabecalho = next(csv.reader(arquivo))
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(cabecalho)
+        for i, linha in enumerate(dados_teste):
+            escritor.writerow(linha[:7] + [''] + linha[8:] if i < 5 else linha)
+    return str(caminho)
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 10, 65536])
+def test_saida_igual_a_prever_lote(tmp_path, modelo_treinado, dados_teste, tamanho_bloco):
+    caminho_saida = tmp_path / 'saida.csv'
+    total = classificar_arquivo(modelo_treinado, CAMINHO_TESTE, str(caminho_saida),
+                                tamanho_bloco=tamanho_bloco)
+    predicoes, margens = modelo_treinado.prever_lote(dados_teste)
+    saida = _ler_saida(caminho_saida)
+
+    assert total == len(dados_teste)
+    assert saida[0] == CABECALHO_SAIDA
+    assert [linha[0] for linha in saida[1:]] == [linha[0] for linha in dados_teste]
+    assert [linha[1] for linha in saida[1:]] == [linha[7] for linha in dados_teste]
+    assert [int(linha[2]) for linha in saida[1:]] == predicoes.tolist()
+    assert [float(linha[3]) for linha in saida[1:]] == pytest.approx(margens.tolist(), abs=1e-6)
+
+
+def test_codigos_vazios_previstos(tmp_path, modelo_treinado, modelo_funcoes, dados_teste, entrada_sem_codigos):
+    caminho_saida = tmp_path / 'saida.csv'
+    classificar_arquivo(modelo_treinado, entrada_sem_codigos, str(caminho_saida), modelo_funcoes)
+    saida = _ler_saida(caminho_saida)[1:]
+    previstos, _ = modelo_funcoes.prever_lote(dados_teste[:5])
+
+    assert [int(linha[1]) for linha in saida[:5]] == previstos.tolist()
+    assert [linha[1] for linha in saida[5:]] == [linha[7] for linha in dados_teste[5:]]
+
+
+def test_codigo_vazio_sem_preditor(tmp_path, modelo_treinado, entrada_sem_codigos):
+    with pytest.raises(ValueError):
+        classificar_arquivo(modelo_treinado, entrada_sem_codigos, str(tmp_path / 'saida.csv'))
+
+
+def test_modelo_salvo_nos_dois_caminhos(tmp_path, monkeypatch, caminho_modelo, dados_teste,
+                                       entrada_sem_codigos):
+    pequeno = tmp_path / 'pequeno.csv'
+    grande = tmp_path / 'grande.csv'
+    assert classificar_com_modelo_salvo(caminho_modelo, entrada_sem_codigos, str(pequeno)) == len(dados_teste)
+    # Limite zerado: o mesmo arquivo vai para o caminho em blocos com NumPy
+    monkeypatch.setattr(classificacao_lote, 'LIMITE_ARQUIVO_PEQUENO', 0)
+    assert classificar_com_modelo_salvo(caminho_modelo, entrada_sem_codigos, str(grande)) == len(dados_teste)
+
+    assert pequeno.read_text(encoding='utf-8') == grande.read_text(encoding='utf-8')
+
+
+def test_arquivo_inexistente(tmp_path, caminho_modelo):
+    assert classificar_com_modelo_salvo(caminho_modelo, str(tmp_path / 'nao_existe.csv'),
+                                        str(tmp_path / 'saida.csv')) is None
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Codificação compacta (5 físicas + posição da função) equivale ao vetor denso."""
+
+import random
+
+import numpy as np
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import codificar_matriz
+
+
+@pytest.fixture(scope='module')
+def pesos_aleatorios():
+    gerador = random.Random(0)
+    return [gerador.uniform(-1, 1) for _ in range(14)], gerador.uniform(-1, 1)
+
+
+def test_margem_compacta_igual_ao_produto_denso(dados_treino, pesos_aleatorios):
+    pesos, bias = pesos_aleatorios
+    modelo = PerceptronFerramentas()
+    for linha in dados_treino:
+        item = modelo.preparar_features_compactas(linha)
+        densa = modelo.preparar_features(linha)
+        # Igualdade exata: o motor 'python' e o vetorizado dependem disso
+        assert item.margem(pesos, bias) == modelo._produto_escalar(densa, pesos) + bias
+
+
+def test_densa_igual_a_codificacao_vetorizada(dados_treino):
+    modelo = PerceptronFerramentas()
+    X, _ = codificar_matriz(modelo, dados_treino)
+
+    np.testing.assert_array_equal(np.array([modelo.preparar_features(linha) for linha in dados_treino]), X)
+
+
+@pytest.mark.parametrize('codigo', ['0', '10', '-2'])
+def test_codigo_invalido_sem_funcao(dados_treino, pesos_aleatorios, codigo):
+    pesos, bias = pesos_aleatorios
+    modelo = PerceptronFerramentas()
+    linha = list(dados_treino[0])
+    linha[7] = codigo
+    item = modelo.preparar_features_compactas(linha)
+
+    assert item.indice_funcao == -1
+    assert item.densa()[5:] == [0.0] * 9
+    assert item.margem(pesos, bias) == modelo._produto_escalar(item.densa(), pesos) + bias
+
+
+def test_dados_compactos(dados_treino):
+    modelo = PerceptronFerramentas()
+    X, y = modelo.preparar_dados_compactos(dados_treino)
+    ordem = list(range(len(dados_treino)))[::-3]
+
+    assert len(X) == len(dados_treino)
+    assert list(y) == [int(linha[-1]) for linha in dados_treino]
+    for i, linha in enumerate(dados_treino):
+        assert X[i].densa() == modelo.preparar_features(linha)
+    assert list(X.em_ordem(ordem)) == [list(X)[i] for i in ordem]
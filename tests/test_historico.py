@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Histórico de treinamento em colunas e arquivo JSON Lines."""
+
+import json
+import pickle
+
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+from historico import CAPACIDADE_INICIAL, HistoricoTreinamento, carregar_historico
+
+
+def _preencher(n_epocas):
+    historico = HistoricoTreinamento()
+    for i in range(n_epocas):
+        historico.registrar(n_epocas - i, 100.0 * i / n_epocas)
+    return historico
+
+
+def test_comporta_se_como_lista_de_dicionarios():
+    historico = _preencher(3)
+
+    assert len(historico) == 3
+    assert list(historico) == [
+        {'iteracao': 1, 'erros': 3, 'acuracia': 0.0},
+        {'iteracao': 2, 'erros': 2, 'acuracia': 100.0 / 3},
+        {'iteracao': 3, 'erros': 1, 'acuracia': 200.0 / 3},
+    ]
+    assert historico[-1]['iteracao'] == 3
+    assert historico[1:] == list(historico)[1:]
+    with pytest.raises(IndexError):
+        historico[3]
+
+
+def test_cresce_alem_da_capacidade():
+    historico = _preencher(3 * CAPACIDADE_INICIAL + 5)
+
+    assert len(historico) == 3 * CAPACIDADE_INICIAL + 5
+    assert historico[-1]['erros'] == 1
+
+
+def test_colunas_ida_e_volta():
+    historico = _preencher(100)
+    restaurado = HistoricoTreinamento.de_colunas(historico.colunas())
+
+    assert list(restaurado) == list(historico)
+    with pytest.raises(ValueError):
+        HistoricoTreinamento.de_colunas({'erros': [1, 2], 'acuracia': [50.0]})
+
+
+def test_jsonl_ida_e_volta(tmp_path):
+    caminho = str(tmp_path / 'historico.jsonl')
+    historico = HistoricoTreinamento()
+    historico.gravar_em(caminho)
+    for i in range(120):
+        historico.registrar(i, i / 7)
+    historico.fechar()
+
+    with open(caminho, encoding='utf-8') as arquivo:
+        assert json.loads(arquivo.readline()) == {'iteracao': 1, 'erros': 0, 'acuracia': 0.0}
+    assert list(carregar_historico(caminho)) == list(historico)
+
+
+def test_jsonl_anexado_continua_a_numeracao(tmp_path):
+    caminho = str(tmp_path / 'historico.jsonl')
+    historico = _preencher(0)
+    historico.gravar_em(caminho)
+    historico.registrar(5, 50.0)
+    historico.gravar_em(caminho, anexar=True)
+    historico.registrar(2, 80.0)
+    historico.fechar()
+
+    assert [epoca['iteracao'] for epoca in carregar_historico(caminho)] == [1, 2]
+    assert list(carregar_historico(caminho)) == list(historico)
+
+
+def test_treino_grava_jsonl(tmp_path, dados_treino):
+    caminho = str(tmp_path / 'historico.jsonl')
+    modelo = PerceptronFerramentas(max_iteracoes=50, semente=42)
+    modelo.historico_treinamento.gravar_em(caminho)
+    modelo.treinar(dados_treino)
+    modelo.historico_treinamento.fechar()
+
+    assert list(carregar_historico(caminho)) == list(modelo.historico_treinamento)
+
+
+def test_copia_nao_leva_o_arquivo_aberto(tmp_path):
+    historico = _preencher(10)
+    historico.gravar_em(str(tmp_path / 'historico.jsonl'))
+    copia = pickle.loads(pickle.dumps(historico))
+    historico.fechar()
+
+    assert list(copia) == list(historico)
+    copia.registrar(0, 100.0)
+    assert len(copia) == 11
+
+
+def test_arquivo_inexistente(tmp_path):
+    assert carregar_historico(str(tmp_path / 'nao_existe.jsonl')) is None
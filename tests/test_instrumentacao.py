@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Ganchos de treinamento e perfilador."""
+
+import json
+
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+from instrumentacao import CallbacksTreinamento, PerfiladorTreinamento, sobrescreve_ao_atualizar
+
+
+class Registro(CallbacksTreinamento):
+    """Gancho que anota cada chamada, sem `ao_atualizar`."""
+
+    def __init__(self):
+        self.eventos = []
+
+    def ao_iniciar_fase(self, modelo, nome):
+        self.eventos.append(('iniciar_fase', nome))
+
+    def ao_terminar_fase(self, modelo, nome):
+        self.eventos.append(('terminar_fase', nome))
+
+    def ao_iniciar_epoca(self, modelo, iteracao):
+        self.eventos.append(('iniciar_epoca', iteracao))
+
+    def ao_terminar_epoca(self, modelo, iteracao, erros, n_amostras, atualizacoes):
+        self.eventos.append(('terminar_epoca', iteracao, erros, n_amostras, atualizacoes))
+
+    def ao_convergir(self, modelo, iteracao):
+        self.eventos.append(('convergir', iteracao))
+
+
+class RegistroAtualizacoes(CallbacksTreinamento):
+    def __init__(self):
+        self.atualizacoes = []
+
+    def ao_atualizar(self, modelo, posicao, n_errados):
+        self.atualizacoes.append((posicao, n_errados))
+
+
+@pytest.mark.parametrize('motor', ['python', 'numpy'])
+def test_ganchos_de_epoca_seguem_o_historico(dados_treino, motor):
+    registro = Registro()
+    modelo = PerceptronFerramentas(max_iteracoes=50, semente=42, callbacks=[registro])
+    modelo.treinar(dados_treino, motor=motor)
+
+    fins = [evento for evento in registro.eventos if evento[0] == 'terminar_epoca']
+    assert [evento[1] for evento in fins] == list(range(1, len(modelo.historico_treinamento) + 1))
+    assert [evento[2] for evento in fins] == [epoca['erros'] for epoca in modelo.historico_treinamento]
+    assert all(evento[3] == len(dados_treino) for evento in fins)
+    # Na regra por amostra, cada erro gera exatamente uma atualização
+    assert all(evento[2] == evento[4] for evento in fins)
+    assert ('convergir', len(fins)) in registro.eventos
+    assert registro.eventos.index(('iniciar_fase', 'treinar')) < registro.eventos.index(('iniciar_epoca', 1))
+    assert registro.eventos.index(('terminar_fase', 'treinar')) > registro.eventos.index(fins[-1])
+
+
+@pytest.mark.parametrize('motor', ['python', 'numpy'])
+def test_ao_atualizar_chamado_por_atualizacao(dados_treino, motor):
+    registro = RegistroAtualizacoes()
+    modelo = PerceptronFerramentas(max_iteracoes=50, semente=42, callbacks=[registro])
+    modelo.treinar(dados_treino, motor=motor)
+
+    assert len(registro.atualizacoes) == sum(epoca['erros'] for epoca in modelo.historico_treinamento)
+    assert all(n_errados == 1 for _, n_errados in registro.atualizacoes)
+
+
+def test_ganchos_nao_mudam_os_pesos(dados_treino):
+    sem_ganchos = PerceptronFerramentas(max_iteracoes=50, semente=42)
+    sem_ganchos.treinar(dados_treino)
+    com_ganchos = PerceptronFerramentas(max_iteracoes=50, semente=42,
+                                        callbacks=[Registro(), RegistroAtualizacoes()])
+    com_ganchos.treinar(dados_treino)
+
+    assert com_ganchos.pesos == sem_ganchos.pesos
+
+
+def test_sobrescreve_ao_atualizar():
+    assert not sobrescreve_ao_atualizar(Registro())
+    assert sobrescreve_ao_atualizar(RegistroAtualizacoes())
+    assert not sobrescreve_ao_atualizar(PerfiladorTreinamento())
+
+
+def test_perfilador_resumo_e_trace(tmp_path, dados_treino):
+    perfilador = PerfiladorTreinamento()
+    modelo = PerceptronFerramentas(max_iteracoes=50, semente=42, callbacks=[perfilador])
+    modelo.treinar(dados_treino, motor='numpy')
+    resumo = perfilador.resumo()
+
+    assert resumo['convergiu_em'] == len(modelo.historico_treinamento)
+    assert len(resumo['epocas']) == len(modelo.historico_treinamento)
+    assert resumo['atualizacoes'] == sum(epoca['erros'] for epoca in modelo.historico_treinamento)
+    assert {'codificar', 'treinar'} <= set(resumo['fases_segundos'])
+
+    caminho = tmp_path / 'trace.json'
+    perfilador.salvar_trace_chrome(str(caminho))
+    eventos = json.loads(caminho.read_text(encoding='utf-8'))['traceEvents']
+    assert sum(evento['cat'] == 'epoca' for evento in eventos) == len(resumo['epocas'])
+    assert all(evento['ph'] == 'X' and evento['dur'] >= 0 for evento in eventos)
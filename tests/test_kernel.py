@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""Perceptron com kernel, cache de Gram e expansão de grau 2."""
+
+import numpy as np
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+from kernel import PARES_GRAU2, CacheGram, PerceptronKernel, calcular_kernel, expandir_grau2
+from motor_vetorizado import N_CARACTERISTICAS, codificar_matriz
+
+
+@pytest.fixture(scope='module')
+def matrizes(dados_treino, dados_teste):
+    modelo = PerceptronFerramentas()
+    return codificar_matriz(modelo, dados_treino) + codificar_matriz(modelo, dados_teste)
+
+
+@pytest.mark.parametrize('kernel', ['polinomial', 'rbf'])
+def test_kernel_separa_o_treino(matrizes, kernel):
+    X, y, X_teste, y_teste = matrizes
+    modelo = PerceptronKernel(kernel, gamma=1.0, max_iteracoes=200, semente=3, embaralhar=True)
+    modelo.treinar_matriz(X, y)
+
+    assert modelo.historico_treinamento[-1]['erros'] == 0
+    assert modelo.avaliar_matriz(X, y) == 100.0
+    # As margens do modelo final equivalem à soma dos kernels ponderados
+    esperadas = calcular_kernel(X_teste, modelo.vetores_suporte, kernel) @ modelo.coeficientes + modelo.bias
+    np.testing.assert_allclose(modelo.margens(X_teste), esperadas)
+    predicoes, _ = modelo.prever_lote(X_teste)
+    assert modelo.avaliar_matriz(X_teste, y_teste) == 100.0 * np.mean(predicoes == y_teste)
+
+
+def test_mesma_semente_mesmo_modelo(matrizes):
+    X, y, _, _ = matrizes
+    modelos = []
+    for _ in range(2):
+        modelo = PerceptronKernel('rbf', max_iteracoes=20, semente=9, embaralhar=True)
+        modelo.treinar_matriz(X, y)
+        modelos.append(modelo)
+
+    np.testing.assert_array_equal(modelos[0].coeficientes, modelos[1].coeficientes)
+    np.testing.assert_array_equal(modelos[0].vetores_suporte, modelos[1].vetores_suporte)
+
+
+def test_cache_gram_limitado_nao_altera_o_treino(matrizes):
+    X, y, _, _ = matrizes
+    completo = PerceptronKernel('rbf', max_iteracoes=50, semente=1)
+    completo.treinar_matriz(X, y)
+    # Espaço para duas linhas de Gram apenas
+    limitado = PerceptronKernel('rbf', max_iteracoes=50, semente=1, limite_cache_bytes=2 * 8 * len(y))
+    limitado.treinar_matriz(X, y)
+
+    assert limitado.estatisticas_cache['capacidade'] == 2
+    assert completo.estatisticas_cache['capacidade'] == len(y)
+    assert limitado.estatisticas_cache['falhas'] > completo.estatisticas_cache['falhas']
+    assert (completo.estatisticas_cache['acertos'] + completo.estatisticas_cache['falhas']
+            == limitado.estatisticas_cache['acertos'] + limitado.estatisticas_cache['falhas'])
+    np.testing.assert_allclose(limitado.coeficientes, completo.coeficientes)
+    np.testing.assert_allclose(limitado.margens(X), completo.margens(X))
+
+
+def test_cache_gram_lru(matrizes):
+    X, _, _, _ = matrizes
+    modelo = PerceptronKernel('rbf')
+    cache = CacheGram(X, modelo, limite_bytes=2 * X.shape[0] * X.itemsize)
+
+    for i in (0, 1, 0, 2, 0, 1):
+        np.testing.assert_allclose(cache.linha(i), calcular_kernel(X[i:i + 1], X, 'rbf')[0])
+    # 0 acerta duas vezes; 1 sai quando 2 entra e precisa ser recalculada
+    assert (cache.acertos, cache.falhas) == (2, 4)
+
+
+def test_limite_de_vetores_suporte(matrizes):
+    X, y, _, _ = matrizes
+    modelo = PerceptronKernel('rbf', max_iteracoes=30, semente=2, max_vetores_suporte=5)
+    modelo.treinar_matriz(X, y)
+
+    assert 0 < len(modelo.coeficientes) <= 5
+
+
+def test_compactar_funde_vetores_repetidos():
+    modelo = PerceptronKernel('linear')
+    modelo.vetores_suporte = np.array([[1.0, 0.0], [0.0, 1.0], [1.0, 0.0], [2.0, 2.0]])
+    modelo.coeficientes = np.array([0.5, -0.25, 0.25, 0.0])
+    modelo.bias = 0.0
+    X = np.array([[1.0, 2.0], [-3.0, 0.5]])
+    antes = modelo.margens(X)
+    modelo.compactar()
+
+    assert len(modelo.coeficientes) == 2
+    np.testing.assert_allclose(modelo.margens(X), antes)
+
+
+def test_salvar_e_carregar(tmp_path, matrizes, dados_teste):
+    X, y, X_teste, _ = matrizes
+    modelo = PerceptronKernel('polinomial', grau=3, gamma=0.5, coef0=2.0, max_iteracoes=50, semente=4)
+    modelo.treinar_matriz(X, y)
+    caminho = str(tmp_path / 'kernel.bin')
+    modelo.salvar(caminho)
+    carregado = PerceptronKernel.carregar(caminho)
+
+    assert (carregado.kernel, carregado.grau, carregado.gamma, carregado.coef0) == ('polinomial', 3, 0.5, 2.0)
+    assert carregado.normalizacao_params == modelo.normalizacao_params
+    np.testing.assert_array_equal(carregado.margens(X_teste), modelo.margens(X_teste))
+    assert [carregado.prever_item(linha) for linha in dados_teste] == modelo.prever_lote(X_teste)[0].tolist()
+
+
+def test_carregar_rejeita_outro_formato(caminho_modelo):
+    with pytest.raises(ValueError):
+        PerceptronKernel.carregar(caminho_modelo)
+
+
+def test_expandir_grau2(matrizes):
+    X, _, _, _ = matrizes
+    expandida = expandir_grau2(X)
+
+    assert expandida.shape == (X.shape[0], N_CARACTERISTICAS + len(PARES_GRAU2))
+    assert expandida.dtype == X.dtype
+    np.testing.assert_array_equal(expandida[:, :N_CARACTERISTICAS], X)
+    for coluna, (i, j) in enumerate(PARES_GRAU2, start=N_CARACTERISTICAS):
+        np.testing.assert_array_equal(expandida[:, coluna], X[:, i] * X[:, j])
+
+
+def test_perceptron_linear_sobre_grau2(matrizes):
+    X, y, _, _ = matrizes
+    modelo = PerceptronFerramentas(max_iteracoes=100, semente=42)
+    modelo.treinar_matriz(expandir_grau2(X), y)
+
+    assert len(modelo.pesos) == N_CARACTERISTICAS + len(PARES_GRAU2)
+    assert modelo.historico_treinamento[-1]['erros'] == 0
+    assert modelo.avaliar_matriz(expandir_grau2(X), y) == 100.0
+
+
+@pytest.mark.parametrize('argumentos', [
+    {'kernel': 'sigmoide'}, {'max_iteracoes': 0}, {'max_vetores_suporte': 0}])
+def test_parametros_invalidos(argumentos):
+    with pytest.raises(ValueError):
+        PerceptronKernel(**argumentos)
+
+
+def test_modelo_nao_treinado(matrizes):
+    X, _, _, _ = matrizes
+    with pytest.raises(ValueError):
+        PerceptronKernel().margens(X)
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Modos 'pocket' e 'averaged' e parada antecipada por paciência."""
+
+import numpy as np
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import codificar_matriz, contar_erros
+
+
+@pytest.fixture(scope='module')
+def dados_inseparaveis(dados_treino):
+    """Dataset com itens repetidos de rótulo trocado: o treino nunca converge."""
+    trocados = [linha[:-1] + [str(1 - int(linha[-1]))] for linha in dados_treino[:6]]
+    return dados_treino + trocados
+
+
+def _treinar(dados, motor='numpy', **parametros):
+    modelo = PerceptronFerramentas(semente=5, **parametros)
+    modelo.treinar(dados, motor=motor)
+    return modelo
+
+
+def _erros(modelo, dados):
+    X, y = codificar_matriz(modelo, dados)
+    return contar_erros(X, y, np.asarray(modelo.pesos, dtype=np.float64), float(modelo.bias))
+
+
+def test_pocket_guarda_os_melhores_pesos(dados_inseparaveis):
+    pocket = _treinar(dados_inseparaveis, max_iteracoes=20, modo='pocket')
+    # Pesos ao fim de cada época: os do modo padrão treinado por 1, 2, ..., 20 épocas
+    erros_por_epoca = [_erros(_treinar(dados_inseparaveis, max_iteracoes=n), dados_inseparaveis)
+                       for n in range(1, 21)]
+
+    assert erros_por_epoca[-1] > min(erros_por_epoca)
+    assert _erros(pocket, dados_inseparaveis) == min(erros_por_epoca)
+
+
+def test_averaged_difere_dos_pesos_finais(dados_inseparaveis):
+    padrao = _treinar(dados_inseparaveis, max_iteracoes=20)
+    media = _treinar(dados_inseparaveis, max_iteracoes=20, modo='averaged')
+
+    assert [epoca['erros'] for epoca in media.historico_treinamento] == \
+        [epoca['erros'] for epoca in padrao.historico_treinamento]
+    assert not np.allclose(media.pesos, padrao.pesos)
+
+
+@pytest.mark.parametrize('modo', ['pocket', 'averaged'])
+def test_modos_iguais_nos_dois_motores(dados_inseparaveis, modo):
+    lista = _treinar(dados_inseparaveis, 'python', max_iteracoes=15, modo=modo)
+    vetorizado = _treinar(dados_inseparaveis, 'numpy', max_iteracoes=15, modo=modo)
+
+    np.testing.assert_allclose(vetorizado.pesos, lista.pesos, rtol=1e-12, atol=1e-12)
+    assert float(vetorizado.bias) == pytest.approx(lista.bias, abs=1e-12)
+
+
+def test_paciencia_para_no_plato(dados_inseparaveis):
+    paciencia = 3
+    modelo = _treinar(dados_inseparaveis, max_iteracoes=500, paciencia=paciencia)
+    erros = [epoca['erros'] for epoca in modelo.historico_treinamento]
+
+    assert len(erros) < 500
+    assert min(erros[-paciencia:]) >= min(erros[:-paciencia])
+
+
+def test_sem_paciencia_usa_todas_as_epocas(dados_inseparaveis):
+    assert len(_treinar(dados_inseparaveis, max_iteracoes=30).historico_treinamento) == 30
+
+
+@pytest.mark.parametrize('parametros', [{'modo': 'outro'}, {'paciencia': 0}, {'max_iteracoes': 0}])
+def test_parametros_invalidos(parametros):
+    with pytest.raises(ValueError):
+        PerceptronFerramentas(**parametros)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Motor de listas ('python') e motor vetorizado ('numpy') produzem os mesmos pesos."""
+
+import numpy as np
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+
+
+def test_motores_geram_os_mesmos_pesos(dados_treino):
+    modelos = {}
+    for motor in ('python', 'numpy'):
+        # Poucas épocas: o treino para antes de convergir e os erros por época são comparáveis
+        modelo = PerceptronFerramentas(max_iteracoes=5, semente=7)
+        modelo.treinar(dados_treino, motor=motor)
+        modelos[motor] = modelo
+
+    assert [float(peso) for peso in modelos['numpy'].pesos] == list(modelos['python'].pesos)
+    assert float(modelos['numpy'].bias) == modelos['python'].bias
+    assert ([epoca['erros'] for epoca in modelos['numpy'].historico_treinamento]
+            == [epoca['erros'] for epoca in modelos['python'].historico_treinamento])
+
+
+@pytest.mark.parametrize('dtype', ['float32', 'float64'])
+def test_motor_numpy_converge(dados_treino, dtype):
+    modelo = PerceptronFerramentas(max_iteracoes=100, semente=42)
+    modelo.treinar(dados_treino, motor='numpy', dtype=dtype)
+
+    assert modelo.historico_treinamento[-1]['erros'] == 0
+    assert modelo.avaliar_dataset(dados_treino) == 100.0
+
+
+def test_lote_unitario_equivale_a_regra_por_amostra(dados_treino):
+    por_amostra = PerceptronFerramentas(max_iteracoes=20, semente=3)
+    por_amostra.treinar(dados_treino, motor='numpy')
+    em_lotes = PerceptronFerramentas(max_iteracoes=20, semente=3)
+    em_lotes.treinar(dados_treino, motor='numpy', tamanho_lote=1)
+
+    np.testing.assert_allclose(em_lotes.pesos, por_amostra.pesos)
+
+
+@pytest.mark.parametrize('motor, tamanho_lote', [('python', 8), ('outro', None)])
+def test_parametros_invalidos(dados_treino, motor, tamanho_lote):
+    with pytest.raises(ValueError):
+        PerceptronFerramentas(max_iteracoes=1).treinar(dados_treino, motor=motor, tamanho_lote=tamanho_lote)
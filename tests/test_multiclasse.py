@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Preditor do código de função (perceptrons um-contra-todos)."""
+
+import random
+
+import numpy as np
+import pytest
+
+from motor_vetorizado import codificar_matriz
+from multiclasse import PerceptronFuncoes, codigo_ausente
+
+
+def _treinar_por_amostra(X, codigos, taxa, max_iteracoes, semente):
+    """Regra do perceptron aplicada amostra a amostra, sem a varredura em blocos."""
+    gerador = random.Random(semente)
+    pesos = np.array([[gerador.uniform(-0.1, 0.1) for _ in range(5)] for _ in range(9)])
+    bias = np.array([gerador.uniform(-0.1, 0.1) for _ in range(9)])
+    alvos = np.eye(9)[codigos - 1]
+    for _ in range(max_iteracoes):
+        com_erro = 0
+        for x, alvo in zip(X, alvos):
+            erro = alvo - (pesos @ x + bias >= 0)
+            if erro.any():
+                pesos += taxa * np.outer(erro, x)
+                bias += taxa * erro
+                com_erro += 1
+        if com_erro == 0:
+            break
+    return pesos, bias
+
+
+def test_treino_em_blocos_igual_a_regra_por_amostra(dados_treino):
+    modelo = PerceptronFuncoes(max_iteracoes=10, semente=4)
+    modelo.treinar(dados_treino)
+    codigos = np.array([int(linha[7]) for linha in dados_treino])
+    pesos, bias = _treinar_por_amostra(modelo.codificar(dados_treino), codigos, 0.1, 10, 4)
+
+    np.testing.assert_allclose(modelo.pesos, pesos, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(modelo.bias, bias, rtol=0, atol=1e-12)
+
+
+def test_acuracia_acima_do_acaso(modelo_funcoes, dados_treino):
+    X, _ = codificar_matriz(modelo_funcoes, dados_treino)
+    codigos = np.array([int(linha[7]) for linha in dados_treino])
+
+    # 9 funções: o acaso acerta ~11%
+    assert modelo_funcoes.avaliar_matriz(X, codigos) > 30.0
+    assert modelo_funcoes.avaliar_matriz(X, codigos) == modelo_funcoes.historico_treinamento[-1]['acuracia']
+
+
+def test_matriz_completa_e_linhas_brutas_concordam(modelo_funcoes, dados_teste):
+    X, _ = codificar_matriz(modelo_funcoes, dados_teste)
+    por_matriz, margens = modelo_funcoes.prever_lote(X)
+    por_linhas, _ = modelo_funcoes.prever_lote(dados_teste)
+
+    np.testing.assert_array_equal(por_matriz, por_linhas)
+    np.testing.assert_array_equal(por_matriz, margens.argmax(axis=1) + 1)
+    assert [modelo_funcoes.prever_item(linha) for linha in dados_teste] == por_matriz.tolist()
+
+
+def test_completar_codigos(modelo_funcoes, dados_teste):
+    linhas = [list(linha) for linha in dados_teste[:8]]
+    for linha, codigo in zip(linhas, ['', 'nan', '0', '12', 'abc']):
+        linha[7] = codigo
+    esperados, _ = modelo_funcoes.prever_lote(linhas[:5])
+
+    assert modelo_funcoes.completar_codigos(linhas) == 5
+    assert [linha[7] for linha in linhas[:5]] == esperados.tolist()
+    assert [linha[7] for linha in linhas[5:]] == [linha[7] for linha in dados_teste[5:8]]
+
+
+@pytest.mark.parametrize('valor, ausente', [('', True), ('nan', True), ('0', True), ('10', True),
+                                            ('abc', True), (None, True), ('1', False), ('9.0', False)])
+def test_codigo_ausente(valor, ausente):
+    assert codigo_ausente(valor) is ausente
+
+
+def test_salvar_carregar(tmp_path, modelo_funcoes):
+    caminho = str(tmp_path / 'funcoes.bin')
+    modelo_funcoes.salvar(caminho)
+    carregado = PerceptronFuncoes.carregar(caminho)
+
+    np.testing.assert_array_equal(carregado.pesos, modelo_funcoes.pesos)
+    np.testing.assert_array_equal(carregado.bias, modelo_funcoes.bias)
+    assert carregado.normalizacao_params == modelo_funcoes.normalizacao_params
+
+
+@pytest.mark.parametrize('codigos', [[0], [10]])
+def test_codigos_de_treino_invalidos(codigos):
+    with pytest.raises(ValueError):
+        PerceptronFuncoes(max_iteracoes=1).treinar_matriz(np.zeros((1, 5)), np.array(codigos))
+
+
+def test_max_iteracoes_invalido():
+    with pytest.raises(ValueError):
+        PerceptronFuncoes(max_iteracoes=0)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Ajuste da normalização: blocos combinados equivalem a uma passada única."""
+
+import numpy as np
+import pytest
+
+from cache_features import carregar_features_com_cache, normalizacao_do_cache
+from classificador_ferramentas import PerceptronFerramentas
+from normalizacao import EstatisticasNormalizacao, ajustar_normalizacao
+
+from .conftest import CAMINHO_TREINO, alterar_primeiro_peso, copiar_dataset
+
+
+def _valores(dados):
+    return np.array([[linha[1], linha[2], linha[3]] for linha in dados], dtype=np.float64)
+
+
+@pytest.mark.parametrize('tamanho_bloco', [1, 5, 16, 1000])
+def test_combinacao_de_blocos_igual_a_passada_unica(dados_treino, tamanho_bloco):
+    valores = _valores(dados_treino)
+    estatisticas = EstatisticasNormalizacao()
+    for inicio in range(0, len(valores), tamanho_bloco):
+        estatisticas.atualizar(valores[inicio:inicio + tamanho_bloco])
+
+    assert estatisticas.n == len(valores)
+    np.testing.assert_array_equal(estatisticas.minimo, valores.min(axis=0))
+    np.testing.assert_array_equal(estatisticas.maximo, valores.max(axis=0))
+    np.testing.assert_allclose(estatisticas.media, valores.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(np.sqrt(estatisticas.m2 / estatisticas.n), valores.std(axis=0), rtol=1e-12)
+
+
+def test_combinar_partes_independentes(dados_treino):
+    valores = _valores(dados_treino)
+    partes = []
+    for parte in np.array_split(valores, 4):
+        estatisticas = EstatisticasNormalizacao()
+        estatisticas.atualizar(parte)
+        partes.append(estatisticas)
+    total = EstatisticasNormalizacao()
+    for parte in partes[::-1]:
+        total.combinar(parte)
+
+    parametros = total.parametros(media_desvio=True)
+    assert parametros['peso']['min'] == valores[:, 0].min()
+    assert parametros['tamanho']['max'] == valores[:, 2].max()
+    assert parametros['dureza']['media'] == pytest.approx(valores[:, 1].mean(), rel=1e-12)
+    assert parametros['dureza']['desvio'] == pytest.approx(valores[:, 1].std(), rel=1e-12)
+
+
+@pytest.mark.parametrize('n_processos, tamanho_bloco', [(1, 7), (3, 5)])
+def test_ajustar_normalizacao_do_csv(dados_treino, n_processos, tamanho_bloco):
+    valores = _valores(dados_treino)
+    parametros = ajustar_normalizacao(CAMINHO_TREINO, tamanho_bloco, n_processos, media_desvio=True)
+
+    for i, nome in enumerate(('peso', 'dureza', 'tamanho')):
+        assert parametros[nome]['min'] == valores[:, i].min()
+        assert parametros[nome]['max'] == valores[:, i].max()
+        assert parametros[nome]['media'] == pytest.approx(valores[:, i].mean(), rel=1e-12)
+
+
+def test_caracteristica_constante():
+    estatisticas = EstatisticasNormalizacao()
+    estatisticas.atualizar(np.array([[5.0, 2.0, 3.0], [5.0, 4.0, 3.0]]))
+
+    assert estatisticas.parametros()['peso'] == {'min': 5.0, 'max': 6.0}
+
+
+def test_sem_amostras():
+    with pytest.raises(ValueError):
+        EstatisticasNormalizacao().parametros()
+
+
+def test_normalizacao_do_cache_segue_o_csv(tmp_path):
+    caminho_csv = copiar_dataset(CAMINHO_TREINO, tmp_path)
+    assert normalizacao_do_cache(caminho_csv) is None
+
+    carregar_features_com_cache(caminho_csv, PerceptronFerramentas())
+    assert normalizacao_do_cache(caminho_csv, media_desvio=True) == \
+        ajustar_normalizacao(caminho_csv, media_desvio=True)
+
+    alterar_primeiro_peso(caminho_csv, '5000')
+    assert normalizacao_do_cache(caminho_csv) is None
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Modelo salvo e carregado prevê exatamente como o modelo treinado."""
+
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+
+
+def test_salvar_carregar_preserva_modelo(tmp_path, modelo_treinado):
+    caminho = str(tmp_path / 'modelo.bin')
+    modelo_treinado.salvar(caminho)
+    carregado = PerceptronFerramentas.carregar(caminho)
+
+    assert list(carregado.pesos) == list(modelo_treinado.pesos)
+    assert carregado.bias == modelo_treinado.bias
+    assert carregado.normalizacao_params == modelo_treinado.normalizacao_params
+    assert carregado.legenda_funcoes == modelo_treinado.legenda_funcoes
+    assert carregado.taxa_aprendizado == modelo_treinado.taxa_aprendizado
+
+
+def test_modelo_carregado_preve_igual(tmp_path, modelo_treinado, dados_teste):
+    caminho = str(tmp_path / 'modelo.bin')
+    modelo_treinado.salvar(caminho)
+    carregado = PerceptronFerramentas.carregar(caminho)
+
+    assert ([carregado.prever_item(linha) for linha in dados_teste]
+            == [modelo_treinado.prever_item(linha) for linha in dados_teste])
+
+
+def test_salvar_sem_treino(tmp_path):
+    with pytest.raises(ValueError):
+        PerceptronFerramentas().salvar(str(tmp_path / 'modelo.bin'))
+
+
+def test_carregar_rejeita_arquivo_invalido(tmp_path):
+    caminho = tmp_path / 'invalido.bin'
+    caminho.write_bytes(b'nao e um modelo')
+    with pytest.raises(ValueError):
+        PerceptronFerramentas.carregar(str(caminho))
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""`prever_lote` concorda com `prever_item` linha a linha."""
+
+import numpy as np
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import codificar_matriz
+
+
+def test_prever_lote_igual_a_prever_item(modelo_treinado, dados_teste):
+    predicoes, margens = modelo_treinado.prever_lote(dados_teste)
+
+    assert predicoes.tolist() == [modelo_treinado.prever_item(linha) for linha in dados_teste]
+    assert ((margens >= 0) == (predicoes == 1)).all()
+
+
+def test_prever_lote_aceita_matriz_codificada(modelo_treinado, dados_teste):
+    X, _ = codificar_matriz(modelo_treinado, dados_teste)
+    predicoes_matriz, margens_matriz = modelo_treinado.prever_lote(X)
+    predicoes_linhas, margens_linhas = modelo_treinado.prever_lote(dados_teste)
+
+    np.testing.assert_array_equal(predicoes_matriz, predicoes_linhas)
+    np.testing.assert_allclose(margens_matriz, margens_linhas)
+
+
+def test_avaliar_dataset_vetorizado(modelo_treinado, dados_teste):
+    assert (modelo_treinado.avaliar_dataset(dados_teste, vetorizado=True)
+            == modelo_treinado.avaliar_dataset(dados_teste))
+
+
+def test_prever_lote_rejeita_colunas_erradas(modelo_treinado):
+    with pytest.raises(ValueError):
+        modelo_treinado.prever_lote(np.zeros((3, 10)))
+
+
+def test_prever_lote_sem_treino(dados_teste):
+    with pytest.raises(ValueError):
+        PerceptronFerramentas().prever_lote(dados_teste)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""Núcleo de inferência só com a biblioteca padrão: mesma saída do caminho NumPy e main.py sem efeitos na importação."""
+
+import csv
+import importlib.util
+import os
+import sys
+
+import pytest
+
+from classificacao_lote import classificar_arquivo, classificar_arquivo_simples
+from preditor import SUFIXO_MODELO_FUNCOES, PreditorFerramentas, PreditorFuncoes, codigo_funcao
+
+from .conftest import CAMINHO_TESTE, DIRETORIO_RAIZ
+
+CAMINHO_MAIN = os.path.join(DIRETORIO_RAIZ, 'main.py')
+
+# Códigos que não estão em 1-9: todos são previstos pelo preditor de função
+CODIGOS_INVALIDOS = ['', '0', '10', '-3', '0.5', '9.9', '1e400', 'inf', '-inf', 'nan', 'abc']
+
+
+@pytest.fixture
+def caminho_entrada(tmp_path):
+    with open(CAMINHO_TESTE, encoding='utf-8', newline='') as arquivo:
+        linhas = list(csv.reader(arquivo))
+    for i, codigo in enumerate(CODIGOS_INVALIDOS, start=1):
+        linhas[i][7] = codigo
+    caminho = tmp_path / 'itens.csv'
+    with open(caminho, 'w', encoding='utf-8', newline='') as arquivo:
+        csv.writer(arquivo).writerows(linhas)
+    return str(caminho)
+
+
+def _classificar_os_dois(caminho_modelo, modelo_treinado, modelo_funcoes, caminho_entrada, tmp_path):
+    saida_numpy = tmp_path / 'numpy.csv'
+    saida_simples = tmp_path / 'simples.csv'
+    classificar_arquivo(modelo_treinado, caminho_entrada, str(saida_numpy), modelo_funcoes)
+    classificar_arquivo_simples(PreditorFerramentas.carregar(caminho_modelo), caminho_entrada,
+                                str(saida_simples),
+                                PreditorFuncoes.carregar(caminho_modelo + SUFIXO_MODELO_FUNCOES))
+    return saida_numpy.read_text(encoding='utf-8'), saida_simples.read_text(encoding='utf-8')
+
+
+def test_saidas_identicas(caminho_modelo, modelo_treinado, modelo_funcoes, caminho_entrada, tmp_path):
+    numpy, simples = _classificar_os_dois(caminho_modelo, modelo_treinado, modelo_funcoes,
+                                          caminho_entrada, tmp_path)
+    assert numpy == simples
+
+
+def test_codigos_invalidos_sao_previstos(caminho_modelo, modelo_treinado, modelo_funcoes,
+                                         caminho_entrada, tmp_path):
+    numpy, _ = _classificar_os_dois(caminho_modelo, modelo_treinado, modelo_funcoes,
+                                    caminho_entrada, tmp_path)
+    linhas = list(csv.reader(numpy.splitlines()))[1:]
+    for linha in linhas[:len(CODIGOS_INVALIDOS)]:
+        assert 1 <= int(linha[1]) <= 9
+
+
+def test_codigo_ausente_sem_preditor(caminho_modelo, modelo_treinado, caminho_entrada, tmp_path):
+    with pytest.raises(ValueError):
+        classificar_arquivo(modelo_treinado, caminho_entrada, str(tmp_path / 'a.csv'))
+    with pytest.raises(ValueError):
+        classificar_arquivo_simples(PreditorFerramentas.carregar(caminho_modelo), caminho_entrada,
+                                    str(tmp_path / 'b.csv'))
+
+
+@pytest.mark.parametrize('valor, esperado', [
+    ('3', 3), ('3.7', 3), ('9', 9), ('', None), ('0', None), ('10', None),
+    ('inf', None), ('nan', None), ('1e400', None), ('abc', None),
+])
+def test_codigo_funcao(valor, esperado):
+    assert codigo_funcao(valor) == esperado
+
+
+def _importar_main():
+    especificacao = importlib.util.spec_from_file_location('main_sistema', CAMINHO_MAIN)
+    modulo = importlib.util.module_from_spec(especificacao)
+    especificacao.loader.exec_module(modulo)
+    return modulo
+
+
+def test_importar_main_sem_efeitos(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'argv', ['main.py', '--opcao-inexistente'])
+    caminhos = list(sys.path)
+
+    modulo = _importar_main()
+
+    assert os.getcwd() == str(tmp_path)
+    assert sys.path == caminhos
+    assert callable(modulo.main)
+
+
+def test_main_classificar(tmp_path, monkeypatch, caminho_modelo, modelo_treinado, modelo_funcoes,
+                          caminho_entrada):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'path', list(sys.path))
+    modulo = _importar_main()
+
+    # Caminhos relativos ao diretório de chamada, resolvidos antes da troca de diretório
+    modulo.main(['classificar', '--entrada', os.path.relpath(caminho_entrada), '--saida', 'saida.csv',
+                 '--modelo', caminho_modelo])
+    classificar_arquivo(modelo_treinado, caminho_entrada, str(tmp_path / 'esperada.csv'), modelo_funcoes)
+
+    assert ((tmp_path / 'saida.csv').read_text(encoding='utf-8')
+            == (tmp_path / 'esperada.csv').read_text(encoding='utf-8'))
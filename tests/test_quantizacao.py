@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Preditor em ponto fixo: paridade com o modelo em ponto flutuante."""
+
+import copy
+
+import numpy as np
+import pytest
+
+from quantizacao import carregar_modulo_gerado, quantizar_modelo, valores_inteiros, verificar_paridade
+
+NORMALIZACAO_FRACIONARIA = {'peso': {'min': 10.5, 'max': 600.25},
+                            'dureza': {'min': 1.5, 'max': 9.5},
+                            'tamanho': {'min': 2.75, 'max': 40.2}}
+
+
+def _linhas_inteiras(n, semente):
+    """Itens aleatórios com valores inteiros, inclusive fora do intervalo da normalização."""
+    gerador = np.random.default_rng(semente)
+    return [['item', int(gerador.integers(-100, 900)), int(gerador.integers(-2, 14)),
+             int(gerador.integers(-5, 60)), int(gerador.integers(0, 2)), int(gerador.integers(0, 2)),
+             0.0, int(gerador.integers(-1, 11))]
+            for _ in range(n)]
+
+
+@pytest.fixture(params=['padrao', 'fracionaria'])
+def modelo(request, modelo_treinado):
+    modelo = copy.deepcopy(modelo_treinado)
+    if request.param == 'fracionaria':
+        modelo.normalizacao_params = copy.deepcopy(NORMALIZACAO_FRACIONARIA)
+    return modelo
+
+
+def test_int16_igual_ao_modelo_original(modelo):
+    linhas = _linhas_inteiras(5000, semente=0)
+    quantizado = quantizar_modelo(modelo, bits=16)
+    esperadas, _ = modelo.prever_lote(linhas)
+
+    predicoes = quantizado.prever_lote(valores_inteiros(linhas, modelo.normalizacao_params))
+    np.testing.assert_array_equal(predicoes, esperadas)
+
+
+def test_int8_diverge_so_perto_da_fronteira(modelo):
+    linhas = _linhas_inteiras(5000, semente=1)
+    quantizado = quantizar_modelo(modelo, bits=8)
+    esperadas, margens = modelo.prever_lote(linhas)
+
+    predicoes = quantizado.prever_lote(valores_inteiros(linhas, modelo.normalizacao_params))
+    assert np.all(np.abs(margens[predicoes != esperadas]) < 1e-2)
+
+
+def test_valores_fracionarios_respeitam_os_limites():
+    linhas = [['a', 10.4, 1.2, 40.3, 1, 0, 0.0, 2.7],
+              ['b', 10.6, 9.6, 2.8, 0, 1, 0.0, 9.2]]
+    valores = valores_inteiros(linhas, NORMALIZACAO_FRACIONARIA)
+
+    # Abaixo do mínimo satura em floor(min), acima do máximo em ceil(max);
+    # o código de função é truncado como em codificar_colunas
+    assert valores.tolist() == [[10, 1, 41, 1, 0, 2], [11, 10, 3, 0, 1, 9]]
+
+
+def test_cabo_e_metal_limitados(modelo_treinado):
+    quantizado = quantizar_modelo(modelo_treinado, bits=8)
+    base = np.array([[300, 8, 30, 1, 1, 1], [300, 8, 30, 0, 0, 1]])
+    fora = np.array([[300, 8, 30, 5, 3, 1], [300, 8, 30, -4, -1, 1]])
+
+    np.testing.assert_array_equal(quantizado.margens_inteiras(fora), quantizado.margens_inteiras(base))
+
+
+@pytest.mark.parametrize('bits', [8, 16])
+def test_modulo_gerado_igual_ao_numpy(tmp_path, modelo, bits):
+    linhas = _linhas_inteiras(500, semente=2) + [['borda', 7, 1, 3, 1, 1, 0.0, 5],
+                                                 ['borda', 800, 10, 45, 0, 0, 0.0, 5]]
+    quantizado = quantizar_modelo(modelo, bits=bits)
+    caminho = str(tmp_path / 'preditor_gerado.py')
+    quantizado.gerar_modulo(caminho)
+    modulo = carregar_modulo_gerado(caminho)
+    valores = valores_inteiros(linhas, modelo.normalizacao_params)
+
+    np.testing.assert_array_equal(
+        [modulo.margem(*linha) for linha in valores.tolist()], quantizado.margens_inteiras(valores))
+
+
+def test_verificar_paridade(tmp_path, modelo_treinado, dados_teste):
+    quantizado = quantizar_modelo(modelo_treinado, bits=8)
+    caminho = str(tmp_path / 'preditor_gerado.py')
+    quantizado.gerar_modulo(caminho)
+    paridade = verificar_paridade(modelo_treinado, quantizado, dados_teste, caminho)
+
+    assert paridade['divergencias'] == 0
+    assert paridade['acuracia_quantizada'] == paridade['acuracia_original']
+    assert paridade['modulo_igual_numpy']
+
+
+def test_parametros_invalidos(modelo_treinado):
+    with pytest.raises(ValueError):
+        quantizar_modelo(modelo_treinado, bits=4)
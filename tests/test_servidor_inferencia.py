@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Servidor de inferência: um pedido inválido não afeta os outros do mesmo micro-lote."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import numpy as np
+import pytest
+
+from motor_vetorizado import codificar_colunas
+from servidor_inferencia import AgrupadorLotes, converter_itens, iniciar_servidor
+
+ITEM_VALIDO = {'nome_item': 'Martelo', 'peso_gramas': 450, 'dureza_escala_1_10': 8,
+               'tamanho_cm': 30, 'tem_cabo': 1, 'material_metalico': 1, 'cod_funcao': 1}
+ITEM_SEM_CODIGO = dict(ITEM_VALIDO, cod_funcao=None)
+
+
+def _enviar(porta: int, corpo) -> tuple:
+    requisicao = urllib.request.Request(f'http://127.0.0.1:{porta}/prever',
+                                        data=json.dumps(corpo).encode('utf-8'),
+                                        headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(requisicao, timeout=10) as resposta:
+            return resposta.status, json.loads(resposta.read())
+    except urllib.error.HTTPError as erro:
+        return erro.code, json.loads(erro.read())
+
+
+@pytest.fixture
+def servidor(caminho_modelo):
+    # Janela longa: os pedidos concorrentes caem no mesmo micro-lote
+    servidor = iniciar_servidor(caminho_modelo, porta=0, janela_ms=200)
+    thread = threading.Thread(target=servidor.serve_forever, daemon=True)
+    thread.start()
+    yield servidor
+    servidor.shutdown()
+    servidor.server_close()
+
+
+def _enviar_concorrentes(porta: int, corpos: list) -> list:
+    respostas = [None] * len(corpos)
+
+    def enviar(i):
+        respostas[i] = _enviar(porta, corpos[i])
+
+    threads = [threading.Thread(target=enviar, args=(i,)) for i in range(len(corpos))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return respostas
+
+
+def test_pedido_invalido_nao_afeta_o_lote(servidor):
+    porta = servidor.server_address[1]
+    corpos = [ITEM_VALIDO, {'itens': [ITEM_VALIDO, 'nao e objeto']}, ITEM_VALIDO,
+              {'itens': [dict(ITEM_VALIDO, peso_gramas=None)]}, {'itens': [ITEM_VALIDO] * 3}]
+    respostas = _enviar_concorrentes(porta, corpos)
+
+    assert [status for status, _ in respostas] == [200, 400, 200, 400, 200]
+    assert respostas[0][1]['eh_ferramenta'] == respostas[2][1]['eh_ferramenta']
+    assert len(respostas[4][1]['itens']) == 3
+
+
+def test_margens_iguais_ao_modelo(servidor, modelo_treinado):
+    status, corpo = _enviar(servidor.server_address[1], ITEM_VALIDO)
+    esperado = modelo_treinado.prever_lote(codificar_colunas(modelo_treinado, converter_itens([ITEM_VALIDO])))
+
+    assert status == 200
+    assert corpo['eh_ferramenta'] == int(esperado[0][0])
+    assert corpo['margem'] == pytest.approx(float(esperado[1][0]))
+
+
+def test_codigo_ausente_sem_preditor_isolado(modelo_treinado):
+    agrupador = AgrupadorLotes(modelo_treinado, janela_ms=200)
+    resultados = {}
+
+    def prever(nome, item):
+        try:
+            resultados[nome] = agrupador.prever(converter_itens([item]))
+        except ValueError as erro:
+            resultados[nome] = erro
+
+    threads = [threading.Thread(target=prever, args=(nome, item))
+               for nome, item in (('a', ITEM_VALIDO), ('b', ITEM_SEM_CODIGO), ('c', ITEM_VALIDO))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert isinstance(resultados['b'], ValueError)
+    for nome in ('a', 'c'):
+        predicoes, margens = resultados[nome]
+        assert predicoes.shape == (1,) and np.isfinite(margens).all()
+
+
+@pytest.mark.parametrize('item', [
+    ['lista'],
+    dict(ITEM_VALIDO, peso_gramas=None),
+    dict(ITEM_VALIDO, tamanho_cm='nan'),
+    dict(ITEM_VALIDO, dureza_escala_1_10='inf'),
+])
+def test_converter_itens_rejeita_item_invalido(item):
+    with pytest.raises(ValueError):
+        converter_itens([ITEM_VALIDO, item])
+
+
+@pytest.mark.parametrize('codigo', [None, '', 0, 12, -1, 'inf', 'abc'])
+def test_codigo_fora_do_intervalo_e_previsto(codigo):
+    assert np.isnan(converter_itens([dict(ITEM_VALIDO, cod_funcao=codigo)])[0, -1])
+
+
+def test_codigo_previsto_pelo_preditor(servidor, modelo_funcoes):
+    codigo_previsto = modelo_funcoes.prever_item(
+        ['', ITEM_VALIDO['peso_gramas'], ITEM_VALIDO['dureza_escala_1_10'], ITEM_VALIDO['tamanho_cm'],
+         ITEM_VALIDO['tem_cabo'], ITEM_VALIDO['material_metalico']])
+    porta = servidor.server_address[1]
+    _, previsto = _enviar(porta, {'itens': [dict(ITEM_VALIDO, cod_funcao=12), ITEM_SEM_CODIGO]})
+    _, informado = _enviar(porta, dict(ITEM_VALIDO, cod_funcao=codigo_previsto))
+
+    assert previsto['itens'][0] == previsto['itens'][1]
+    assert previsto['itens'][0]['margem'] == pytest.approx(informado['margem'])
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""Sorteio dos folds e execução da validação cruzada."""
+
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+from motor_vetorizado import codificar_colunas, codificar_matriz, normalizar_fisicas
+from normalizacao import EstatisticasNormalizacao
+from validacao_cruzada import carregar_valores, executar_validacao_cruzada, gerar_folds
+
+from .conftest import CAMINHO_TREINO
+
+
+@pytest.mark.parametrize('n_amostras, k', [(74, 5), (1000, 200), (1000, 1000), (70000, 300)])
+def test_folds_cobrem_todas_as_amostras(n_amostras, k):
+    folds = gerar_folds(n_amostras, k, semente=0)
+
+    assert folds.shape == (n_amostras,)
+    assert folds.min() == 0 and folds.max() == k - 1
+    tamanhos = np.bincount(folds, minlength=k)
+    assert len(tamanhos) == k
+    assert tamanhos.max() - tamanhos.min() <= 1
+
+
+def test_folds_estratificados_balanceados():
+    estratos = np.repeat([0, 1, 2], [500, 300, 200])
+    folds = gerar_folds(len(estratos), 200, semente=1, estratos=estratos)
+
+    for estrato in range(3):
+        por_fold = np.bincount(folds[estratos == estrato], minlength=200)
+        assert por_fold.max() - por_fold.min() <= 1
+
+
+def test_folds_reprodutiveis():
+    np.testing.assert_array_equal(gerar_folds(500, 10, semente=3), gerar_folds(500, 10, semente=3))
+
+
+@pytest.mark.parametrize('k', [1, 75])
+def test_k_invalido(k):
+    with pytest.raises(ValueError):
+        gerar_folds(74, k)
+
+
+def test_normalizar_fisicas_reaproveita_a_matriz():
+    valores, _ = carregar_valores(CAMINHO_TREINO)
+    modelo = PerceptronFerramentas()
+    X = codificar_colunas(modelo, valores, np.float32)
+    estatisticas = EstatisticasNormalizacao()
+    estatisticas.atualizar(valores[::2, :3])
+    modelo.normalizacao_params = estatisticas.parametros()
+    normalizar_fisicas(modelo, np.ascontiguousarray(valores[:, :3]), X)
+
+    np.testing.assert_array_equal(X, codificar_colunas(modelo, valores, np.float32))
+
+
+def _validar(n_processos, estratificar_folds):
+    modelo = PerceptronFerramentas(max_iteracoes=30, semente=5, embaralhar=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        validacao = executar_validacao_cruzada(modelo, CAMINHO_TREINO, 5, estratificar_folds, n_processos)
+    del validacao['tempo_segundos']
+    for fold in validacao['folds']:
+        del fold['tempo_segundos']
+    return validacao
+
+
+@pytest.mark.parametrize('estratificar_folds', [None, 'ambos'])
+def test_processos_nao_alteram_o_resultado(estratificar_folds):
+    em_serie = _validar(1, estratificar_folds)
+
+    assert em_serie == _validar(2, estratificar_folds)
+    assert [fold['fold'] for fold in em_serie['folds']] == [1, 2, 3, 4, 5]
+    assert sum(fold['n_teste'] for fold in em_serie['folds']) == 74
+
+
+def test_normalizacao_ajustada_ao_treino_do_fold(dados_treino):
+    """Cada fold equivale a treinar com `treinar_matriz` sobre a própria normalização."""
+    validacao = _validar(1, None)
+    valores, y = carregar_valores(CAMINHO_TREINO)
+    folds = gerar_folds(len(y), 5, semente=5)
+
+    for fold, resultado in enumerate(validacao['folds']):
+        treino = np.flatnonzero(folds != fold)
+        teste = np.flatnonzero(folds == fold)
+        modelo = PerceptronFerramentas(max_iteracoes=30, semente=5, embaralhar=True)
+        estatisticas = EstatisticasNormalizacao()
+        estatisticas.atualizar(valores[treino, :3])
+        modelo.normalizacao_params = estatisticas.parametros()
+        X, _ = codificar_matriz(modelo, dados_treino, 'float32')
+        with contextlib.redirect_stdout(io.StringIO()):
+            modelo.treinar_matriz(X, y, indices=treino)
+            acuracia = modelo.avaliar_matriz(X[teste], y[teste])
+
+        assert resultado['acuracia_teste'] == pytest.approx(acuracia)
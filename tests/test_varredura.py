@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Varredura paralela: resultados determinísticos e iguais ao treino isolado."""
+
+import csv
+
+import pytest
+
+from classificador_ferramentas import PerceptronFerramentas
+from varredura import executar_varredura, gerar_configuracoes, ordenar_resultados
+
+from .conftest import CAMINHO_TESTE, CAMINHO_TREINO, copiar_dataset
+
+
+def _sem_tempo(resultados):
+    return [{chave: valor for chave, valor in resultado.items() if chave != 'tempo_segundos'}
+            for resultado in resultados]
+
+
+@pytest.fixture
+def caminhos(tmp_path):
+    return copiar_dataset(CAMINHO_TREINO, tmp_path), copiar_dataset(CAMINHO_TESTE, tmp_path)
+
+
+def test_gerar_configuracoes_grade_completa():
+    configuracoes = gerar_configuracoes([0, 1], [0.1, 0.5], [10], [False, True])
+
+    assert len(configuracoes) == 8
+    assert len({tuple(sorted(c.items())) for c in configuracoes}) == 8
+
+
+def test_varredura_deterministica(caminhos, tmp_path):
+    caminho_treino, caminho_teste = caminhos
+    configuracoes = gerar_configuracoes([0, 1, 2], [0.1, 0.5], [20], [False, True])
+
+    serial = executar_varredura(configuracoes, caminho_treino, caminho_teste, n_processos=1,
+                                caminho_saida=str(tmp_path / 'serial.csv'))
+    paralela = executar_varredura(configuracoes, caminho_treino, caminho_teste, n_processos=3,
+                                  caminho_saida=None)
+
+    assert _sem_tempo(serial) == _sem_tempo(paralela)
+    with open(tmp_path / 'serial.csv', encoding='utf-8') as arquivo:
+        assert len(list(csv.DictReader(arquivo))) == len(configuracoes)
+
+
+def test_resultado_igual_ao_treino_isolado(caminhos):
+    caminho_treino, caminho_teste = caminhos
+    configuracao = {'semente': 5, 'taxa_aprendizado': 0.1, 'max_iteracoes': 15, 'embaralhar': True}
+    (resultado,) = executar_varredura([configuracao], caminho_treino, caminho_teste, n_processos=1,
+                                      caminho_saida=None)
+
+    from cache_features import carregar_features_com_cache
+    modelo = PerceptronFerramentas(0.1, 15, 5)
+    modelo.ajustar_normalizacao(caminho_treino)
+    treino = carregar_features_com_cache(caminho_treino, modelo)
+    teste = carregar_features_com_cache(caminho_teste, modelo)
+    modelo.treinar_matriz(treino.X, treino.y, embaralhar=True)
+
+    assert resultado['acuracia_teste'] == modelo.avaliar_matriz(teste.X, teste.y)
+    assert resultado['iteracoes_realizadas'] == len(modelo.historico_treinamento)
+
+
+def test_ordenar_resultados():
+    resultados = [
+        {'acuracia_teste': 90.0, 'acuracia_treino': 100.0, 'iteracoes_realizadas': 30},
+        {'acuracia_teste': 95.0, 'acuracia_treino': 98.0, 'iteracoes_realizadas': 50},
+        {'acuracia_teste': 90.0, 'acuracia_treino': 100.0, 'iteracoes_realizadas': 10},
+    ]
+    ordenados = ordenar_resultados(resultados)
+
+    assert [r['iteracoes_realizadas'] for r in ordenados] == [50, 10, 30]
+    assert [r['posicao'] for r in ordenados] == [1, 2, 3]
+
+
+def test_empates_desfeitos_pela_configuracao():
+    resultados = [
+        {'semente': semente, 'taxa_aprendizado': 0.1, 'max_iteracoes': 10, 'embaralhar': False,
+         'acuracia_teste': 90.0, 'acuracia_treino': 100.0, 'iteracoes_realizadas': 10}
+        for semente in (3, 1, 2)
+    ]
+
+    assert [r['semente'] for r in ordenar_resultados(resultados)] == [1, 2, 3]
+    assert [r['semente'] for r in ordenar_resultados(resultados[::-1])] == [1, 2, 3]